@@ -1,9 +1,23 @@
+import { existsSync, readFileSync } from 'node:fs'
+import path from 'node:path'
 import type { NextConfig } from 'next'
 
+// Widths of the pre-rendered variants in public/images/derived, from
+// scripts/generate-srcset-manifest.py, so next/image requests exactly the
+// widths that were rendered. Without the (generated, untracked) manifest
+// Next's default widths apply.
+function renderedImageSizes(): NextConfig['images'] {
+  const manifest = path.join(__dirname, 'src', 'data', 'image-srcset.json')
+  if (!existsSync(manifest)) return {}
+  const { deviceSizes, imageSizes } = JSON.parse(readFileSync(manifest, 'utf8'))
+  return deviceSizes?.length && imageSizes?.length ? { deviceSizes, imageSizes } : {}
+}
+
 const nextConfig: NextConfig = {
   turbopack: {
     root: __dirname,
   },
+  images: renderedImageSizes(),
   // Include curated series JSON files in Vercel serverless function bundles.
   // These are read at runtime via fs.readFileSync (dynamic paths) so the
   // output file tracer cannot discover them automatically.
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Benchmark workbook generation and the painting merge on synthetic catalogs.
+
+For each size (200, 5k, 50k and 500k illustration rows by default) a
+synthetic catalog is written to a temp folder (see image_library.benchmark)
+and two worker processes are run against it with IMAGE_LIBRARY_CATALOG
+pointing there:
+
+* generate  build the workbook, auto_width over every sheet (regular mode
+            only), save. --mode picks the writer: regular openpyxl, openpyxl
+            write-only (streaming) or the direct xlsx writer (direct).
+* merge     add-paintings-to-excel on that workbook (full pass), then again
+            with --incremental (the no-change path)
+
+Each worker runs twice: once for wall time and once under tracemalloc for
+per-stage allocation peaks (tracing slows Python code down several times
+over, so it never overlaps the timing pass). Peak RSS is taken from the
+timing pass.
+
+Results go to .cache/image-library/benchmarks/<time>-<commit>.json together
+with the Python / openpyxl versions and the commit. --compare prints each
+stage against an earlier result file.
+
+The regular builder holds every cell in memory, so the 500k size needs
+several GB of RAM; pick sizes with --sizes on smaller machines. The direct
+writer holds each sheet's XML as one string.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from image_library import REPO_ROOT, benchmark, load_script
+from image_library.cache import load_json, save_json
+
+
+def run_worker(stage, workbook, mode, trace):
+    """Inside a worker process: run one stage group, return {stage: stats}."""
+    results = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        if stage == "generate" and mode == "direct":
+            generator = load_script("generate-image-library-excel.py")
+            titles = [sheet.title for sheet in generator.SHEETS]
+            parts, results["build"] = benchmark.measure(generator.render_parts, trace)
+            _, results["save"] = benchmark.measure(lambda: generator.xlsx.save(workbook, titles, parts), trace)
+        elif stage == "generate":
+            generator = load_script("generate-image-library-excel.py")
+            streaming = mode == "streaming"
+            wb, results["build"] = benchmark.measure(lambda: generator.build_workbook(streaming), trace)
+            if not streaming:
+                # Write-only worksheets cannot be read back, so there is nothing to size
+                _, results["auto_width"] = benchmark.measure(
+                    lambda: [generator.auto_width(ws) for ws in wb.worksheets], trace)
+            _, results["save"] = benchmark.measure(lambda: wb.save(workbook), trace)
+        else:
+            merger = load_script("add-paintings-to-excel.py")
+            for name, extra in (("merge", []), ("merge_incremental", ["--incremental"])):
+                sys.argv = ["add-paintings-to-excel.py", "--workbook", str(workbook)] + extra
+                _, results[name] = benchmark.measure(merger.main, trace)
+    return results
+
+
+def spawn(stage, catalog_dir, workbook, mode, trace):
+    command = [sys.executable, __file__, "--worker", stage, "--workbook", str(workbook), "--mode", mode]
+    command += ["--trace"] * trace
+    env = dict(os.environ, IMAGE_LIBRARY_CATALOG=str(catalog_dir))
+    out = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def bench_size(rows, mode, trace, work_dir):
+    catalog_dir = work_dir / f"catalog-{rows}"
+    counts = benchmark.synthetic_catalog(rows, catalog_dir)
+    workbook = work_dir / f"library-{rows}.xlsx"
+    stages = {}
+    for stage in ("generate", "merge"):
+        stages.update(spawn(stage, catalog_dir, workbook, mode, trace=False))
+    stages["save"]["bytes"] = workbook.stat().st_size
+    if trace:
+        # Start the traced pass from a fresh workbook so the merge repeats the same work
+        for sidecar in work_dir.glob(f".{workbook.name}.*"):
+            sidecar.unlink()
+        for stage in ("generate", "merge"):
+            for name, stats in spawn(stage, catalog_dir, workbook, mode, trace=True).items():
+                stages[name]["tracemalloc_peak"] = stats["tracemalloc_peak"]
+    return {"rows": rows, "mode": mode, "catalog": counts, "stages": stages}
+
+
+def environment():
+    import openpyxl
+
+    def git(*args):
+        try:
+            return subprocess.run(["git", *args], cwd=REPO_ROOT, capture_output=True, text=True).stdout.strip()
+        except OSError:
+            return ""
+
+    return {"python": platform.python_version(), "openpyxl": openpyxl.__version__,
+            "platform": platform.platform(), "cpus": os.cpu_count(),
+            "commit": git("rev-parse", "--short", "HEAD"), "dirty": bool(git("status", "--porcelain", "scripts"))}
+
+
+def _mb(n):
+    return f"{n / 1024 / 1024:8.1f}" if n is not None else "       -"
+
+
+def print_results(results, baseline=None):
+    before = {(r["rows"], r["mode"], name): stats["seconds"]
+              for r in (baseline or {}).get("results", ()) for name, stats in r["stages"].items()}
+    print(f"{'rows':>8} {'mode':<9} {'stage':<18} {'seconds':>9} {'RSS MB':>8} {'traced MB':>9}"
+          + (f" {'vs base':>8}" if baseline else ""))
+    for r in results:
+        for name, stats in r["stages"].items():
+            line = (f"{r['rows']:>8} {r['mode']:<9} {name:<18} {stats['seconds']:>9.3f} {_mb(stats['rss_peak'])} "
+                    f"{_mb(stats.get('tracemalloc_peak')):>9}")
+            previous = before.get((r["rows"], r["mode"], name))
+            if previous:
+                line += f" {stats['seconds'] / previous:7.2f}x"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark workbook generation and painting merge at scale.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(benchmark.SIZES), help="Illustration rows")
+    parser.add_argument("--mode", choices=("regular", "streaming", "direct"), default="regular",
+                        help="Workbook writer to benchmark (default: regular openpyxl)")
+    parser.add_argument("--no-trace", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/<time>-<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="Earlier result file to compare against")
+    # Internal: run one stage group in this process
+    parser.add_argument("--worker", choices=("generate", "merge"), help=argparse.SUPPRESS)
+    parser.add_argument("--workbook", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--trace", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.workbook, args.mode, args.trace)))
+        return
+
+    env = environment()
+    results = []
+    with tempfile.TemporaryDirectory(prefix="image-library-bench-") as tmp:
+        for rows in args.sizes:
+            print(f"{rows} rows…", flush=True)
+            results.append(bench_size(rows, args.mode, not args.no_trace, Path(tmp)))
+
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    output = args.output or benchmark.RESULTS_DIR / f"{stamp}-{env['commit'] or 'nogit'}.json"
+    save_json(output, {"time": stamp, "environment": env, "results": results}, indent=2)
+    baseline = load_json(args.compare) if args.compare else None
+    print_results(results, baseline)
+    print(f"Results: {output}")
+
+
+if __name__ == "__main__":
+    main()
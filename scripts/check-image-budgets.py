@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Check image file sizes against the Max File Size budgets.
+
+Every file under public/images is mapped to an Image Size Specs variant
+(see image_library.budgets) and compared with its @1x / @2x byte budget.
+Overages are written to a JSON report (.cache/image-library/
+budget-report.json by default) and summarised per spec row in a
+"Budget Status" column (I) on the Image Size Specs sheet, filled green when
+every file is within budget and red when any is over.
+
+generate-image-library-excel.py and watch-image-library.py render the same
+column from the asset manifest, so a regenerated workbook keeps it. Writing
+it here only refreshes a workbook whose files changed since it was built.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from image_library import LIBRARY_PATH, budgets
+from image_library.cache import save_json
+from image_library.styles import BODY, CATEGORY, HEADER, register_styles
+
+SHEET = "Image Size Specs"
+STATUS_COL = 9  # I, after Notes
+STATUS_HEADER = "Budget Status"
+
+
+def write_status_column(wb_path, report, spec_budgets):
+    """Write one status cell per spec row; returns False when nothing changed."""
+    import openpyxl
+
+    by_variant = {(b.spec.image_type, b.spec.variant): name for name, b in spec_budgets.items()}
+    wb = openpyxl.load_workbook(wb_path)
+    ws = wb[SHEET]
+    register_styles(wb)
+
+    changed = False
+    for row in range(1, ws.max_row + 1):
+        cell = ws.cell(row=row, column=STATUS_COL)
+        if row == 1:
+            value, style = STATUS_HEADER, HEADER
+        elif ws.cell(row=row, column=2).value is None:
+            value, style = None, CATEGORY
+        else:
+            key = (ws.cell(row=row, column=1).value, ws.cell(row=row, column=2).value)
+            stats = report["specs"].get(by_variant.get(key))
+            value = budgets.spec_status(stats)
+            style = budgets.status_style(value) or BODY
+        if cell.value != value or cell.style != style:
+            cell.value = value
+            cell.style = style
+            changed = True
+
+    if changed:
+        ws.column_dimensions["I"].width = 16
+        wb.save(wb_path)
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check image files against their byte budgets.")
+    parser.add_argument("--root", type=Path, default=budgets.IMAGES_DIR, help="Image tree to measure")
+    parser.add_argument("--workbook", type=Path, default=LIBRARY_PATH, help="Workbook to annotate")
+    parser.add_argument("--report", type=Path, default=budgets.REPORT_FILE, help="Where to write the JSON report")
+    parser.add_argument("--workers", type=int, default=16, help="Directory-scanning threads")
+    parser.add_argument("--top", type=int, default=20, help="How many of the worst overages to print")
+    parser.add_argument("--no-write", action="store_true", help="Report only; leave the workbook alone")
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero when any file is over budget")
+    args = parser.parse_args()
+
+    spec_budgets = budgets.load_budgets()
+    report = budgets.check(args.root, spec_budgets, workers=args.workers)
+    save_json(args.report, report, indent=1)
+
+    for item in report["over_budget"][:args.top]:
+        print(f"  {item['path']}: {item['bytes'] / 1024:,.0f}KB > {item['limit'] / 1024:,.0f}KB "
+              f"({item['spec']} @{item['scale']}x)")
+    print(f"Scanned {report['files']} files in {report['scan_seconds']}s: {report['mapped']} mapped to a spec, "
+          f"{len(report['over_budget'])} over budget, {len(report['unmapped'])} unmapped")
+    print(f"Report: {args.report}")
+
+    if not args.no_write:
+        if write_status_column(args.workbook, report, spec_budgets):
+            print(f"Updated: {args.workbook}")
+        else:
+            print(f"Up to date: {args.workbook}")
+    if args.strict and report["over_budget"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Report the image bytes each page type and series pulls per breakpoint.
+
+Page templates are declared in image_library.payload. Each slot is priced
+from the files in public/images (via the asset manifest) and the Max File
+Size budgets. The full report goes to .cache/image-library/
+payload-report.json by default, and the generated workbook carries the same
+figures on its Page Payload sheet. ``--strict`` fails when any page or series
+is expected to exceed its budget, so payload regressions can gate CI.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from image_library import assets, payload
+from image_library.cache import save_json
+from image_library.scripture import SERIES_DIR
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model the per-page image payload against the size budgets.")
+    parser.add_argument("--series-dir", type=Path, default=SERIES_DIR, help="Series JSON files to count modules in")
+    parser.add_argument("--report", type=Path, default=payload.REPORT_FILE, help="Where to write the JSON report")
+    parser.add_argument("--top", type=int, default=10, help="How many of the heaviest series to print")
+    parser.add_argument("--strict", action="store_true", help="Exit non-zero when any page is over budget")
+    args = parser.parse_args()
+
+    manifest, _ = assets.refresh()
+    report = payload.analyse(manifest, args.series_dir)
+    save_json(args.report, report, indent=1)
+
+    for row in report["pages"]:
+        print(f"  {row['page']:<16} {row['breakpoint']:<8} {row['images']:>5} images  "
+              f"{row['expected'] / 1024:>7,.0f}KB expected / {row['budget'] / 1024:,.0f}KB budget, "
+              f"{row['worst'] / 1024:,.0f}KB worst  ({row['seconds_3g']}s on 3G)")
+    heaviest = sorted(report["series"], key=lambda row: -row["breakpoints"]["mobile"]["expected"])
+    for row in heaviest[:args.top]:
+        mobile = row["breakpoints"]["mobile"]
+        print(f"  {row['series']}: {row['pages']} pages, {mobile['expected'] / 1024 / 1024:,.1f}MB on mobile "
+              f"({mobile['seconds_3g']}s on 3G)")
+    over = payload.over_budget(report)
+    print(f"{len(report['pages'])} page rows, {len(report['series'])} series, {len(over)} over budget")
+    print(f"Report: {args.report}")
+
+    if args.strict and over:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Check the reference painting URLs and record the outcome in the workbook.
+
+Every URL in content/image-library/paintings.json is probed concurrently
+(see image_library.linkcheck). Results are cached under .cache/image-library/
+and only re-checked after --ttl-hours. The outcome is written to a
+"Link Status" column (O) next to Reference URL on the Evergreen
+Illustrations sheet.
+"""
+
+import argparse
+from functools import partial
+from pathlib import Path
+
+from image_library import LIBRARY_PATH, catalog, linkcheck
+from image_library.row_index import load_row_index, save_row_index
+from image_library.styles import BODY, CATEGORY, HEADER, register_styles
+
+SHEET = "Evergreen Illustrations"
+PAINTING_COLS = (10, 14)  # J-N, as tracked by add-paintings-to-excel.py
+STATUS_COL = 15  # O
+STATUS_HEADER = "Link Status"
+
+
+def write_status_column(wb_path, paintings, results):
+    """Write status labels into column O; returns False when nothing changed."""
+    import openpyxl
+
+    index = load_row_index(wb_path, SHEET, PAINTING_COLS)
+    labels = {p.num: linkcheck.status_label(results[p.url]) for p in paintings}
+
+    wb = openpyxl.load_workbook(wb_path)
+    ws = wb[SHEET]
+    register_styles(wb)
+
+    changed = ws.cell(row=1, column=STATUS_COL).value != STATUS_HEADER
+    if changed:
+        ws.cell(row=1, column=STATUS_COL, value=STATUS_HEADER).style = HEADER
+        ws.column_dimensions["O"].width = 16
+        for row in index.category_rows:
+            ws.cell(row=row, column=STATUS_COL).style = CATEGORY
+    for img_num, (row, _) in index.rows.items():
+        cell = ws.cell(row=row, column=STATUS_COL)
+        label = labels.get(img_num)
+        if cell.value != label:
+            cell.value = label
+            cell.style = BODY
+            changed = True
+
+    if changed:
+        wb.save(wb_path)
+        # J-N are untouched, so the index is still valid for the new file
+        save_row_index(wb_path, SHEET, PAINTING_COLS, index)
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check reference painting URLs.")
+    parser.add_argument("--workbook", type=Path, default=LIBRARY_PATH, help="Workbook to annotate")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent requests overall")
+    parser.add_argument("--per-host", type=int, default=4, help="Concurrent requests per host")
+    parser.add_argument("--interval", type=float, default=0.25, help="Seconds between request starts per host")
+    parser.add_argument("--timeout", type=float, default=15, help="Per-request timeout in seconds")
+    parser.add_argument("--ttl-hours", type=float, default=168, help="Re-check cached results older than this")
+    parser.add_argument("--recheck", action="store_true", help="Ignore the cache and probe every URL")
+    parser.add_argument("--no-write", action="store_true", help="Report only; leave the workbook alone")
+    args = parser.parse_args()
+
+    paintings = catalog.load("paintings")
+    cache = linkcheck.load_cache()
+    results = linkcheck.check_urls(
+        [p.url for p in paintings],
+        cache,
+        ttl=0 if args.recheck else args.ttl_hours * 3600,
+        workers=args.workers,
+        limiter=linkcheck.HostLimiter(args.per_host, args.interval),
+        probe=partial(linkcheck.probe_url, timeout=args.timeout),
+    )
+    linkcheck.save_cache(cache)
+
+    bad = {url for url, r in results.items() if not linkcheck.is_ok(r)}
+    redirected = sum(1 for r in results.values() if linkcheck.is_ok(r) and r["redirected"])
+    for p in paintings:
+        if p.url in bad:
+            print(f"  #{p.num} {p.title}: {linkcheck.status_label(results[p.url])} — {p.url}")
+    print(f"Checked {len(results)} URLs: {len(results) - len(bad)} ok ({redirected} redirected), "
+          f"{len(bad)} broken")
+
+    if args.no_write:
+        return
+    if write_status_column(args.workbook, paintings, results):
+        print(f"Updated: {args.workbook}")
+    else:
+        print(f"Up to date: {args.workbook}")
+
+
+if __name__ == "__main__":
+    main()
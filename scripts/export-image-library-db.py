@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Export the image library catalog to SQLite with an FTS5 search index.
+
+Every sheet of the workbook becomes a table in .cache/image-library/
+library.sqlite (see image_library.database), written in one transaction and
+skipped when neither the catalog nor the asset statuses changed. Tooling can
+then query it directly, e.g.::
+
+    python3 scripts/export-image-library-db.py --search lament --ratio 16:9
+"""
+
+import argparse
+import sqlite3
+import time
+from pathlib import Path
+
+from image_library import assets, database
+
+STATUS_SECTIONS = ("illustrations", "empty_states", "icons", "pwa_assets")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the image library to SQLite with full-text search.")
+    parser.add_argument("--output", type=Path, default=database.DATABASE_FILE, help="Database file to write")
+    parser.add_argument("--force", action="store_true", help="Rebuild even when the inputs are unchanged")
+    parser.add_argument("--search", help="Run an FTS5 query against the exported database")
+    parser.add_argument("--ratio", help="With --search: only illustrations with this aspect ratio, e.g. 16:9")
+    parser.add_argument("--sheet", help="With --search: only rows from this table, e.g. icons")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    manifest, _ = assets.refresh()
+    statuses = {section: assets.section_statuses(section, manifest) for section in STATUS_SECTIONS}
+    counts = database.export(statuses, args.output, force=args.force)
+    elapsed = time.perf_counter() - started
+    if counts is None:
+        print(f"{args.output} is up to date ({elapsed * 1000:.0f} ms)")
+    else:
+        print(f"Wrote {args.output} in {elapsed * 1000:.0f} ms: "
+              + ", ".join(f"{table} {count}" for table, count in counts.items()))
+
+    if args.search:
+        with sqlite3.connect(f"file:{args.output}?mode=ro", uri=True) as conn:
+            started = time.perf_counter()
+            try:
+                results = database.search(conn, args.search, args.sheet, args.ratio)
+            except sqlite3.OperationalError as exc:
+                parser.error(f"--search {args.search!r} is not a valid FTS5 query ({exc}); "
+                             f"quote terms with punctuation, e.g. '\"dark-night\"'")
+            elapsed = time.perf_counter() - started
+        for sheet, num, name, snippet in results:
+            print(f"  {sheet:<14} #{num:<4} {name}  — {snippet}")
+        print(f"{len(results)} result(s) in {elapsed * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Report near-duplicate images under public/images.
+
+Files are perceptually hashed (pHash + dHash) into a persistent index and
+matched with a BK-tree Hamming search (see image_library.dedup), so a re-run
+only hashes and queries new or changed images. Groups are printed largest
+reclaimable size first, with the workbook image number of each file where
+known (evergreen ``NNN`` prefix, or the Reference Paintings row for a
+devotional print), and written as JSON to
+.cache/image-library/duplicate-report.json.
+
+The raw.webp / print.webp pair of an artwork is expected to be close; pass
+--skip-siblings to leave out pairs that share a folder.
+"""
+
+import argparse
+import time
+
+from image_library import assets, dedup
+from image_library.cache import cache_path, save_json
+
+REPORT_FILE = cache_path("duplicate-report.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find near-duplicate images with perceptual hashes.")
+    parser.add_argument("--threshold", type=int, default=dedup.THRESHOLD,
+                        help="Maximum pHash Hamming distance (0-64) to count as a duplicate")
+    parser.add_argument("--skip-siblings", action="store_true", help="Ignore pairs within the same folder")
+    parser.add_argument("--top", type=int, default=20, help="Groups to print")
+    parser.add_argument("--workers", type=int, default=None, help="Decoder processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Re-hash everything")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    manifest, _ = assets.refresh()
+    index, hashed = dedup.update(manifest, assets.PUBLIC_DIR, args.threshold, workers=args.workers, force=args.force)
+    by_sha = dedup.candidates(manifest)
+    pairs = dedup.path_pairs(index, by_sha)
+    if args.skip_siblings:
+        pairs = [p for p in pairs if p.a.rsplit("/", 1)[0] != p.b.rsplit("/", 1)[0]]
+    groups = dedup.clusters(pairs)
+    numbers = dedup.image_numbers([path for group in groups for path in group], assets.PUBLIC_DIR)
+    print(f"{sum(len(paths) for paths in by_sha.values())} images, {hashed} newly hashed, "
+          f"{len(pairs)} near-duplicate pair(s) in {len(groups)} group(s) "
+          f"({time.perf_counter() - started:.2f}s)")
+
+    report = []
+    for group in groups:
+        sizes = {path: manifest[path].size for path in group}
+        files = [{"path": path, "bytes": sizes[path], "image": numbers.get(path)} for path in group]
+        report.append({"files": files, "reclaimable": sum(sizes.values()) - max(sizes.values())})
+    report.sort(key=lambda g: -g["reclaimable"])
+    distances = {(p.a, p.b): p for p in pairs}
+    save_json(REPORT_FILE, {"threshold": args.threshold, "groups": report,
+                            "pairs": [list(p) for p in distances.values()]}, indent=2)
+
+    total = sum(g["reclaimable"] for g in report)
+    print(f"Reclaimable: {total / 1024 / 1024:.1f} MB (keeping the largest file of each group)")
+    for group in report[:args.top]:
+        print(f"  {group['reclaimable'] / 1024:.0f} KB")
+        for f in group["files"]:
+            number = f"  #{f['image']}" if f["image"] is not None else ""
+            print(f"    {f['path']}  ({f['bytes'] / 1024:.0f} KB){number}")
+    print(f"Report: {REPORT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
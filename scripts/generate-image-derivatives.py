@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Render the responsive image variants defined by the Image Size Specs table.
+
+For every raster source under public/images, each Hero / Card / Inline /
+Social spec row is rendered at @1x and (where specified) @2x in each of its
+raster formats, into public/images/derived/. Work is spread over a process
+pool and cached by source hash plus spec (see image_library.derivatives),
+so a re-run only touches new or changed images.
+
+Sources are never upscaled unless --allow-upscale is given; targets larger
+than the source are recorded as skipped and reported.
+
+WebP (and, with --avif, AVIF) targets that have a Max File Size budget are
+encoded at the highest quality fitting it, down to a perceptual floor (see
+image_library.quality). Targets that cannot meet their budget above the floor
+are counted as over budget. --fixed-quality encodes them all at the fixed
+settings instead.
+"""
+
+import argparse
+from pathlib import Path
+
+from image_library import derivatives, specs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render responsive image derivatives.")
+    parser.add_argument("--source-dir", type=Path, default=derivatives.SOURCE_DIR, help="Images to derive from")
+    parser.add_argument("--output-dir", type=Path, default=derivatives.OUTPUT_DIR, help="Where variants are written")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--only", help="Only sources whose path contains this text")
+    parser.add_argument("--allow-upscale", action="store_true", help="Render targets larger than the source")
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and re-render everything")
+    parser.add_argument("--avif", action="store_true", help="Also render an AVIF version of every WebP target")
+    parser.add_argument("--fixed-quality", action="store_true",
+                        help="Skip the per-image quality search; use the fixed encoder settings")
+    args = parser.parse_args()
+
+    targets = specs.render_targets()
+    if args.avif:
+        targets = derivatives.with_avif(targets)
+    sources = derivatives.find_sources(args.source_dir, args.output_dir)
+    if args.only:
+        sources = [s for s in sources if args.only in s.relative_to(args.source_dir).as_posix()]
+    print(f"{len(sources)} sources x {len(targets)} targets")
+
+    summary = derivatives.build(targets, sources, args.source_dir, args.output_dir, workers=args.workers,
+                                allow_upscale=args.allow_upscale, force=args.force, search=not args.fixed_quality)
+    if not args.only:
+        cache = derivatives.load_json(derivatives.CACHE_FILE, {})
+        live = {s.relative_to(args.source_dir).as_posix() for s in sources}
+        removed = derivatives.prune(cache, live, args.output_dir)
+        if removed:
+            derivatives.save_json(derivatives.CACHE_FILE, cache)
+            print(f"Removed {removed} derivative(s) of deleted sources")
+
+    print(f"Rendered {summary['rendered']} file(s) from {summary['processed']} source(s); "
+          f"{summary['unchanged']} unchanged; {summary['too_small']} target(s) skipped (source too small)")
+    if summary["over_budget"]:
+        print(f"{summary['over_budget']} file(s) over their Max File Size budget at the lowest acceptable quality")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Generate BlurHash + LQIP placeholders for every image under public/images.
+
+Writes src/data/image-placeholders.json, keyed by public URL path::
+
+    {"/images/devotional-prints/<slug>/raw.webp":
+        {"width": 1280, "height": 853, "blurhash": "L…", "lqip": "data:image/webp;base64,…"}}
+
+so pages can inline the placeholder with no extra request. Files are
+processed in a process pool and cached by content hash (see
+image_library.placeholders); re-runs only decode new or changed images.
+Images whose LQIP could not be brought under the spec's byte budget are
+listed after the index is written.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from image_library import derivatives, placeholders
+from image_library.cache import load_json
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate BlurHash / LQIP image placeholders.")
+    parser.add_argument("--source-dir", type=Path, default=derivatives.SOURCE_DIR, help="Images to index")
+    parser.add_argument("--output", type=Path, default=placeholders.INDEX_FILE, help="Where to write the index")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and re-encode everything")
+    args = parser.parse_args()
+
+    sources = derivatives.find_sources(args.source_dir)
+    index, encoded = placeholders.build(sources, args.source_dir, workers=args.workers, force=args.force)
+    if load_json(args.output) == index:
+        print(f"Up to date: {args.output} ({len(index)} images)")
+    else:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(index, f, separators=(",", ":"))
+            f.write("\n")
+        print(f"Encoded {encoded} of {len(index)} images; saved to: {args.output}")
+
+    _, limit = placeholders.placeholder_spec()
+    over = placeholders.over_budget(index, limit)
+    if over:
+        print(f"Warning: {len(over)} LQIP(s) over the {limit}-byte budget even at the smallest size:")
+        for path, length in sorted(over.items()):
+            print(f"  {path}  ({length} bytes)")
+
+
+if __name__ == "__main__":
+    main()
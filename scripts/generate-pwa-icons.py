@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Render every favicon, app icon and splash screen on the App Icons & PWA sheet.
+
+All PNG rows and the multi-size favicon.ico are drawn from one master image
+into public/icons/ (see image_library.pwa), then public/manifest.json's
+``icons`` list is pointed at the icon-NNN / icon-NNN-maskable files.
+
+The master is a source file kept apart from the outputs (a logo export;
+a rendered icon would be re-encoded from itself on every run). It should be
+at least as large as the biggest logo placement (512px: the 512 icons and
+the iPad Pro splash); smaller masters are upscaled with a warning.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from image_library import pwa
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render favicons, PWA icons and splash screens from one master.")
+    parser.add_argument("--master", type=Path, required=True, help="Square master image (PNG/WebP), not an output")
+    parser.add_argument("--output-dir", type=Path, default=pwa.ICONS_DIR, help="Where icons are written")
+    parser.add_argument("--manifest", type=Path, default=pwa.MANIFEST_PATH, help="Web app manifest to update")
+    parser.add_argument("--no-manifest", action="store_true", help="Leave the web app manifest alone")
+    parser.add_argument("--workers", type=int, default=None, help="Encoder threads (default: CPU count + 4)")
+    args = parser.parse_args()
+
+    targets = pwa.icon_targets()
+    outputs = {(args.output_dir / icon.name).resolve() for icon in targets}
+    if args.master.resolve() in outputs:
+        parser.error(f"--master {args.master} is one of the rendered icons; use a separate source file")
+    started = time.perf_counter()
+    results = pwa.build(args.master, targets, args.output_dir, workers=args.workers)
+    elapsed = time.perf_counter() - started
+
+    written = [icon.name for icon, _, changed in results if changed]
+    total = sum(len(data) for _, data, _ in results)
+    print(f"Rendered {len(results)} file(s) in {elapsed:.2f}s ({total / 1024:.0f} KB); "
+          f"{len(written)} changed -> {args.output_dir}")
+    for name in written:
+        print(f"  {name}")
+
+    from PIL import Image
+
+    with Image.open(args.master) as im:
+        master_side = min(im.size)
+    too_big = [icon.name for icon in targets if pwa.logo_box(icon) > master_side]
+    if too_big:
+        print(f"Warning: master is {master_side}px; upscaled for {', '.join(too_big)}")
+
+    if not args.no_manifest and pwa.update_manifest(targets, args.manifest):
+        print(f"Updated icons in {args.manifest}")
+
+
+if __name__ == "__main__":
+    main()
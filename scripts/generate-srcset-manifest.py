@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Write the responsive srcset manifest for the pre-rendered image variants.
+
+Run after generate-image-derivatives.py (AVIF variants are listed when it
+was run with --avif). Writes src/data/image-srcset.json, keyed by source URL
+path, with each spec variant's width, height, sizes, srcset per MIME type
+and files (path, width, height, bytes, format, content hash). See
+image_library.srcset for the full shape. next.config.ts takes its
+deviceSizes / imageSizes for next/image. Output files are hashed once and
+cached by size/mtime, so a re-run after a partial re-render only reads the
+new files.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from image_library import derivatives, specs, srcset
+from image_library.cache import load_json
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the srcset manifest for pre-rendered image variants.")
+    parser.add_argument("--source-dir", type=Path, default=derivatives.SOURCE_DIR, help="Images the variants come from")
+    parser.add_argument("--output-dir", type=Path, default=derivatives.OUTPUT_DIR, help="Where the variants are")
+    parser.add_argument("--output", type=Path, default=srcset.MANIFEST_FILE, help="Where to write the manifest")
+    parser.add_argument("--workers", type=int, default=16, help="File-hashing threads")
+    args = parser.parse_args()
+
+    sources = derivatives.find_sources(args.source_dir, args.output_dir)
+    targets = derivatives.with_avif(specs.render_targets())
+    manifest, summary = srcset.build(targets, sources, args.source_dir, args.output_dir, workers=args.workers)
+    if summary["stale"] or summary["not_rendered"]:
+        print(f"{summary['not_rendered']} source(s) not rendered or changed since, {summary['stale']} variant(s) "
+              f"rendered from an older spec; re-run generate-image-derivatives.py to include them")
+    if load_json(args.output) == manifest:
+        print(f"Up to date: {args.output} ({summary['images']} images, {summary['files']} files)")
+        return
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+        f.write("\n")
+    print(f"Hashed {summary['hashed']} of {summary['files']} files for {summary['images']} images; "
+          f"saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Shared helpers for the Euangelion image library scripts.
+
+The top-level ``scripts/*-excel.py`` commands import from here; run them from
+any directory and ``scripts/`` is already on ``sys.path``.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+LIBRARY_PATH = REPO_ROOT / "content" / "EUANGELION-IMAGE-LIBRARY.xlsx"
+
+# Derived, regenerable state (link checks, mirrors, hashes); never committed
+CACHE_DIR = REPO_ROOT / ".cache" / "image-library"
+
+
+def load_script(name):
+    """Import a hyphenated script in scripts/ (e.g. "add-paintings-to-excel.py") as a module."""
+    module_name = name.replace("-", "_").removesuffix(".py")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / name)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so process pools can pickle the script's functions by name
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
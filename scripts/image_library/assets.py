@@ -0,0 +1,204 @@
+"""Persistent manifest of the files under public/images and public/icons.
+
+The manifest (``.cache/image-library/asset-manifest.json``) holds one entry
+per file: size, mtime, sha256, pixel dimensions, format and alpha, read from
+the file header (image_library.probe). ``refresh``
+lists the trees from a thread pool and only re-hashes and re-probes files
+whose size or mtime changed, so an unchanged tree refreshes in a few tens
+of milliseconds.
+
+The manifest also answers "does this catalog row have its file yet?" for
+the workbook's Status columns. Numbered rows are looked up by number in a
+folder per sheet (``images/empty-states/003-cloud-offline.svg``, any
+suffix after ``NNN``); App Icons & PWA rows by exact file name under
+``icons/``.
+
+The per-sheet folders (ASSET_DIRS) are a convention introduced with these
+Status columns, not where any current file lives: finished Evergreen
+Illustrations go in ``images/illustrations/evergreen/NNN-*``, empty states
+in ``images/empty-states/`` and UI icons in ``icons/ui/``. None of them
+exist yet, so every numbered row reads "Missing" until its file is added
+there. The homepage engravings in ``images/illustrations/`` are not catalog
+rows and are not matched. A file whose aspect ratio differs from the row's spec ratio is
+flagged "Wrong ratio"; one that is too small (or, for PWA assets, not
+exactly the listed size) "Wrong size".
+"""
+
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from image_library import REPO_ROOT, catalog
+from image_library.cache import cache_path, file_sha256, load_json, save_json
+from image_library.probe import probe
+from image_library.specs import parse_ratio, parse_size
+from image_library.styles import STATUS_BAD, STATUS_OK, STATUS_WARN
+
+PUBLIC_DIR = REPO_ROOT / "public"
+ASSET_ROOTS = ("images", "icons")
+MANIFEST_FILE = cache_path("asset-manifest.json")
+IMAGE_SUFFIXES = {".webp", ".jpg", ".jpeg", ".png", ".gif", ".avif", ".svg", ".ico"}
+
+# path is relative to public/, e.g. "icons/icon-192.png"
+Asset = namedtuple("Asset", "path size mtime_ns sha256 width height format alpha")
+
+# Status column values and what each catalog section expects on disk
+DONE, MISSING, WRONG_SIZE, WRONG_RATIO = "Done", "Missing", "Wrong size", "Wrong ratio"
+STATUS_STYLES = {DONE: STATUS_OK, MISSING: STATUS_WARN, WRONG_SIZE: STATUS_BAD, WRONG_RATIO: STATUS_BAD}
+RATIO_TOLERANCE = 0.01
+ASSET_DIRS = {
+    "illustrations": "images/illustrations/evergreen",
+    "empty_states": "images/empty-states",
+    "icons": "icons/ui",
+}
+PWA_DIR = "icons"
+
+
+def _scan_dir(path, suffixes):
+    files, dirs = [], []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in suffixes:
+                stat = entry.stat()
+                files.append((entry.path, stat.st_size, stat.st_mtime_ns))
+    return files, dirs
+
+
+def scan_tree(root, suffixes=IMAGE_SUFFIXES, workers=16):
+    """{relative posix path: (size, mtime_ns)} for every matching file under ``root``.
+
+    Directories are scanned level by level, each level fanned out over the
+    pool, so a tree of many small folders is listed concurrently.
+    """
+    found, level = {}, [str(root)] if root.is_dir() else []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while level:
+            next_level = []
+            for files, dirs in pool.map(lambda path: _scan_dir(path, suffixes), level):
+                for path, size, mtime_ns in files:
+                    found[os.path.relpath(path, root).replace(os.sep, "/")] = (size, mtime_ns)
+                next_level.extend(dirs)
+            level = next_level
+    return found
+
+
+def _describe(job):
+    path, rel, stat = job
+    info = probe(path)
+    if info is None:
+        return Asset(rel, stat[0], stat[1], file_sha256(path), None, None, path.suffix.lower().lstrip("."), None)
+    return Asset(rel, stat[0], stat[1], file_sha256(path), *info)
+
+
+def refresh(public=PUBLIC_DIR, roots=ASSET_ROOTS, manifest_file=MANIFEST_FILE, workers=16):
+    """Bring the manifest up to date; returns ({path: Asset}, re-hashed count)."""
+    cached = load_json(manifest_file, {})
+    stats = {}
+    for root in roots:
+        for rel, stat in scan_tree(public / root, workers=workers).items():
+            stats[f"{root}/{rel}"] = stat
+    manifest, jobs = {}, []
+    for rel, stat in stats.items():
+        entry = cached.get(rel)
+        if entry and len(entry) == len(Asset._fields) - 1 and (entry[0], entry[1]) == stat:
+            manifest[rel] = Asset(rel, *entry)
+        else:
+            jobs.append((public / rel, rel, stat))
+    if jobs:
+        # Hashing releases the GIL, so threads keep every core busy
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for asset in pool.map(_describe, jobs):
+                manifest[asset.path] = asset
+    if jobs or len(manifest) != len(cached):
+        save_json(manifest_file, {rel: list(asset[1:]) for rel, asset in sorted(manifest.items())})
+    return manifest, len(jobs)
+
+
+def load_manifest(manifest_file=MANIFEST_FILE):
+    """The manifest as last saved, without touching the file system."""
+    entries = load_json(manifest_file, {}).items()
+    return {rel: Asset(rel, *entry) for rel, entry in entries if len(entry) == len(Asset._fields) - 1}
+
+
+def ratio_ok(width, height, ratio, tolerance=RATIO_TOLERANCE):
+    """Whether width / height is within ``tolerance`` (relative) of ``ratio``."""
+    return abs(width / height - ratio) <= tolerance * ratio
+
+
+def check_asset(asset, expected, ratio=None, exact=False):
+    """Done / Wrong ratio / Wrong size for one file against its row's spec.
+
+    ``expected`` is the spec (w, h) or None; ``ratio`` defaults to its
+    ratio. Vectors are only held to the ratio. Non-exact rows accept larger
+    masters and @2x renders; exact rows (PWA assets) must match to the pixel.
+    """
+    if not asset.width or not asset.height:
+        return DONE
+    ratio = ratio or (expected[0] / expected[1] if expected else None)
+    if ratio and not ratio_ok(asset.width, asset.height, ratio):
+        return WRONG_RATIO
+    if expected is None or asset.format == "svg":
+        return DONE
+    if exact:
+        return DONE if (asset.width, asset.height) == expected else WRONG_SIZE
+    return DONE if asset.width >= expected[0] else WRONG_SIZE
+
+
+def asset_status(assets, expected, ratio=None, exact=False):
+    """Worst result over a row's files (e.g. its SVG and PNG @2x), or Missing."""
+    if not assets:
+        return MISSING
+    results = {check_asset(asset, expected, ratio, exact) for asset in assets}
+    for status in (WRONG_RATIO, WRONG_SIZE):
+        if status in results:
+            return status
+    return DONE
+
+
+def _by_number(manifest, folder):
+    found = {}
+    prefix = folder + "/"
+    for rel, asset in manifest.items():
+        if rel.startswith(prefix) and "/" not in rel[len(prefix):]:
+            match = re.match(r"(\d+)(?:[-_.]|$)", os.path.splitext(rel[len(prefix):])[0])
+            if match:
+                found.setdefault(int(match.group(1)), []).append(asset)
+    return found
+
+
+def section_files(section, manifest):
+    """(record, [Asset], expected size, expected ratio, exact) per catalog row."""
+    records = catalog.load(section)
+    if section == "pwa_assets":
+        for r in records:
+            asset = manifest.get(f"{PWA_DIR}/{r.name}")
+            yield r, [asset] if asset else [], parse_size(r.dimensions), None, True
+        return
+    found = _by_number(manifest, ASSET_DIRS[section])
+    for r in records:
+        if section == "illustrations":
+            yield r, found.get(r.num), parse_size(r.size), parse_ratio(r.aspect_ratio), False
+        elif section == "empty_states":
+            yield r, found.get(r.num), parse_size(r.dimensions), None, False
+        else:
+            yield r, found.get(r.num), None, None, False
+
+
+def section_statuses(section, manifest):
+    """row number -> Done / Missing / Wrong size / Wrong ratio for a catalog section."""
+    return {r.num: asset_status(files, expected, ratio, exact)
+            for r, files, expected, ratio, exact in section_files(section, manifest)}
+
+
+def ratio_mismatches(section, manifest):
+    """row number -> [(path, actual ratio, spec ratio)] for files off the spec ratio."""
+    mismatches = {}
+    for r, files, expected, ratio, _ in section_files(section, manifest):
+        ratio = ratio or (expected[0] / expected[1] if expected else None)
+        for asset in files or ():
+            if ratio and asset.width and asset.height and not ratio_ok(asset.width, asset.height, ratio):
+                mismatches.setdefault(r.num, []).append((asset.path, asset.width / asset.height, ratio))
+    return mismatches
@@ -0,0 +1,100 @@
+"""Synthetic catalogs and stage measurement for benchmark-image-library.py.
+
+``synthetic_catalog`` writes a catalog directory with the same sections,
+column shapes and section/category grouping as content/image-library/, scaled
+so that the Evergreen Illustrations sheet has ``rows`` rows (every image has
+a painting, as today; the other sheets grow in proportion). Records are
+cycled from the real catalog with fresh numbers and a copy suffix on the
+name, so cell lengths, and therefore column widths and XML size, stay
+realistic.
+
+``measure`` runs one stage and records wall time, the process's peak RSS so
+far (``ru_maxrss``, monotonic, which is why the driver runs generation and
+merge in separate processes) and, when tracing, the tracemalloc peak for
+that stage alone.
+"""
+
+import gc
+import json
+import resource
+import sys
+import time
+import tracemalloc
+
+from image_library import catalog
+from image_library.cache import cache_path
+
+SIZES = (200, 5_000, 50_000, 500_000)
+RESULTS_DIR = cache_path("benchmarks")
+# Sections copied unchanged rather than scaled
+FIXED_SECTIONS = ("summary", "notes")
+NAME_FIELDS = ("name", "title", "variant")
+
+
+def _write_records(path, rows):
+    """One JSON record per line, like the real catalog files."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        f.write(",\n".join("  " + json.dumps(row, ensure_ascii=False) for row in rows))
+        f.write("\n]\n")
+
+
+def _scaled(records, count):
+    rows = []
+    for i in range(count):
+        base = records[i % len(records)]
+        row = base._asdict()
+        if "num" in row:
+            row["num"] = i + 1
+        copy = i // len(records)
+        if copy:
+            field = next(f for f in NAME_FIELDS if f in row)
+            row[field] = f"{row[field]} ({copy + 1})"
+        rows.append(row)
+    # Keep each section's rows together so sheets get the same category-row pattern
+    if rows and "section" in rows[0]:
+        order = {s: i for i, s in enumerate(dict.fromkeys(r.section for r in records))}
+        rows.sort(key=lambda row: order[row["section"]])
+        if "num" in rows[0]:
+            for i, row in enumerate(rows, 1):
+                row["num"] = i
+    return rows
+
+
+def synthetic_catalog(rows, out_dir, source_dir=catalog.CATALOG_DIR):
+    """Write a catalog scaled to ``rows`` illustrations into ``out_dir``; returns row counts."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    base = len(catalog.load("illustrations", source_dir))
+    counts = {}
+    for section, (file_name, _) in catalog.SECTIONS.items():
+        records = catalog.load(section, source_dir)
+        if section in FIXED_SECTIONS:
+            data = list(records) if section == "notes" else [r._asdict() for r in records]
+        elif section in ("illustrations", "paintings"):
+            data = _scaled(records, rows)
+        else:
+            data = _scaled(records, max(len(records), round(len(records) * rows / base)))
+        _write_records(out_dir / file_name, data)
+        counts[section] = len(data)
+    return counts
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes (Linux reports KB, macOS bytes)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(fn, trace=False):
+    """(result, {"seconds", "rss_peak", "tracemalloc_peak"}) for one call of ``fn``."""
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    stats = {"seconds": round(elapsed, 4), "rss_peak": peak_rss()}
+    if trace:
+        stats["tracemalloc_peak"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result, stats
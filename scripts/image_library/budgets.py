@@ -0,0 +1,136 @@
+"""Measure the files under public/images against the Max File Size budgets.
+
+Budgets come from the Image Size Specs rows ("250KB / 500KB" is @1x / @2x,
+"<1KB" and "30KB SVG" apply to every scale). Each file is mapped to a spec
+variant by path:
+
+* rendered derivatives (``derived/…/card-large@2x.webp``) carry the spec
+  slug and scale in their file name;
+* other sources are matched against ``RULES`` (path glob -> slug, scale).
+
+Files matching neither are reported as unmapped. Directories are listed
+and stat'ed from a thread pool (``assets.scan_tree``), so the whole tree is
+measured in well under a second. ``measure`` does the same from sizes the
+caller already has (the workbook generator passes the asset manifest's).
+"""
+
+import re
+import time
+from collections import namedtuple
+from fnmatch import fnmatch
+
+from image_library import REPO_ROOT, catalog
+from image_library.assets import scan_tree
+from image_library.cache import cache_path
+from image_library.specs import spec_slug
+from image_library.styles import STATUS_BAD, STATUS_OK
+
+IMAGES_DIR = REPO_ROOT / "public" / "images"
+REPORT_FILE = cache_path("budget-report.json")
+
+# Where each kind of source file is used in the app, as (glob, spec slug, scale)
+RULES = (
+    # rawSrc is what the series / devotional hero components render
+    ("devotional-prints/*/raw.webp", "hero-desktop", 1),
+    ("devotional-prints/*/print.webp", "inline-full-width", 1),
+)
+
+# x1 / x2: byte limits for @1x / @2x
+Budget = namedtuple("Budget", "spec name label x1 x2")
+
+_AMOUNT_RE = re.compile(r"(\d+(?:\.\d+)?)\s*(KB|MB|B)\b", re.IGNORECASE)
+_UNITS = {"b": 1, "kb": 1024, "mb": 1024 * 1024}
+_DERIVED_RE = re.compile(r"^derived/.+/([a-z0-9-]+)@(\d)x\.[a-z]+$")
+
+
+def parse_budget(text):
+    """"250KB / 500KB" -> (256000, 512000); "<1KB" -> (1024, 1024); no amount -> None."""
+    amounts = [int(float(n) * _UNITS[unit.lower()]) for n, unit in _AMOUNT_RE.findall(text or "")]
+    if not amounts:
+        return None
+    return amounts[0], amounts[1] if len(amounts) > 1 else amounts[0]
+
+
+def load_budgets(specs=None):
+    """Spec slug -> Budget for every spec row that declares one."""
+    specs = catalog.load("size_specs") if specs is None else specs
+    budgets = {}
+    for spec in specs:
+        limits = parse_budget(spec.max_file_size)
+        if limits:
+            name = spec_slug(spec)
+            budgets[name] = Budget(spec, name, spec.max_file_size, *limits)
+    return budgets
+
+
+def classify(rel, rules=RULES):
+    """(spec slug, scale) for a path relative to public/images, or None."""
+    match = _DERIVED_RE.match(rel)
+    if match:
+        return match.group(1), int(match.group(2))
+    for pattern, name, scale in rules:
+        if fnmatch(rel, pattern):
+            return name, scale
+    return None
+
+
+def scan_sizes(root=IMAGES_DIR, workers=16):
+    """{relative posix path: size} for every image file under ``root``."""
+    return {rel: stat[0] for rel, stat in scan_tree(root, workers=workers).items()}
+
+
+def check(root=IMAGES_DIR, budgets=None, rules=RULES, workers=16):
+    """Measure every file under ``root``; returns a JSON-ready report dict."""
+    started = time.perf_counter()
+    sizes = scan_sizes(root, workers)
+    report = measure(sizes, budgets, rules)
+    return {"generated_at": time.time(), "scan_seconds": round(time.perf_counter() - started, 3), **report}
+
+
+def measure(sizes, budgets=None, rules=RULES):
+    """``check``'s report (without timings) for {path under public/images: size}."""
+    budgets = load_budgets() if budgets is None else budgets
+    specs = {name: {"label": b.label, "limit_1x": b.x1, "limit_2x": b.x2, "files": 0, "over": 0,
+                    "largest": 0, "total_bytes": 0} for name, b in budgets.items()}
+    over, unmapped = [], []
+    for rel, size in sorted(sizes.items()):
+        mapped = classify(rel, rules)
+        if not mapped or mapped[0] not in budgets:
+            unmapped.append(rel)
+            continue
+        name, scale = mapped
+        limit = budgets[name].x2 if scale > 1 else budgets[name].x1
+        stats = specs[name]
+        stats["files"] += 1
+        stats["total_bytes"] += size
+        stats["largest"] = max(stats["largest"], size)
+        if size > limit:
+            stats["over"] += 1
+            over.append({"path": rel, "spec": name, "scale": scale, "bytes": size, "limit": limit,
+                         "over_by": size - limit})
+    over.sort(key=lambda item: item["over_by"], reverse=True)
+    return {
+        "files": len(sizes),
+        "mapped": len(sizes) - len(unmapped),
+        "over_budget": over,
+        "specs": specs,
+        "unmapped": unmapped,
+    }
+
+
+def spec_status(stats):
+    """Workbook label for one spec row's stats, or None when no file maps to it."""
+    if not stats or not stats["files"]:
+        return None
+    if stats["over"]:
+        return f"{stats['over']} of {stats['files']} over"
+    return f"OK ({stats['files']})"
+
+
+def status_style(label):
+    """STATUS_OK / STATUS_BAD for a ``spec_status`` label, None for anything else."""
+    if label and label.startswith("OK ("):
+        return STATUS_OK
+    if label and label.endswith(" over"):
+        return STATUS_BAD
+    return None
@@ -0,0 +1,37 @@
+"""JSON state files under CACHE_DIR, written atomically."""
+
+import hashlib
+import json
+import os
+
+from image_library import CACHE_DIR
+
+
+def cache_path(name):
+    return CACHE_DIR / name
+
+
+def load_json(path, default=None):
+    """Parsed contents of ``path``, or ``default`` when missing or corrupt."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(path, data, indent=None):
+    """Write ``data`` via a temp file + rename so readers never see half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent, separators=None if indent else (",", ":"))
+    os.replace(tmp, path)
+
+
+def file_sha256(path, chunk=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -0,0 +1,102 @@
+"""Lazy loader for the image library catalog in ``content/image-library/``.
+
+Each table lives in its own JSON file (one record per line) so a command only
+parses the sections it asks for. Parsed sections are memoized per process and
+re-read only when the file's mtime changes. Loading ``paintings`` checks the
+join against ``illustrations`` once, so consumers can trust every painting
+points at an existing image number.
+"""
+
+import json
+import os
+from collections import namedtuple
+from pathlib import Path
+
+from image_library import REPO_ROOT
+
+# IMAGE_LIBRARY_CATALOG points every script at another catalog (e.g. the benchmark's synthetic ones)
+CATALOG_DIR = Path(os.environ.get("IMAGE_LIBRARY_CATALOG") or REPO_ROOT / "content" / "image-library")
+
+Illustration = namedtuple("Illustration", "num category name use_cases size aspect_ratio")
+Painting = namedtuple("Painting", "num title artist year url")
+SizeSpec = namedtuple(
+    "SizeSpec", "section image_type variant dimensions aspect_ratio format retina max_file_size notes"
+)
+EmptyState = namedtuple("EmptyState", "section num name description dimensions format used_in")
+Icon = namedtuple("Icon", "section num category name purpose sizes format states")
+PwaAsset = namedtuple("PwaAsset", "section num asset_type name dimensions format notes")
+SummaryCount = namedtuple("SummaryCount", "category unique_assets retina_assets sheet")
+
+# section -> (file name, record type); notes are plain strings
+SECTIONS = {
+    "illustrations": ("illustrations.json", Illustration),
+    "paintings": ("paintings.json", Painting),
+    "size_specs": ("size-specs.json", SizeSpec),
+    "empty_states": ("empty-states.json", EmptyState),
+    "icons": ("icons.json", Icon),
+    "pwa_assets": ("pwa-assets.json", PwaAsset),
+    "summary": ("summary.json", SummaryCount),
+    "notes": ("notes.json", None),
+}
+
+# Sections whose validation reads another section
+DEPENDS = {"paintings": ("illustrations",)}
+
+_cache = {}
+
+
+class CatalogError(ValueError):
+    """Raised when a catalog file is malformed or fails validation."""
+
+
+def section_path(section, catalog_dir=CATALOG_DIR):
+    if section not in SECTIONS:
+        raise CatalogError(f"Unknown catalog section: {section}")
+    return catalog_dir / SECTIONS[section][0]
+
+
+def load(section, catalog_dir=CATALOG_DIR):
+    """Return the records of one catalog section as a tuple."""
+    names = (section,) + DEPENDS.get(section, ())
+    stamp = tuple(section_path(name, catalog_dir).stat().st_mtime_ns for name in names)
+    key = (section, str(catalog_dir))
+    cached = _cache.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    records = _parse(section, catalog_dir)
+    if section == "paintings":
+        _validate_paintings(records, load("illustrations", catalog_dir))
+    _cache[key] = (stamp, records)
+    return records
+
+
+def painting_map(catalog_dir=CATALOG_DIR):
+    """image number -> Painting."""
+    return {p.num: p for p in load("paintings", catalog_dir)}
+
+
+def _parse(section, catalog_dir):
+    path = section_path(section, catalog_dir)
+    record = SECTIONS[section][1]
+    with open(path, encoding="utf-8") as f:
+        rows = json.load(f)
+    if record is None:
+        return tuple(rows)
+    try:
+        return tuple(record(**row) for row in rows)
+    except TypeError as exc:
+        raise CatalogError(f"{path.name}: {exc}") from exc
+
+
+def _validate_paintings(paintings, illustrations):
+    known = {ill.num for ill in illustrations}
+    if len(known) != len(illustrations):
+        raise CatalogError("illustrations.json: image numbers are not unique")
+    seen = set()
+    for painting in paintings:
+        if painting.num in seen:
+            raise CatalogError(f"paintings.json: image #{painting.num} has more than one painting")
+        if painting.num not in known:
+            raise CatalogError(f"paintings.json: image #{painting.num} is not in illustrations.json")
+        seen.add(painting.num)
@@ -0,0 +1,215 @@
+"""Export the image library catalog to a normalized SQLite database with FTS5 search.
+
+One table per workbook sheet (illustrations, paintings, size_specs,
+empty_states, icons, pwa_assets, summary, notes). Parsed columns sit
+alongside the text as written: pixel width/height, the aspect ratio as a
+number and byte budgets. Two child tables hold illustration tags, one per
+comma-separated Use Cases entry, and scripture references as verse intervals
+(image_library.scripture). Status columns carry the asset manifest's
+Done / Missing / Wrong size / Wrong ratio.
+
+``library_fts`` is an FTS5 index over every row's name, description and
+tags, with diacritics folded, so the app's build step can ask for
+"all 16:9 images tagged lament" without openpyxl::
+
+    SELECT i.num, i.name FROM library_fts f JOIN illustrations i ON i.num = f.num
+    WHERE f.sheet = 'illustrations' AND library_fts MATCH 'lament' AND i.aspect_ratio = '16:9'
+
+The database is built in a temp file inside one transaction (journal and
+fsync off, since a failed build is simply discarded), then renamed over the
+old one. A ``meta`` row records a hash of the inputs, so an unchanged
+catalog is not rebuilt.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+
+from image_library import catalog, scripture
+from image_library.budgets import parse_budget
+from image_library.cache import cache_path
+from image_library.specs import parse_ratio, parse_size
+
+DATABASE_FILE = cache_path("library.sqlite")
+
+# Bump when the rows written for the same inputs change (SCHEMA edits are hashed anyway)
+SCHEMA_VERSION = 1
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE illustrations (
+    num INTEGER PRIMARY KEY, category TEXT NOT NULL, name TEXT NOT NULL, use_cases TEXT,
+    size TEXT, width INTEGER, height INTEGER, aspect_ratio TEXT, ratio REAL, status TEXT
+);
+CREATE INDEX illustrations_category ON illustrations (category);
+CREATE INDEX illustrations_aspect_ratio ON illustrations (aspect_ratio);
+CREATE TABLE illustration_tags (
+    num INTEGER NOT NULL REFERENCES illustrations (num), tag TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (num, tag)
+);
+CREATE INDEX illustration_tags_tag ON illustration_tags (tag);
+CREATE TABLE illustration_refs (
+    num INTEGER NOT NULL REFERENCES illustrations (num), start INTEGER NOT NULL, end INTEGER NOT NULL,
+    citation TEXT NOT NULL
+);
+CREATE INDEX illustration_refs_start ON illustration_refs (start, end);
+CREATE TABLE paintings (
+    num INTEGER PRIMARY KEY REFERENCES illustrations (num), title TEXT NOT NULL, artist TEXT, year TEXT, url TEXT
+);
+CREATE TABLE size_specs (
+    id INTEGER PRIMARY KEY, section TEXT NOT NULL, image_type TEXT NOT NULL, variant TEXT NOT NULL,
+    dimensions TEXT, width INTEGER, height INTEGER, aspect_ratio TEXT, ratio REAL, format TEXT, retina TEXT,
+    max_file_size TEXT, max_bytes_1x INTEGER, max_bytes_2x INTEGER, notes TEXT
+);
+CREATE TABLE empty_states (
+    num INTEGER PRIMARY KEY, section TEXT NOT NULL, name TEXT NOT NULL, description TEXT, dimensions TEXT,
+    width INTEGER, height INTEGER, format TEXT, used_in TEXT, status TEXT
+);
+CREATE TABLE icons (
+    num INTEGER PRIMARY KEY, section TEXT NOT NULL, category TEXT, name TEXT NOT NULL, purpose TEXT,
+    sizes TEXT, format TEXT, states TEXT, status TEXT
+);
+CREATE TABLE pwa_assets (
+    num INTEGER PRIMARY KEY, section TEXT NOT NULL, asset_type TEXT, name TEXT NOT NULL, dimensions TEXT,
+    width INTEGER, height INTEGER, format TEXT, notes TEXT, status TEXT
+);
+CREATE TABLE summary (
+    category TEXT PRIMARY KEY, unique_assets INTEGER, retina_assets INTEGER, sheet TEXT
+);
+CREATE TABLE notes (id INTEGER PRIMARY KEY, text TEXT NOT NULL);
+CREATE VIRTUAL TABLE library_fts USING fts5 (
+    sheet UNINDEXED, num UNINDEXED, name, description, tags, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+EXPORT_SECTIONS = ("illustrations", "paintings", "size_specs", "empty_states", "icons", "pwa_assets",
+                   "summary", "notes")
+
+
+def _size(text):
+    return parse_size(text) or (None, None)
+
+
+def _split_tags(text):
+    return list(dict.fromkeys(tag.strip() for tag in (text or "").split(",") if tag.strip()))
+
+
+def rows(statuses):
+    """{table: [row tuples]} for every table, in insert order.
+
+    ``statuses`` maps section -> {num: status} (see image_library.assets).
+    """
+    out = {table: [] for table in ("illustrations", "illustration_tags", "illustration_refs", "paintings",
+                                   "size_specs", "empty_states", "icons", "pwa_assets", "summary", "notes",
+                                   "library_fts")}
+    fts = out["library_fts"]
+
+    illustrations = catalog.load("illustrations")
+    for r in illustrations:
+        status = statuses.get("illustrations", {}).get(r.num)
+        out["illustrations"].append((r.num, r.category, r.name, r.use_cases, r.size, *_size(r.size),
+                                     r.aspect_ratio, parse_ratio(r.aspect_ratio), status))
+        out["illustration_tags"].extend((r.num, tag) for tag in _split_tags(r.use_cases))
+        fts.append(("illustrations", r.num, r.name, r.category, r.use_cases))
+    out["illustration_refs"] = [(num, start, end, citation)
+                                for start, end, (num, citation) in scripture.illustration_refs(illustrations)]
+
+    for p in catalog.load("paintings"):
+        out["paintings"].append((p.num, p.title, p.artist, p.year, p.url))
+        fts.append(("paintings", p.num, p.title, f"{p.artist} {p.year}", ""))
+
+    for i, s in enumerate(catalog.load("size_specs"), 1):
+        budget = parse_budget(s.max_file_size) or (None, None)
+        out["size_specs"].append((i, s.section, s.image_type, s.variant, s.dimensions, *_size(s.dimensions),
+                                  s.aspect_ratio, parse_ratio(s.aspect_ratio), s.format, s.retina,
+                                  s.max_file_size, *budget, s.notes))
+        fts.append(("size_specs", i, f"{s.image_type} {s.variant}", s.notes, s.section))
+
+    for r in catalog.load("empty_states"):
+        status = statuses.get("empty_states", {}).get(r.num)
+        out["empty_states"].append((r.num, r.section, r.name, r.description, r.dimensions, *_size(r.dimensions),
+                                    r.format, r.used_in, status))
+        fts.append(("empty_states", r.num, r.name, r.description, r.used_in))
+
+    for r in catalog.load("icons"):
+        status = statuses.get("icons", {}).get(r.num)
+        out["icons"].append((r.num, r.section, r.category, r.name, r.purpose, r.sizes, r.format, r.states, status))
+        fts.append(("icons", r.num, r.name, r.purpose, f"{r.category}, {r.states}"))
+
+    for r in catalog.load("pwa_assets"):
+        status = statuses.get("pwa_assets", {}).get(r.num)
+        out["pwa_assets"].append((r.num, r.section, r.asset_type, r.name, r.dimensions, *_size(r.dimensions),
+                                  r.format, r.notes, status))
+        fts.append(("pwa_assets", r.num, r.name, r.notes, r.asset_type))
+
+    out["summary"] = [tuple(r) for r in catalog.load("summary")]
+    out["notes"] = list(enumerate(catalog.load("notes"), 1))
+    return out
+
+
+def inputs_hash(statuses):
+    """Changes whenever the exported rows would, including with the schema."""
+    digest = hashlib.sha256(f"{SCHEMA_VERSION}\n{SCHEMA}".encode("utf-8"))
+    for section in EXPORT_SECTIONS:
+        digest.update(catalog.section_path(section).read_bytes())
+    digest.update(json.dumps(statuses, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def stored_hash(db_path):
+    try:
+        with sqlite3.connect(f"file:{db_path}?mode=ro", uri=True) as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'inputs'").fetchone()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def export(statuses, db_path=DATABASE_FILE, force=False):
+    """Write the database; returns {table: row count}, or None when it was already current."""
+    digest = inputs_hash(statuses)
+    if not force and db_path.exists() and stored_hash(db_path) == digest:
+        return None
+
+    tables = rows(statuses)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = db_path.with_name(db_path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(tmp, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("BEGIN")
+        for statement in SCHEMA.split(";"):
+            if statement.strip():
+                conn.execute(statement)
+        for table, values in tables.items():
+            if values:
+                marks = ", ".join("?" * len(values[0]))
+                conn.executemany(f"INSERT INTO {table} VALUES ({marks})", values)
+        conn.execute("INSERT INTO library_fts (library_fts) VALUES ('optimize')")
+        conn.execute("INSERT INTO meta VALUES ('inputs', ?)", (digest,))
+        conn.execute("COMMIT")
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    os.replace(tmp, db_path)
+    return {table: len(values) for table, values in tables.items()}
+
+
+def search(conn, query, sheet=None, aspect_ratio=None, limit=50):
+    """(sheet, num, name, highlighted snippet) for an FTS5 query, best match first.
+
+    ``aspect_ratio`` ("16:9") restricts results to illustrations with that ratio.
+    """
+    sql = ("SELECT f.sheet, f.num, f.name, snippet(library_fts, -1, '[', ']', '…', 8) FROM library_fts f")
+    where, params = ["library_fts MATCH ?"], [query]
+    if aspect_ratio:
+        sql += " JOIN illustrations i ON f.sheet = 'illustrations' AND i.num = f.num"
+        where.append("i.aspect_ratio = ?")
+        params.append(aspect_ratio)
+    if sheet:
+        where.append("f.sheet = ?")
+        params.append(sheet)
+    sql += " WHERE " + " AND ".join(where) + " ORDER BY rank LIMIT ?"
+    return conn.execute(sql, params + [limit]).fetchall()
@@ -0,0 +1,271 @@
+"""Near-duplicate detection over public/images with perceptual hashes and a BK-tree.
+
+Each distinct file (by sha256, from the asset manifest) gets two 64-bit
+hashes:
+
+* pHash  the signs of the low 8 x 8 DCT coefficients of a 32 x 32 greyscale
+         thumbnail against their median. Robust to re-encoding, resizing and
+         tone changes, so a print.webp stays close to its raw.webp.
+* dHash  whether each pixel of a 9 x 8 thumbnail is brighter than its left
+         neighbour; reported alongside as a second opinion.
+
+Decoding is fanned out over a process pool. The workers only return
+thumbnails, and the DCTs for the whole batch are one einsum.
+
+Hashes and near-duplicate pairs persist in ``.cache/image-library/
+perceptual-hashes.json``, keyed by content hash, so renames and touches cost
+nothing. Pairs are found with a BK-tree over the pHashes. A Hamming-radius
+query visits only the subtrees whose edge distance lies within the radius of
+the query's distance to their parent. The tree is saved in the index too, so
+on a re-run only new content is hashed, inserted and queried; pairs between
+unchanged files are reused. Removed files are dropped from their nodes,
+which stay on as routing points until more than half the tree is empty and
+it is rebuilt.
+"""
+
+import json
+import re
+import unicodedata
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from image_library import catalog
+from image_library.assets import ASSET_DIRS
+from image_library.cache import cache_path, load_json, save_json
+
+INDEX_FILE = cache_path("perceptual-hashes.json")
+SCOPE = "images/"
+EXCLUDE = ("images/derived/",)
+HASHABLE_FORMATS = {"png", "jpeg", "webp", "gif"}
+THRESHOLD = 10
+PHASH_SIZE, PHASH_LOW = 32, 8
+
+# ``distance``/``dhash_distance`` are pHash / dHash Hamming distances (0 = identical)
+Pair = namedtuple("Pair", "a b distance dhash_distance")
+
+
+class BKTree:
+    """Burkhard-Keller tree over integer hashes under Hamming distance."""
+
+    def __init__(self):
+        self.root = None  # [hash, values, {edge distance: child}]
+
+    def add(self, key, value):
+        if self.root is None:
+            self.root = [key, [value], {}]
+            return
+        node = self.root
+        while True:
+            d = (node[0] ^ key).bit_count()
+            if d == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [key, [value], {}]
+                return
+            node = child
+
+    def prune(self, keep):
+        """Drop values not in ``keep``; returns (values left, share of nodes left empty).
+
+        Emptied nodes are kept, since their keys still route searches and inserts.
+        """
+        left, nodes, empty, stack = set(), 0, 0, [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            node[1][:] = [value for value in node[1] if value in keep]
+            left.update(node[1])
+            nodes += 1
+            empty += not node[1]
+            stack.extend(node[2].values())
+        return left, empty / nodes if nodes else 0.0
+
+    def dump(self):
+        """JSON-ready nested ``[hex key, values, {edge: child}]`` lists."""
+
+        def encode(node):
+            return [f"{node[0]:016x}", node[1], {str(edge): encode(child) for edge, child in node[2].items()}]
+
+        return encode(self.root) if self.root else None
+
+    @classmethod
+    def load(cls, data):
+        """Inverse of ``dump``."""
+
+        def decode(node):
+            return [int(node[0], 16), list(node[1]), {int(edge): decode(child) for edge, child in node[2].items()}]
+
+        tree = cls()
+        tree.root = decode(data) if data else None
+        return tree
+
+    def search(self, key, radius):
+        """[(distance, value)] for every stored hash within ``radius`` of ``key``."""
+        found, stack = [], [self.root] if self.root else []
+        while stack:
+            node_key, values, children = stack.pop()
+            d = (node_key ^ key).bit_count()
+            if d <= radius:
+                found.extend((d, value) for value in values)
+            # Triangle inequality: matches under a child at edge distance e have e within d +/- radius
+            stack.extend(child for edge, child in children.items() if d - radius <= edge <= d + radius)
+        return found
+
+
+def _dct_matrix(n):
+    k = np.arange(n)
+    m = np.cos(np.pi * (2 * k[None, :] + 1) * k[:, None] / (2 * n)) * np.sqrt(2 / n)
+    m[0] /= np.sqrt(2)
+    return m
+
+
+def thumbnails(path):
+    """Worker: (32 x 32, 9 x 8) greyscale uint8 thumbnails of one image."""
+    from PIL import Image, ImageOps
+
+    with Image.open(path) as im:
+        im.draft("L", (PHASH_SIZE * 2, PHASH_SIZE * 2))
+        gray = ImageOps.exif_transpose(im).convert("L")
+    return (np.asarray(gray.resize((PHASH_SIZE, PHASH_SIZE), Image.LANCZOS)),
+            np.asarray(gray.resize((9, 8), Image.LANCZOS)))
+
+
+def _pack(bits):
+    """(n, 64) booleans -> n Python ints."""
+    return [int.from_bytes(row.tobytes(), "big") for row in np.packbits(bits, axis=1)]
+
+
+def phash(thumbs):
+    """pHash per (n, 32, 32) thumbnail stack, computed as one batched 2D DCT."""
+    d = _dct_matrix(PHASH_SIZE)[:PHASH_LOW]
+    low = np.einsum("ij,njk,lk->nil", d, np.asarray(thumbs, np.float64), d).reshape(len(thumbs), -1)
+    # The DC term carries overall brightness only, so it is left out of the median
+    median = np.median(low[:, 1:], axis=1, keepdims=True)
+    return _pack(low > median)
+
+
+def dhash(thumbs):
+    """dHash per (n, 8, 9) thumbnail stack."""
+    thumbs = np.asarray(thumbs, np.int16)
+    return _pack((thumbs[:, :, 1:] > thumbs[:, :, :-1]).reshape(len(thumbs), -1))
+
+
+def candidates(manifest):
+    """sha256 -> [paths] for the hashable raster files in scope."""
+    by_sha = {}
+    for rel, asset in sorted(manifest.items()):
+        if rel.startswith(SCOPE) and not rel.startswith(EXCLUDE) and asset.format in HASHABLE_FORMATS:
+            by_sha.setdefault(asset.sha256, []).append(rel)
+    return by_sha
+
+
+def update(manifest, public, threshold=THRESHOLD, index_file=INDEX_FILE, workers=None, force=False):
+    """Bring the hash index and pair list up to date; returns (index, newly hashed count).
+
+    ``index`` is {"hashes": {sha: [phash, dhash]}, "threshold": t, "pairs": [[sha, sha, dp, dd]],
+    "tree": BKTree.dump()}.
+    """
+    by_sha = candidates(manifest)
+    previous = {} if force else load_json(index_file, {})
+    stored = previous.get("hashes", {})
+    hashes = {sha: (int(p, 16), int(d, 16)) for sha, (p, d) in stored.items() if sha in by_sha}
+    new = [sha for sha in by_sha if sha not in hashes]
+    if new:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            thumbs = list(pool.map(thumbnails, [public / by_sha[sha][0] for sha in new], chunksize=16))
+        for sha, p, d in zip(new, phash([t[0] for t in thumbs]), dhash([t[1] for t in thumbs])):
+            hashes[sha] = (p, d)
+
+    tree = BKTree.load(previous.get("tree"))
+    indexed, empty = tree.prune(hashes)
+    if empty > 0.5:
+        tree, indexed = BKTree(), set()
+    for sha, (p, _) in hashes.items():
+        if sha not in indexed:
+            tree.add(p, sha)
+    if previous.get("threshold") == threshold:
+        fresh = set(new)
+        pairs = {(a, b): (dp, dd) for a, b, dp, dd in previous.get("pairs", ())
+                 if a in hashes and b in hashes and a not in fresh and b not in fresh}
+        queries = new
+    else:
+        pairs, queries = {}, list(hashes)
+    for sha in queries:
+        p, d = hashes[sha]
+        for distance, other in tree.search(p, threshold):
+            if other != sha:
+                pairs[tuple(sorted((sha, other)))] = (distance, (d ^ hashes[other][1]).bit_count())
+
+    index = {
+        "threshold": threshold,
+        "hashes": {sha: [f"{p:016x}", f"{d:016x}"] for sha, (p, d) in sorted(hashes.items())},
+        "pairs": [[a, b, dp, dd] for (a, b), (dp, dd) in sorted(pairs.items())],
+        "tree": tree.dump(),
+    }
+    if index != previous:
+        save_json(index_file, index)
+    return index, len(new)
+
+
+def path_pairs(index, by_sha):
+    """Pair per near-duplicate file pair, plus distance-0 pairs for byte-identical copies."""
+    out = []
+    for paths in by_sha.values():
+        out.extend(Pair(a, b, 0, 0) for i, a in enumerate(paths) for b in paths[i + 1:])
+    for a, b, dp, dd in index["pairs"]:
+        out.extend(Pair(pa, pb, dp, dd) for pa in by_sha.get(a, ()) for pb in by_sha.get(b, ()))
+    return out
+
+
+def clusters(pairs):
+    """Connected groups of paths (sorted lists) linked by any pair."""
+    parent = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for pair in pairs:
+        parent[find(pair.a)] = find(pair.b)
+    groups = {}
+    for x in parent:
+        groups.setdefault(find(x), []).append(x)
+    return sorted(sorted(group) for group in groups.values())
+
+
+def _normalise(text):
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+
+def image_numbers(paths, public):
+    """path -> workbook image number, where one can be found.
+
+    Evergreen illustrations carry it as their ``NNN`` prefix; devotional
+    prints are matched to the Reference Paintings sheet by artwork title.
+    """
+    by_title = {_normalise(p.title): p.num for p in catalog.load("paintings")}
+    evergreen = ASSET_DIRS["illustrations"] + "/"
+    titles, numbers = {}, {}
+    for rel in paths:
+        if rel.startswith(evergreen):
+            match = re.match(r"(\d+)(?:[-_.]|$)", rel[len(evergreen):])
+            if match:
+                numbers[rel] = int(match.group(1))
+        elif rel.startswith("images/devotional-prints/") and rel.count("/") == 3:
+            folder = rel.rsplit("/", 1)[0]
+            if folder not in titles:
+                try:
+                    with open(public / folder / "artwork.json", encoding="utf-8") as f:
+                        titles[folder] = by_title.get(_normalise(json.load(f).get("title", "")))
+                except (OSError, ValueError):
+                    titles[folder] = None
+            if titles[folder] is not None:
+                numbers[rel] = titles[folder]
+    return numbers
@@ -0,0 +1,232 @@
+"""Render the responsive derivatives defined by the Image Size Specs table.
+
+Each source image under public/images is decoded once in a worker process
+and every spec target (variant x @1x/@2x x format) is cut from it with a
+centred cover crop. Outputs land in ``public/images/derived/<source>/``::
+
+    derived/devotional-prints/<slug>/raw/card-large@1x.webp
+
+The cache (``.cache/image-library/derivatives.json``) records, per source,
+its size/mtime, sha256 and one entry per target keyed by a hash of the
+target's dimensions and encoder settings. A source whose stat is unchanged
+and whose targets are all current is skipped without being read; a touched
+but identical file is re-hashed and skipped; a changed spec row re-renders
+only the targets it affects.
+
+AVIF and WebP targets with a Max File Size budget are encoded at the
+highest quality that fits it (image_library.quality), not at a fixed
+setting. The chosen quality is kept in the target's cache entry, which is
+dropped when the source's hash changes. A re-render of the same source and
+spec (a deleted output, a touched file) therefore encodes once at that
+quality instead of searching again. ``with_avif`` adds an AVIF twin of each
+WebP target.
+
+Pillow is required to render (NumPy too for the quality search); everything
+else is standard library.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from image_library import REPO_ROOT, quality
+from image_library.budgets import parse_budget
+from image_library.cache import cache_path, file_sha256, load_json, save_json
+
+SOURCE_DIR = REPO_ROOT / "public" / "images"
+OUTPUT_DIR = SOURCE_DIR / "derived"
+CACHE_FILE = cache_path("derivatives.json")
+
+SOURCE_SUFFIXES = {".webp", ".jpg", ".jpeg", ".png"}
+EXTENSIONS = {"avif": ".avif", "webp": ".webp", "jpeg": ".jpg", "png": ".png"}
+ENCODER_OPTIONS = {
+    "avif": {"quality": 60, "speed": 6},
+    "webp": {"quality": 82, "method": 4},
+    "jpeg": {"quality": 82, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+
+
+def find_sources(root=SOURCE_DIR, output_dir=OUTPUT_DIR):
+    """Raster images under ``root``, excluding previously rendered derivatives."""
+    sources = []
+    for path in root.rglob("*"):
+        if path.suffix.lower() in SOURCE_SUFFIXES and output_dir not in path.parents and path.is_file():
+            sources.append(path)
+    return sorted(sources)
+
+
+def with_avif(targets):
+    """``targets`` with an AVIF target ahead of each WebP one (same size), so srcsets list AVIF first."""
+    out = []
+    for target in targets:
+        if target.format == "webp":
+            out.append(target._replace(format="avif"))
+        out.append(target)
+    return out
+
+
+def budget_for(target):
+    """The target's Max File Size in bytes when its quality is searched, else None."""
+    limits = parse_budget(target.spec.max_file_size) if target.format in quality.QUALITY_RANGE else None
+    return limits[target.scale - 1] if limits else None
+
+
+def target_key(target):
+    """"card-large@2x.webp" — unique per target and used as its file name."""
+    return f"{target.name}@{target.scale}x{EXTENSIONS[target.format]}"
+
+
+def target_hash(target, allow_upscale=False, search=True):
+    """Changes whenever the rendered bytes for ``target`` would change."""
+    spec = [target.width, target.height, target.format, ENCODER_OPTIONS[target.format], allow_upscale]
+    budget = budget_for(target) if search else None
+    if budget:
+        spec += [budget, quality.QUALITY_RANGE[target.format], quality.MIN_SSIM]
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def output_dir_for(rel, output_dir=OUTPUT_DIR):
+    """``devotional-prints/x/raw.webp`` -> ``<output_dir>/devotional-prints/x/raw``."""
+    return output_dir / os.path.splitext(rel)[0]
+
+
+def _is_current(output, spec_hash, out_dir):
+    if not output or output.get("spec") != spec_hash:
+        return False
+    return "skipped" in output or (out_dir / output["file"]).exists()
+
+
+def _stale(entry, targets, hashes, out_dir):
+    outputs = entry.get("outputs", {})
+    return [t for t in targets if not _is_current(outputs.get(target_key(t)), hashes[target_key(t)], out_dir)]
+
+
+def _fit(im, target):
+    """Centred cover crop of ``im`` resized to the target size."""
+    from PIL import Image
+
+    width, height = im.size
+    ratio = target.width / target.height
+    crop_w, crop_h = (height * ratio, height) if width / height > ratio else (width, width / ratio)
+    left, top = (width - crop_w) / 2, (height - crop_h) / 2
+    # Resizing straight from the crop box avoids a copy; reducing_gap lets
+    # Pillow shrink by whole factors before the Lanczos pass
+    return im.resize((target.width, target.height), Image.LANCZOS,
+                     box=(left, top, left + crop_w, top + crop_h), reducing_gap=3.0)
+
+
+def _save(img, path, fmt, data=None):
+    """Encode ``img`` with the fixed ENCODER_OPTIONS, or write already-encoded ``data``."""
+    tmp = path.with_name(path.name + ".tmp")
+    if data is None:
+        if fmt == "jpeg" and img.mode != "RGB":
+            img = img.convert("RGB")
+        img.save(tmp, format=fmt.upper(), **ENCODER_OPTIONS[fmt])
+    else:
+        tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _encode(img, target, known, search):
+    """(bytes or None, cache fields): a budgeted target is searched, or re-encoded at its known quality."""
+    budget = budget_for(target) if search else None
+    if not budget:
+        return None, {}
+    if known and "quality" in known:
+        data = quality.encode(img, target.format, known["quality"], ENCODER_OPTIONS[target.format])
+        return data, {key: known[key] for key in ("quality", "ssim", "fits")}
+    choice = quality.search(img, target.format, budget, ENCODER_OPTIONS[target.format])
+    return choice.data, {"quality": choice.quality, "ssim": round(choice.ssim, 4), "fits": choice.fits}
+
+
+def render_source(job):
+    """Worker: (re)render the stale targets of one source; returns (rel, entry, rendered)."""
+    from PIL import Image, ImageOps
+
+    src, rel, stat, out_dir, targets, hashes, previous, allow_upscale, search = job
+    digest = file_sha256(src)
+    outputs = dict(previous.get("outputs", {})) if previous.get("sha256") == digest else {}
+    entry = {"size": stat[0], "mtime_ns": stat[1], "sha256": digest, "outputs": outputs}
+    stale = _stale(entry, targets, hashes, out_dir)
+    rendered = 0
+    if stale:
+        out_dir.mkdir(parents=True, exist_ok=True)
+        with Image.open(src) as im:
+            im = ImageOps.exif_transpose(im)
+            if im.mode not in ("RGB", "RGBA"):
+                im = im.convert("RGBA" if "transparency" in im.info or "A" in im.mode else "RGB")
+            width, height = im.size
+            for target in stale:
+                key = target_key(target)
+                if not allow_upscale and (target.width > width or target.height > height):
+                    outputs[key] = {"spec": hashes[key],
+                                    "skipped": f"source {width}x{height} < {target.width}x{target.height}"}
+                    continue
+                img = _fit(im, target)
+                # Same source hash and spec: the quality found last time still applies
+                known = outputs.get(key) if outputs.get(key, {}).get("spec") == hashes[key] else None
+                data, chosen = _encode(img, target, known, search)
+                _save(img, out_dir / key, target.format, data)
+                outputs[key] = {"spec": hashes[key], "file": key, "bytes": (out_dir / key).stat().st_size, **chosen}
+                rendered += 1
+    # Forget targets that were removed from the spec table
+    entry["outputs"] = {key: outputs[key] for key in hashes if key in outputs}
+    return rel, entry, rendered
+
+
+def prune(cache, live, output_dir=OUTPUT_DIR):
+    """Delete derivatives of sources that no longer exist; returns how many were removed."""
+    removed = 0
+    for rel in [rel for rel in cache if rel not in live]:
+        out_dir = output_dir_for(rel, output_dir)
+        for output in cache.pop(rel).get("outputs", {}).values():
+            if "file" in output and (out_dir / output["file"]).exists():
+                (out_dir / output["file"]).unlink()
+                removed += 1
+    return removed
+
+
+def build(targets, sources, root=SOURCE_DIR, output_dir=OUTPUT_DIR, workers=None,
+          allow_upscale=False, force=False, search=True, cache_file=CACHE_FILE, progress=print):
+    """Render every stale (source, target) pair; returns a summary dict.
+
+    Sources are fanned out over a process pool, one task per source so each
+    image is decoded once for all of its targets (and its quality searches
+    run in that worker). ``search=False`` encodes every target at the fixed
+    ENCODER_OPTIONS quality.
+    """
+    cache = {} if force else load_json(cache_file, {})
+    hashes = {target_key(t): target_hash(t, allow_upscale, search) for t in targets}
+    jobs = []
+    for src in sources:
+        rel = src.relative_to(root).as_posix()
+        st = src.stat()
+        entry = cache.get(rel, {})
+        out_dir = output_dir_for(rel, output_dir)
+        if (entry.get("size"), entry.get("mtime_ns")) == (st.st_size, st.st_mtime_ns) \
+                and not _stale(entry, targets, hashes, out_dir):
+            continue
+        jobs.append((src, rel, (st.st_size, st.st_mtime_ns), out_dir, targets, hashes, entry, allow_upscale, search))
+
+    rendered = 0
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(render_source, job) for job in jobs]
+            for done, future in enumerate(as_completed(futures), 1):
+                rel, entry, count = future.result()
+                cache[rel] = entry
+                rendered += count
+                if count:
+                    progress(f"  {rel}: {count} file(s)")
+                if done % 100 == 0:
+                    # Checkpoint so an interrupted run keeps its finished sources
+                    save_json(cache_file, cache)
+    save_json(cache_file, cache)
+
+    outputs = [output for rel in (s.relative_to(root).as_posix() for s in sources)
+               for output in cache.get(rel, {}).get("outputs", {}).values()]
+    return {"sources": len(sources), "processed": len(jobs), "rendered": rendered,
+            "unchanged": len(sources) - len(jobs), "too_small": sum("skipped" in output for output in outputs),
+            "over_budget": sum(output.get("fits") is False for output in outputs)}
@@ -0,0 +1,131 @@
+"""Concurrent reference-URL checker with a persistent result cache.
+
+URLs are probed from a bounded thread pool; a per-host limiter caps how many
+requests hit one host at once and spaces their start times, so Wikimedia is
+never hammered. Each result (status, final URL after redirects, timestamp)
+is cached on disk and only re-probed once it is older than the TTL. Results
+without a status (timeouts, DNS errors, refused connections) are cached for
+the report but never count as fresh, so a network blip is retried on the
+next run.
+
+``probe`` is pluggable: tests point ``check_urls`` at a local
+``http.server`` or pass a fake probe; the default uses urllib.
+"""
+
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from image_library.cache import cache_path, load_json, save_json
+
+CACHE_FILE = cache_path("link-check.json")
+USER_AGENT = "EuangelionImageLibrary/1.0 (reference link check)"
+
+# HEAD is refused by some hosts; retry those with a one-byte GET
+_HEAD_REFUSED = {403, 405, 501}
+
+
+class HostLimiter:
+    """At most ``per_host`` concurrent requests per host, ``interval`` s apart."""
+
+    def __init__(self, per_host=2, interval=0.25):
+        self.per_host = per_host
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._slots = {}
+        self._next_start = {}
+
+    @contextmanager
+    def slot(self, host):
+        with self._lock:
+            sem = self._slots.setdefault(host, threading.Semaphore(self.per_host))
+        with sem:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self.interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+def to_uri(url):
+    """Percent-encode non-ASCII path/query characters (e.g. ``Création``)."""
+    parts = urllib.parse.urlsplit(url)
+    path = urllib.parse.quote(parts.path, safe="/%:@!$&'()*+,;=-._~")
+    query = urllib.parse.quote(parts.query, safe="=&%+/:?@!$'()*,;-._~")
+    return urllib.parse.urlunsplit((parts.scheme, parts.netloc, path, query, parts.fragment))
+
+
+def probe_url(url, timeout=15):
+    """Return {"status", "final_url", "error"} for one URL; never raises."""
+    uri = to_uri(url)
+    for method in ("HEAD", "GET"):
+        request = urllib.request.Request(uri, method=method, headers={"User-Agent": USER_AGENT})
+        if method == "GET":
+            request.add_header("Range", "bytes=0-0")
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                return {"status": response.status, "final_url": response.geturl(), "error": None}
+        except urllib.error.HTTPError as exc:
+            if method == "HEAD" and exc.code in _HEAD_REFUSED:
+                continue
+            return {"status": exc.code, "final_url": exc.geturl() or uri, "error": None}
+        except (urllib.error.URLError, OSError, ValueError) as exc:
+            reason = getattr(exc, "reason", exc)
+            return {"status": None, "final_url": None, "error": str(reason)}
+
+
+def is_fresh(entry, ttl, now):
+    """A cached result that need not be re-probed; errors are always re-probed."""
+    return entry is not None and entry.get("status") is not None and now - entry.get("checked_at", 0) < ttl
+
+
+def check_urls(urls, cache=None, ttl=7 * 86400, workers=16, limiter=None, probe=probe_url):
+    """Check ``urls``; returns url -> result, reusing cache entries younger than ``ttl``.
+
+    ``cache`` is a dict (see ``load_cache``) updated in place with new results.
+    """
+    cache = {} if cache is None else cache
+    limiter = limiter or HostLimiter()
+    now = time.time()
+    stale = [url for url in dict.fromkeys(urls) if not is_fresh(cache.get(url), ttl, now)]
+
+    def run(url):
+        with limiter.slot(urllib.parse.urlsplit(url).netloc):
+            result = probe(url)
+        result["checked_at"] = time.time()
+        result["redirected"] = bool(result["final_url"]) and result["final_url"] != to_uri(url)
+        return url, result
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for url, result in pool.map(run, stale):
+            cache[url] = result
+    return {url: cache[url] for url in urls}
+
+
+def status_label(result):
+    """Short human-readable outcome for the workbook's status column."""
+    status = result.get("status")
+    if status is None:
+        return f"Error ({result.get('error') or 'unknown'})"
+    if 200 <= status < 400:
+        return "Redirected" if result.get("redirected") else "OK"
+    return f"Broken ({status})"
+
+
+def is_ok(result):
+    status = result.get("status")
+    return status is not None and 200 <= status < 400
+
+
+def load_cache(path=CACHE_FILE):
+    return load_json(path, {})
+
+
+def save_cache(cache, path=CACHE_FILE):
+    save_json(path, cache)
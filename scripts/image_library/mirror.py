@@ -0,0 +1,247 @@
+"""Resumable, content-addressed offline mirror of the reference paintings.
+
+Layout under ``.cache/image-library/mirror/``::
+
+    objects/ab/abcdef….jpg   one file per distinct image, named by sha256
+    partial/<key>.part       in-flight downloads, resumed with a Range request
+    index.json               image number -> source, license, bytes, size, …
+
+A painting whose index entry matches its catalog URL and whose object is on
+disk is skipped without touching the network, so re-runs are near-instant.
+
+Backends resolve a painting to a downloadable file and open byte streams.
+``WikimediaBackend`` turns Wikipedia / Commons page URLs into original files
+via the MediaWiki API; ``HttpBackend`` maps image numbers onto a plain base
+URL, which is what tests use with a local fixture server.
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from image_library.cache import cache_path, load_json, save_json
+from image_library.linkcheck import USER_AGENT, HostLimiter, to_uri
+
+MIRROR_DIR = cache_path("mirror")
+CHUNK = 1 << 16
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+
+class MirrorError(Exception):
+    """A painting could not be resolved or downloaded."""
+
+
+def _request(url, headers=None):
+    return urllib.request.Request(to_uri(url), headers={"User-Agent": USER_AGENT, **(headers or {})})
+
+
+class HttpBackend:
+    """Fetch ``<base_url>/<image_num>`` with Range-based resume."""
+
+    def __init__(self, base_url=None, timeout=30):
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.timeout = timeout
+
+    def resolve(self, painting):
+        """-> {"url", "license", "width", "height"} (unknowns as None)."""
+        return {"url": f"{self.base_url}/{painting.num}", "license": None, "width": None, "height": None}
+
+    def open(self, url, offset=0):
+        """-> (response, resumed). ``resumed`` is False when the server restarts at byte 0."""
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            response = urllib.request.urlopen(_request(url, headers), timeout=self.timeout)
+        except urllib.error.HTTPError as exc:
+            if exc.code == 416 and offset:
+                # Range starts at/after the end: the partial file is already complete
+                return None, True
+            raise MirrorError(f"HTTP {exc.code} for {url}") from exc
+        except (urllib.error.URLError, OSError) as exc:
+            raise MirrorError(f"{url}: {getattr(exc, 'reason', exc)}") from exc
+        return response, offset > 0 and response.status == 206
+
+
+class WikimediaBackend(HttpBackend):
+    """Resolve Wikipedia articles and File: pages to their original image."""
+
+    def _api(self, host, **params):
+        query = urllib.parse.urlencode({"action": "query", "format": "json", "redirects": 1, **params})
+        try:
+            with urllib.request.urlopen(_request(f"https://{host}/w/api.php?{query}"), timeout=self.timeout) as r:
+                pages = json.load(r).get("query", {}).get("pages", {})
+        except (urllib.error.URLError, OSError, ValueError) as exc:
+            raise MirrorError(f"{host} API: {getattr(exc, 'reason', exc)}") from exc
+        return next(iter(pages.values()), {})
+
+    def resolve(self, painting):
+        parts = urllib.parse.urlsplit(painting.url)
+        title = urllib.parse.unquote(parts.path.rsplit("/wiki/", 1)[-1])
+        if not title.startswith("File:"):
+            # Article page: use its lead image
+            page = self._api(parts.netloc, titles=title, prop="pageimages", piprop="name")
+            if "pageimage" not in page:
+                raise MirrorError(f"#{painting.num}: no lead image on {painting.url}")
+            title = "File:" + page["pageimage"]
+        page = self._api(parts.netloc, titles=title, prop="imageinfo", iiprop="url|size|extmetadata")
+        info = (page.get("imageinfo") or [None])[0]
+        if not info:
+            raise MirrorError(f"#{painting.num}: no file info for {title}")
+        license_name = info.get("extmetadata", {}).get("LicenseShortName", {}).get("value")
+        return {"url": info["url"], "license": license_name, "width": info.get("width"), "height": info.get("height")}
+
+
+def expected_size(response, resumed, offset):
+    """Size the finished file should have (Content-Range total, or offset + Content-Length); None if unknown."""
+    if resumed:
+        match = _CONTENT_RANGE_RE.match(response.headers.get("Content-Range", ""))
+        if match:
+            return int(match.group(3)) if match.group(3) != "*" else int(match.group(2)) + 1
+    length = response.headers.get("Content-Length", "")
+    return (offset if resumed else 0) + int(length) if length.isdigit() else None
+
+
+def image_size(path):
+    """(width, height) via Pillow when installed, else (None, None)."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None, None
+    try:
+        with Image.open(path) as im:
+            return im.size
+    except OSError:
+        return None, None
+
+
+class Mirror:
+    def __init__(self, backend, root=MIRROR_DIR, workers=8, limiter=None):
+        self.backend = backend
+        self.root = root
+        self.workers = workers
+        self.limiter = limiter or HostLimiter(per_host=4, interval=0.1)
+        self.index_path = root / "index.json"
+        self.index = load_json(self.index_path, {})
+        self._lock = threading.Lock()
+        # One download per resolved URL at a time; paintings may share a file
+        self._url_locks = defaultdict(threading.Lock)
+
+    def object_path(self, digest, suffix):
+        return self.root / "objects" / digest[:2] / f"{digest}{suffix}"
+
+    def is_current(self, painting):
+        entry = self.index.get(str(painting.num))
+        return bool(entry and entry.get("source_url") == painting.url and entry.get("path")
+                    and (self.root / entry["path"]).exists())
+
+    def sync(self, paintings, progress=print):
+        """Mirror every painting not already current; returns (fetched, failures)."""
+        pending = [p for p in paintings if not self.is_current(p)]
+        fetched, failures = [], {}
+        if not pending:
+            return fetched, failures
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self._fetch, p): p for p in pending}
+            for future in as_completed(futures):
+                painting = futures[future]
+                try:
+                    entry = future.result()
+                except MirrorError as exc:
+                    failures[painting.num] = str(exc)
+                    progress(f"  ✗ #{painting.num} {exc}")
+                    continue
+                fetched.append(painting.num)
+                progress(f"  ✓ #{painting.num} {entry['bytes']:,} bytes")
+                # Persist as we go so an interrupted run keeps finished items
+                self._save()
+        self._save()
+        return fetched, failures
+
+    def _save(self):
+        with self._lock:
+            save_json(self.index_path, self.index, indent=1)
+
+    def _set_entry(self, num, entry):
+        with self._lock:
+            self.index[str(num)] = entry
+
+    def _completed(self, url):
+        """An existing finished entry for ``url``, if its object is on disk."""
+        with self._lock:
+            for entry in self.index.values():
+                if entry.get("resolved_url") == url and entry.get("path") and (self.root / entry["path"]).exists():
+                    return entry
+        return None
+
+    def _fetch(self, painting):
+        with self._lock:
+            entry = dict(self.index.get(str(painting.num)) or {})
+        if entry.get("source_url") != painting.url or "resolved_url" not in entry:
+            with self.limiter.slot(urllib.parse.urlsplit(painting.url).netloc):
+                resolved = self.backend.resolve(painting)
+            entry = {"source_url": painting.url, "resolved_url": resolved["url"],
+                     "license": resolved["license"], "width": resolved["width"], "height": resolved["height"]}
+            # Remember the resolution so a resumed run skips straight to the bytes
+            self._set_entry(painting.num, entry)
+
+        url = entry["resolved_url"]
+        with self._url_locks[url]:
+            done = self._completed(url)
+            if done:
+                entry.update({k: done[k] for k in ("sha256", "path", "bytes", "format", "width", "height", "fetched_at")})
+            else:
+                self._download(url, entry)
+        self._set_entry(painting.num, entry)
+        return entry
+
+    def _download(self, url, entry):
+        partial = self.root / "partial" / (hashlib.sha1(url.encode("utf-8")).hexdigest() + ".part")
+        partial.parent.mkdir(parents=True, exist_ok=True)
+        offset = partial.stat().st_size if partial.exists() else 0
+        with self.limiter.slot(urllib.parse.urlsplit(url).netloc):
+            response, resumed = self.backend.open(url, offset)
+        if response is not None:
+            expected = expected_size(response, resumed, offset)
+            try:
+                with response, open(partial, "ab" if resumed else "wb") as out:
+                    for chunk in iter(lambda: response.read(CHUNK), b""):
+                        out.write(chunk)
+            except (OSError, http.client.HTTPException) as exc:
+                # Keep the partial file; the next run resumes from its length
+                raise MirrorError(f"{url}: interrupted after {partial.stat().st_size:,} bytes ({exc!r})") from exc
+            received = partial.stat().st_size
+            if expected is not None and received > expected:
+                # More than the file holds: the partial is from another version, start over
+                partial.unlink()
+                raise MirrorError(f"{url}: got {received:,} bytes, expected {expected:,}; restarting next run")
+            if expected is not None and received < expected:
+                # The server closed the connection early; resume next run
+                raise MirrorError(f"{url}: interrupted after {received:,} of {expected:,} bytes")
+
+        digest = hashlib.sha256()
+        with open(partial, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK), b""):
+                digest.update(chunk)
+        suffix = os.path.splitext(urllib.parse.urlsplit(url).path)[1].lower() or ".bin"
+        target = self.object_path(digest.hexdigest(), suffix)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(partial, target)
+
+        width, height = image_size(target)
+        entry.update({
+            "sha256": digest.hexdigest(),
+            "path": target.relative_to(self.root).as_posix(),
+            "bytes": target.stat().st_size,
+            "format": suffix.lstrip("."),
+            "width": width or entry.get("width"),
+            "height": height or entry.get("height"),
+            "fetched_at": time.time(),
+        })
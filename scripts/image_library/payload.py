@@ -0,0 +1,173 @@
+"""Model the image bytes each page type pulls, per breakpoint and per series.
+
+A page template is a list of ``Slot``s: which Image Size Specs variant an
+image is at each breakpoint, and how many of them the page shows. A count is
+a fixed number, a module type ("vocab": one Word Study Card per vocab module
+of the day), "days" (one card per day of the series) or "series" (one card
+per series). Every raster image also carries a BlurHash / LQIP placeholder
+inline. Breakpoints fetch the spec's @2x (mobile, tablet) or @1x (desktop)
+rendition.
+
+Each (variant, scale) has three costs:
+- expected: the mean size of the files in the asset manifest that
+  image_library.budgets maps to it. Variants with no files yet fall back
+  to their budget.
+- budget: the Max File Size budget.
+- worst: the larger of the budget and the largest such file.
+
+Page-type rows use the mean module counts over every day in
+content/series-json for the expected and budget figures. The worst case uses
+the largest counts. A page whose expected bytes exceed its budget is a
+payload regression. Series totals add up every day's devotional page plus the
+series page, with each day's real module counts.
+
+Transfer time is estimated at THREE_G_BPS, Lighthouse's simulated mobile
+(slow 4G / fast 3G) throughput.
+"""
+
+import json
+from collections import Counter, namedtuple
+from statistics import mean
+
+from image_library import budgets
+from image_library.cache import cache_path
+from image_library.scripture import SERIES_DIR
+from image_library.styles import STATUS_BAD, STATUS_OK
+
+REPORT_FILE = cache_path("payload-report.json")
+
+# Breakpoint -> spec scale it fetches (device pixel ratio)
+BREAKPOINTS = {"mobile": 2, "tablet": 2, "desktop": 1}
+THREE_G_BPS = 1.6e6 / 8
+PLACEHOLDER = "placeholder-blurhash-lqip"
+
+# Budget column values on the Page Payload sheet
+WITHIN, OVER = "Within budget", "Over budget"
+STATUS_STYLES = {WITHIN: STATUS_OK, OVER: STATUS_BAD}
+
+# specs: spec slug, or {breakpoint: slug}; count: int, module type, "days" or "series"
+Slot = namedtuple("Slot", "name specs count")
+# expected / budget / worst: bytes per image; files: manifest files measured for expected
+Cost = namedtuple("Cost", "expected budget worst files")
+
+HERO = {"mobile": "hero-mobile", "tablet": "hero-tablet", "desktop": "hero-desktop"}
+PAGE_TEMPLATES = {
+    "Devotional day": (
+        Slot("Hero", HERO, 1),
+        Slot("Artwork", "inline-full-width", 1),
+        Slot("Word study cards", "inline-word-study-card", "vocab"),
+        Slot("Profile cards", "inline-profile-card", "profile"),
+        Slot("Scripture blocks", "inline-scripture-block", "scripture"),
+    ),
+    "Series overview": (
+        Slot("Hero", HERO, 1),
+        Slot("Day cards", "card-medium-square", "days"),
+    ),
+    "Browse series": (
+        Slot("Series cards", "card-large", "series"),
+    ),
+}
+DAY_PAGE, SERIES_PAGE = "Devotional day", "Series overview"
+
+
+def series_days(series_dir=SERIES_DIR):
+    """[(series id, [Counter of module types per day])] for every series file."""
+    out = []
+    for path in sorted(series_dir.glob("*.json")):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        series = data.get("series") if isinstance(data.get("series"), dict) else {}
+        days = data.get("days") or [data]
+        counts = [Counter(m.get("type") for m in day.get("modules", ()) if isinstance(m, dict)) for day in days]
+        out.append((series.get("id") or data.get("slug") or path.stem, counts))
+    return out
+
+
+def costs(manifest, spec_budgets=None):
+    """(spec slug, scale) -> Cost for every budgeted variant at both scales."""
+    spec_budgets = budgets.load_budgets() if spec_budgets is None else spec_budgets
+    measured = {}
+    for rel, asset in manifest.items():
+        if rel.startswith("images/"):
+            mapped = budgets.classify(rel[len("images/"):])
+            if mapped:
+                measured.setdefault(mapped, []).append(asset.size)
+    out = {}
+    for name, budget in spec_budgets.items():
+        for scale, limit in ((1, budget.x1), (2, budget.x2)):
+            sizes = measured.get((name, scale), [])
+            out[(name, scale)] = Cost(mean(sizes) if sizes else limit, limit, max(sizes + [limit]), len(sizes))
+    return out
+
+
+def page_cost(template, counts, breakpoint, variant_costs):
+    """(images, expected, budget, worst bytes) for one page; ``counts`` resolves the slot counts."""
+    scale = BREAKPOINTS[breakpoint]
+    images, total = 0, Cost(0, 0, 0, 0)
+    for slot in template:
+        n = slot.count if isinstance(slot.count, int) else counts.get(slot.count, 0)
+        name = slot.specs[breakpoint] if isinstance(slot.specs, dict) else slot.specs
+        try:
+            cost = variant_costs[(name, scale)]
+        except KeyError:
+            raise ValueError(f"Page slot {slot.name!r} uses {name!r}, which has no Max File Size budget") from None
+        images += n
+        total = Cost(*(t + n * c for t, c in zip(total, cost)))
+    placeholder = variant_costs[(PLACEHOLDER, 1)]
+    return (images,) + tuple(t + images * c for t, c in zip(total[:3], placeholder[:3]))
+
+
+def _page_counts(series):
+    """(mean counts, max counts) per page template over every series and day."""
+    days = [day for _, series_counts in series for day in series_counts]
+    keys = {key for day in days for key in day}
+    day_mean = {key: mean(day.get(key, 0) for day in days) for key in keys}
+    day_max = {key: max(day.get(key, 0) for day in days) for key in keys}
+    lengths = [len(series_counts) for _, series_counts in series]
+    return {
+        DAY_PAGE: (day_mean, day_max),
+        SERIES_PAGE: ({"days": mean(lengths)}, {"days": max(lengths)}),
+        "Browse series": ({"series": len(series)},) * 2,
+    }
+
+
+def _bytes(expected, budget, worst):
+    return {"expected": round(expected), "budget": round(budget), "worst": round(worst),
+            "seconds_3g": round(expected / THREE_G_BPS, 2)}
+
+
+def over_budget(report):
+    """Page and series rows whose expected bytes exceed their budget."""
+    rows = [row for row in report["pages"] if row["expected"] > row["budget"]]
+    rows += [{"series": row["series"], "breakpoint": breakpoint, **totals}
+             for row in report["series"] for breakpoint, totals in row["breakpoints"].items()
+             if totals["expected"] > totals["budget"]]
+    return rows
+
+
+def analyse(manifest, series_dir=SERIES_DIR, spec_budgets=None):
+    """JSON-ready report: per page type and breakpoint, then per series, in bytes."""
+    variant_costs = costs(manifest, spec_budgets)
+    series = series_days(series_dir)
+    pages = []
+    for page, (typical, largest) in _page_counts(series).items():
+        template = PAGE_TEMPLATES[page]
+        for breakpoint in BREAKPOINTS:
+            images, expected, budget, _ = page_cost(template, typical, breakpoint, variant_costs)
+            worst = page_cost(template, largest, breakpoint, variant_costs)[3]
+            pages.append({"page": page, "breakpoint": breakpoint, "images": round(images, 1),
+                          **_bytes(expected, budget, worst)})
+    series_rows = []
+    for series_id, days in series:
+        totals = {}
+        for breakpoint in BREAKPOINTS:
+            day_pages = [page_cost(PAGE_TEMPLATES[DAY_PAGE], day, breakpoint, variant_costs) for day in days]
+            overview = page_cost(PAGE_TEMPLATES[SERIES_PAGE], {"days": len(days)}, breakpoint, variant_costs)
+            images, expected, budget, worst = (sum(column) for column in zip(overview, *day_pages))
+            totals[breakpoint] = {"images": images, **_bytes(expected, budget, worst)}
+        series_rows.append({"series": series_id, "pages": len(days) + 1, "breakpoints": totals})
+    return {
+        "pages": pages,
+        "series": series_rows,
+        "variants": {f"{name}@{scale}x": cost._asdict() for (name, scale), cost in sorted(variant_costs.items())},
+    }
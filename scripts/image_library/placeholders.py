@@ -0,0 +1,194 @@
+"""BlurHash strings and tiny base64 LQIPs for every image under public/images.
+
+Size and byte limits come from the "Placeholder / BlurHash / LQIP" spec row
+(32 x 32, <1KB). Each image is shrunk to that box once; the BlurHash DCT is
+then a pair of matrix products over the whole array (``blurhash``) rather
+than a per-pixel loop, and the same thumbnail is encoded as a WebP data URI
+that is stepped down in quality, then halved in size, until the URI (base64
+and prefix included) fits the byte budget. ``over_budget`` lists any that
+still miss it.
+
+Results are cached by content hash in ``.cache/image-library/placeholders.json``
+(with a size/mtime shortcut per path), so only new or changed files are
+decoded. Pillow and NumPy are required.
+"""
+
+import base64
+import io
+from concurrent.futures import ProcessPoolExecutor
+
+from image_library import REPO_ROOT, catalog
+from image_library.budgets import parse_budget
+from image_library.cache import cache_path, file_sha256, load_json, save_json
+from image_library.specs import parse_size, spec_slug
+
+INDEX_FILE = REPO_ROOT / "src" / "data" / "image-placeholders.json"
+CACHE_FILE = cache_path("placeholders.json")
+SPEC_SLUG = "placeholder-blurhash-lqip"
+LQIP_QUALITIES = (50, 35, 20, 10)
+# Smallest long side an LQIP is halved down to before giving up on the budget
+LQIP_MIN_SIDE = 8
+# Bump when cached entries would now be encoded differently
+# (2: limit applies to the data URI; 3: halve the thumbnail when no quality fits)
+CACHE_VERSION = 3
+
+_BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+def placeholder_spec(specs=None):
+    """(thumbnail box, byte limit) from the placeholder spec row."""
+    specs = catalog.load("size_specs") if specs is None else specs
+    spec = next(s for s in specs if spec_slug(s) == SPEC_SLUG)
+    return parse_size(spec.dimensions), parse_budget(spec.max_file_size)[0]
+
+
+def _base83(value, length):
+    return "".join(_BASE83[value // 83 ** (length - i - 1) % 83] for i in range(length))
+
+
+def _linear(srgb):
+    """sRGB 0-255 -> linear light, element-wise over the whole array."""
+    import numpy as np
+
+    v = srgb / 255.0
+    return np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+
+
+def _srgb(linear):
+    v = min(max(linear, 0.0), 1.0)
+    return int(round((v * 12.92 if v <= 0.0031308 else 1.055 * v ** (1 / 2.4) - 0.055) * 255))
+
+
+def _sign_pow(value, exp):
+    return abs(value) ** exp * (1 if value >= 0 else -1)
+
+
+def blurhash(pixels, components_x=4, components_y=3):
+    """BlurHash of an (h, w, 3) uint8 array.
+
+    The basis factors for all components are computed at once:
+    ``F[j, i] = norm * Σ_y Σ_x cos(πjy/h) cos(πix/w) · linear[y, x]``, i.e.
+    ``Cy @ linear @ Cxᵀ`` per channel.
+    """
+    import numpy as np
+
+    height, width = pixels.shape[:2]
+    linear = _linear(pixels[..., :3].astype(np.float64))
+    cos_x = np.cos(np.pi * np.outer(np.arange(components_x), np.arange(width)) / width)
+    cos_y = np.cos(np.pi * np.outer(np.arange(components_y), np.arange(height)) / height)
+    factors = np.einsum("jy,yxc,ix->jic", cos_y, linear, cos_x) / (width * height)
+    factors[1:, :] *= 2
+    factors[0, 1:] *= 2
+    factors = factors.reshape(-1, 3)  # row-major: j outer, i inner, as the format expects
+
+    dc, ac = factors[0], factors[1:]
+    result = _base83((components_x - 1) + (components_y - 1) * 9, 1)
+    if len(ac):
+        actual_max = float(np.abs(ac).max())
+        quantised_max = int(max(0, min(82, np.floor(actual_max * 166 - 0.5))))
+        max_value = (quantised_max + 1) / 166
+        result += _base83(quantised_max, 1)
+    else:
+        max_value = 1.0
+        result += _base83(0, 1)
+    result += _base83((_srgb(dc[0]) << 16) + (_srgb(dc[1]) << 8) + _srgb(dc[2]), 4)
+    for r, g, b in ac:
+        quant = [int(max(0, min(18, np.floor(_sign_pow(c / max_value, 0.5) * 9 + 9.5)))) for c in (r, g, b)]
+        result += _base83(quant[0] * 19 * 19 + quant[1] * 19 + quant[2], 2)
+    return result
+
+
+def _thumbnail(src, box):
+    from PIL import Image, ImageOps
+
+    with Image.open(src) as im:
+        im.draft("RGB", box)  # JPEG decoders can skip straight to a reduced scale
+        im = ImageOps.exif_transpose(im)
+        size = im.size
+        im = im.convert("RGB")
+        im.thumbnail(box, Image.LANCZOS, reducing_gap=2.0)
+        return im, size
+
+
+def _lqip(thumb, limit):
+    """WebP data URI whose length (what gets inlined) fits ``limit``.
+
+    Quality steps down first; when even the lowest is too big the thumbnail is
+    halved and the qualities tried again, down to ``LQIP_MIN_SIDE``. If nothing
+    fits, the last (smallest) URI is returned and ``over_budget`` reports it.
+    """
+    from PIL import Image
+
+    while True:
+        for quality in LQIP_QUALITIES:
+            buf = io.BytesIO()
+            thumb.save(buf, format="WEBP", quality=quality, method=6)
+            uri = "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+            if len(uri) <= limit:
+                return uri
+        if max(thumb.size) // 2 < LQIP_MIN_SIDE:
+            return uri
+        thumb = thumb.resize((max(1, thumb.width // 2), max(1, thumb.height // 2)), Image.LANCZOS)
+
+
+def encode(job):
+    """Worker: (rel, digest, placeholder entry) for one source file."""
+    import numpy as np
+
+    src, rel, box, limit, previous = job
+    digest = file_sha256(src)
+    if digest == previous:
+        # Touched but identical: keep the cached entry
+        return rel, digest, None
+    thumb, (width, height) = _thumbnail(src, box)
+    components = (4, 3) if width >= height else (3, 4)
+    return rel, digest, {
+        "width": width,
+        "height": height,
+        "blurhash": blurhash(np.asarray(thumb), *components),
+        "lqip": _lqip(thumb, limit),
+    }
+
+
+def over_budget(index, limit=None):
+    """{URL path: data URI length} for LQIPs that still exceed the byte limit."""
+    limit = placeholder_spec()[1] if limit is None else limit
+    return {path: len(entry["lqip"]) for path, entry in index.items() if len(entry["lqip"]) > limit}
+
+
+def build(sources, root, workers=None, force=False, cache_file=CACHE_FILE, progress=print):
+    """Placeholder entries keyed by public URL path (``/images/…``)."""
+    cache = {} if force else load_json(cache_file, {})
+    if cache.get("version") != CACHE_VERSION:
+        cache = {"version": CACHE_VERSION, "paths": cache.get("paths", {})}
+    paths, by_hash = cache.setdefault("paths", {}), cache.setdefault("hashes", {})
+    box, limit = placeholder_spec()
+    jobs, stats = [], {}
+    for src in sources:
+        rel = src.relative_to(root).as_posix()
+        st = src.stat()
+        stats[rel] = (st.st_size, st.st_mtime_ns)
+        known = paths.get(rel)
+        if known and tuple(known[:2]) == stats[rel] and known[2] in by_hash:
+            continue
+        jobs.append((src, rel, box, limit, known[2] if known and known[2] in by_hash else None))
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for done, (rel, digest, entry) in enumerate(pool.map(encode, jobs, chunksize=16), 1):
+                paths[rel] = [*stats[rel], digest]
+                if entry is not None:
+                    by_hash[digest] = entry
+                if done % 200 == 0:
+                    progress(f"  {done}/{len(jobs)}")
+
+    # Drop paths that vanished and hashes no longer referenced
+    cache["paths"] = {rel: paths[rel] for rel in stats}
+    live = {entry[2] for entry in cache["paths"].values()}
+    cache["hashes"] = {digest: entry for digest, entry in by_hash.items() if digest in live}
+    save_json(cache_file, cache)
+
+    public, root = REPO_ROOT / "public", root.resolve()
+    prefix = "/" + root.relative_to(public).as_posix() if root.is_relative_to(public) else ""
+    index = {f"{prefix}/{rel}": cache["hashes"][cache["paths"][rel][2]] for rel in sorted(stats)}
+    return index, len(jobs)
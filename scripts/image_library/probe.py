@@ -0,0 +1,145 @@
+"""Read image dimensions from container headers without decoding pixels.
+
+``probe`` opens a file, reads a few dozen bytes (JPEG: a seek per marker
+segment up to the first SOFn) and returns width, height, format and whether
+the image can carry alpha:
+
+* PNG   IHDR, plus a tRNS chunk before the first IDAT
+* JPEG  the SOF0-SOF15 frame header (EXIF orientation is not applied)
+* WebP  VP8 (lossy), VP8L (lossless) and VP8X (extended) chunks
+* GIF   logical screen descriptor
+* ICO   the largest directory entry
+* SVG   ``width``/``height`` in px, else the ``viewBox``
+
+Unknown or truncated files give None, so callers can fall back to Pillow.
+"""
+
+import re
+import struct
+from collections import namedtuple
+
+ImageInfo = namedtuple("ImageInfo", "width height format alpha")
+
+SVG_HEAD = 8192
+_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+_SVG_TAG_RE = re.compile(rb"<svg\b([^>]*)>", re.S | re.I)
+_SVG_ATTR_RE = re.compile(rb'([\w:-]+)\s*=\s*["\']([^"\']*)["\']')
+_SVG_LENGTH_RE = re.compile(r"^\s*([\d.]+)\s*(px)?\s*$")
+
+
+def _png(f, head):
+    width, height = struct.unpack(">II", head[16:24])
+    alpha = head[25] in (4, 6)
+    if not alpha:
+        # Palette / grey / RGB images get alpha from a tRNS chunk, which
+        # must precede the first IDAT
+        f.seek(8)
+        while True:
+            chunk = f.read(8)
+            if len(chunk) < 8:
+                break
+            length, kind = struct.unpack(">I4s", chunk)
+            if kind in (b"tRNS", b"IDAT"):
+                alpha = kind == b"tRNS"
+                break
+            f.seek(length + 4, 1)
+    return ImageInfo(width, height, "png", alpha)
+
+
+def _jpeg(f):
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        if code == 0xFF:  # fill byte before the real marker
+            f.seek(-1, 1)
+            continue
+        if code in (0x01, 0xD8) or 0xD0 <= code <= 0xD7:  # standalone markers
+            continue
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack(">H", length_bytes)[0]
+        if code in _SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack(">xHH", frame)
+            return ImageInfo(width, height, "jpeg", False)
+        f.seek(length - 2, 1)
+
+
+def _webp(head):
+    kind = head[12:16]
+    if kind == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", head[26:30])
+        return ImageInfo(width & 0x3FFF, height & 0x3FFF, "webp", False)
+    if kind == b"VP8L" and head[20] == 0x2F:
+        bits = int.from_bytes(head[21:25], "little")
+        return ImageInfo((bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1, "webp", bool(bits >> 28 & 1))
+    if kind == b"VP8X":
+        width = int.from_bytes(head[24:27], "little") + 1
+        height = int.from_bytes(head[27:30], "little") + 1
+        return ImageInfo(width, height, "webp", bool(head[20] & 0x10))
+    return None
+
+
+def _ico(f, head):
+    count = struct.unpack("<H", head[4:6])[0]
+    entries = head[6:6 + 16 * count]
+    if len(entries) < 16 * count:
+        entries += f.read(16 * count - len(entries))
+    sizes = [(entries[i] or 256, entries[i + 1] or 256) for i in range(0, len(entries) - 15, 16)]
+    if not sizes:
+        return None
+    width, height = max(sizes)
+    return ImageInfo(width, height, "ico", True)
+
+
+def _svg_length(value):
+    match = _SVG_LENGTH_RE.match(value or "")
+    return float(match.group(1)) if match else None
+
+
+def _svg(f, head):
+    head += f.read(SVG_HEAD - len(head))
+    tag = _SVG_TAG_RE.search(head)
+    if not tag:
+        return None
+    attrs = {k.decode("ascii", "replace").lower(): v.decode("utf-8", "replace")
+             for k, v in _SVG_ATTR_RE.findall(tag.group(1))}
+    width, height = _svg_length(attrs.get("width")), _svg_length(attrs.get("height"))
+    if not (width and height):
+        box = re.split(r"[\s,]+", attrs.get("viewbox", "").strip())
+        if len(box) != 4:
+            return None
+        try:
+            width, height = float(box[2]), float(box[3])
+        except ValueError:
+            return None
+    return ImageInfo(round(width), round(height), "svg", True)
+
+
+def probe(path):
+    """ImageInfo for ``path``, or None when the format is unknown or the header is cut short."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(32)
+            if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+                return _png(f, head)
+            if head.startswith(b"\xff\xd8"):
+                return _jpeg(f)
+            if head[:4] == b"RIFF" and head[8:12] == b"WEBP" and len(head) >= 30:
+                return _webp(head)
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+                width, height = struct.unpack("<HH", head[6:10])
+                return ImageInfo(width, height, "gif", None)
+            if head[:4] == b"\x00\x00\x01\x00":
+                return _ico(f, head)
+            if b"<svg" in head or head.lstrip().startswith((b"<?xml", b"<!--", b"<!DOCTYPE")):
+                return _svg(f, head)
+    except (OSError, struct.error, IndexError):
+        return None
+    return None
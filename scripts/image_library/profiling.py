@@ -0,0 +1,172 @@
+"""Opt-in per-stage instrumentation for the workbook scripts.
+
+Scripts wrap their phases in ``stage`` and report work done with ``count``::
+
+    with profiling.stage("sheet", sheet=sheet.title):
+        cells, styles = write_sheet(ws, sheet)
+        profiling.count(cells=cells, styles=styles)
+
+Nothing is recorded until ``configure`` is given a report path (the
+``--profile`` flag) or finds ``IMAGE_LIBRARY_PROFILE`` in the environment.
+Until then ``stage`` hands back one shared null context and ``count`` returns
+at once, so the calls can stay on the production path.
+
+When enabled, each stage records wall time, CPU time, its counters (which
+roll up into the enclosing stage) and, via tracemalloc, the peak memory
+allocated above what was live when it started. (tracemalloc slows
+allocation-heavy code, so compare profiled timings with each other rather
+than with unprofiled runs.) ``cprofile`` (``--cprofile``
+or ``IMAGE_LIBRARY_PROFILE_CPROFILE=1``) also runs each top-level stage
+under cProfile. Only the slowest stage's profile is kept: it is written next to
+the report as ``.pstats`` (open it with snakeviz or flameprof for a flame
+graph) and its top functions are listed in the report.
+
+Work done in another process can't be traced from here; the worker times
+itself and the parent logs the result with ``record`` (wall/CPU and counters,
+no allocation peak).
+
+The JSON report is written when the process exits.
+"""
+
+import atexit
+import contextlib
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ENV_REPORT = "IMAGE_LIBRARY_PROFILE"
+ENV_CPROFILE = "IMAGE_LIBRARY_PROFILE_CPROFILE"
+TOP_FUNCTIONS = 25
+
+_NULL = contextlib.nullcontext()
+_active = None
+
+
+class Profiler:
+    """Collects stage records for one process and writes them as JSON at exit."""
+
+    def __init__(self, report, cprofile=False):
+        self.report = Path(report)
+        self.cprofile = cprofile
+        self.records = []
+        self.open = []
+        self.profiles = {}
+        self.wall, self.cpu = time.perf_counter(), time.process_time()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _touch_peaks(self):
+        _, peak = tracemalloc.get_traced_memory()
+        for record in self.open:
+            record["_peak"] = max(record["_peak"], peak)
+
+    @contextlib.contextmanager
+    def stage(self, name, **tags):
+        self._touch_peaks()
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        path = "/".join([r["stage"] for r in self.open[-1:]] + [name])
+        record = {"stage": path, **tags, "counts": {}, "_start": current, "_peak": current}
+        profile = cProfile.Profile() if self.cprofile and not self.open else None
+        self.open.append(record)
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profile:
+            profile.enable()
+        try:
+            yield record
+        finally:
+            if profile:
+                profile.disable()
+            record["wall"] = round(time.perf_counter() - wall, 6)
+            record["cpu"] = round(time.process_time() - cpu, 6)
+            self._touch_peaks()
+            self.open.pop()
+            record["alloc_peak"] = record.pop("_peak") - record.pop("_start")
+            if self.open:
+                counts = self.open[-1]["counts"]
+                for key, value in record["counts"].items():
+                    counts[key] = counts.get(key, 0) + value
+            if profile:
+                self.profiles[len(self.records)] = profile
+            self.records.append(record)
+
+    def record(self, name, wall, cpu, counts, tags):
+        path = "/".join([r["stage"] for r in self.open[-1:]] + [name])
+        if self.open:
+            totals = self.open[-1]["counts"]
+            for key, value in counts.items():
+                totals[key] = totals.get(key, 0) + value
+        self.records.append({"stage": path, **tags, "counts": dict(counts), "wall": round(wall, 6),
+                             "cpu": round(cpu, 6), "alloc_peak": None})
+
+    def count(self, **counts):
+        if self.open:
+            totals = self.open[-1]["counts"]
+            for key, value in counts.items():
+                totals[key] = totals.get(key, 0) + value
+
+    def _cprofile_summary(self):
+        if not self.profiles:
+            return None
+        hottest = max(self.profiles, key=lambda i: self.records[i]["wall"])
+        path = self.report.with_suffix(".pstats")
+        self.profiles[hottest].dump_stats(path)
+        out = io.StringIO()
+        stats = pstats.Stats(self.profiles[hottest], stream=out)
+        top = []
+        for func, (_, calls, tottime, cumtime, _) in sorted(stats.stats.items(), key=lambda item: -item[1][3])[
+                :TOP_FUNCTIONS]:
+            top.append({"function": pstats.func_std_string(func), "calls": calls,
+                        "tottime": round(tottime, 6), "cumtime": round(cumtime, 6)})
+        return {"stage": self.records[hottest]["stage"], "pstats": str(path), "top": top}
+
+    def write(self):
+        report = {
+            "script": Path(sys.argv[0]).name,
+            "argv": sys.argv[1:],
+            "python": sys.version.split()[0],
+            "wall": round(time.perf_counter() - self.wall, 6),
+            "cpu": round(time.process_time() - self.cpu, 6),
+            "alloc_peak": tracemalloc.get_traced_memory()[1],
+            "stages": self.records,
+            "cprofile": self._cprofile_summary(),
+        }
+        self.report.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Profile: {self.report}", file=sys.stderr)
+
+
+def configure(report=None, cprofile=False):
+    """Start recording when a report path is given here or in IMAGE_LIBRARY_PROFILE."""
+    global _active
+    report = report or os.environ.get(ENV_REPORT)
+    if report and _active is None:
+        _active = Profiler(report, cprofile or os.environ.get(ENV_CPROFILE) == "1")
+        atexit.register(_active.write)
+    return _active
+
+
+def stage(name, **tags):
+    """Context manager timing one stage; a shared no-op when profiling is off."""
+    if _active is None:
+        return _NULL
+    return _active.stage(name, **tags)
+
+
+def record(name, wall, cpu, counts=None, **tags):
+    """Log a stage timed elsewhere (e.g. in a worker process) under the innermost open stage."""
+    if _active is not None:
+        _active.record(name, wall, cpu, counts or {}, tags)
+
+
+def count(**counts):
+    """Add to the innermost open stage's counters (cells=…, styles=…)."""
+    if _active is not None:
+        _active.count(**counts)
@@ -0,0 +1,178 @@
+"""Render the App Icons & PWA rows (favicons, app icons, splash screens) from one master.
+
+Targets come from the ``pwa_assets`` catalog: every PNG row plus the
+multi-size ``favicon.ico``. SVG and JPEG rows are drawn by hand and skipped.
+How a row is laid out follows from its name and notes:
+
+* square icons      the master scaled to fill the square
+* ``maskable``      the master inside the inner 80% safe zone, on Tehom Black
+* "no transparency" flattened onto Tehom Black (apple-touch-icon)
+* non-square        the master centred on Tehom Black; splash screens at a
+                    quarter of the shorter side, wide tiles at 60%
+
+The master is decoded once and halved repeatedly into a pyramid with
+``Image.reduce`` (a cheap box filter). Each distinct logo size is cut with
+one Lanczos pass from the smallest level that is still at least that big,
+rather than from full resolution. Compositing and PNG encoding run on a
+thread pool (Pillow releases the GIL in both), and files whose bytes are
+unchanged are not rewritten, so their mtimes stay put for the asset
+manifest.
+"""
+
+import io
+import json
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from image_library import REPO_ROOT, catalog
+from image_library.assets import PWA_DIR
+from image_library.specs import parse_size
+from image_library.styles import TEHOM_BLACK
+
+ICONS_DIR = REPO_ROOT / "public" / PWA_DIR
+MANIFEST_PATH = REPO_ROOT / "public" / "manifest.json"
+
+MASKABLE_SAFE_ZONE = 0.8
+SPLASH_LOGO = 0.25
+TILE_LOGO = 0.6
+PNG_OPTIONS = {"optimize": True}
+_ICO_SIZES_RE = re.compile(r"\((\d+(?:\+\d+)+)\)")
+_MANIFEST_ICON_RE = re.compile(r"icon-(\d+)(-maskable)?\.png$")
+
+# logo: fraction of the shorter side the master fills; background: hex or None (keep alpha)
+Icon = namedtuple("Icon", "name width height logo background ico_sizes")
+
+
+def icon_targets(records=None):
+    """Icon per renderable pwa_assets row, in catalog order."""
+    targets = []
+    for r in records if records is not None else catalog.load("pwa_assets"):
+        size = parse_size(r.dimensions)
+        if size is None or r.format not in ("PNG", "ICO"):
+            continue
+        width, height = size
+        logo, background = 1.0, None
+        if "maskable" in r.name:
+            logo, background = MASKABLE_SAFE_ZONE, TEHOM_BLACK
+        elif width != height:
+            logo, background = (SPLASH_LOGO if r.asset_type == "Splash" else TILE_LOGO), TEHOM_BLACK
+        elif "no transparency" in r.notes.lower():
+            background = TEHOM_BLACK
+        ico_sizes = ()
+        if r.format == "ICO":
+            match = _ICO_SIZES_RE.search(r.notes)
+            ico_sizes = tuple(int(n) for n in match.group(1).split("+")) if match else (width,)
+        targets.append(Icon(r.name, width, height, logo, background, ico_sizes))
+    return targets
+
+
+def logo_box(icon):
+    """Longest side of the master's placement in ``icon``, in pixels."""
+    return round(min(icon.width, icon.height) * icon.logo)
+
+
+def pyramid(master, smallest):
+    """[master, master/2, master/4, ...] down to the last level still >= ``smallest``."""
+    levels = [master]
+    while min(levels[-1].size) // 2 >= smallest:
+        levels.append(levels[-1].reduce(2))
+    return levels
+
+
+def scaled(levels, box):
+    """The master fitted inside a ``box`` x ``box`` square, resized from the nearest pyramid level."""
+    from PIL import Image
+
+    width, height = levels[0].size
+    scale = box / max(width, height)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    # Smallest level that still covers the target; the master itself when upscaling
+    source = next((level for level in reversed(levels) if level.size[0] >= size[0] and level.size[1] >= size[1]),
+                  levels[0])
+    return source.resize(size, Image.LANCZOS)
+
+
+def compose(icon, logo):
+    """Place a scaled logo on the icon's canvas; returns an RGB or RGBA image."""
+    from PIL import Image
+
+    if icon.background is None and logo.size == (icon.width, icon.height):
+        return logo
+    canvas = Image.new("RGBA", (icon.width, icon.height), "#" + icon.background if icon.background else (0, 0, 0, 0))
+    canvas.alpha_composite(logo, ((icon.width - logo.width) // 2, (icon.height - logo.height) // 2))
+    return canvas.convert("RGB") if icon.background else canvas
+
+
+def encode(icon, logos):
+    """PNG or ICO bytes for one icon; ``logos`` maps box size -> scaled master."""
+    buf = io.BytesIO()
+    if icon.ico_sizes:
+        frames = [compose(icon._replace(width=s, height=s), logos[round(s * icon.logo)])
+                  for s in sorted(icon.ico_sizes, reverse=True)]
+        # Pillow uses a frame as-is when its size matches one of ``sizes``
+        frames[0].save(buf, format="ICO", sizes=[f.size for f in frames], append_images=frames[1:])
+    else:
+        compose(icon, logos[logo_box(icon)]).save(buf, format="PNG", **PNG_OPTIONS)
+    return buf.getvalue()
+
+
+def _write_if_changed(path, data):
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
+def build(master_path, targets, output_dir=ICONS_DIR, workers=None):
+    """Render every target from ``master_path``; returns [(Icon, bytes, written)]."""
+    from PIL import Image, ImageOps
+
+    with Image.open(master_path) as im:
+        master = ImageOps.exif_transpose(im).convert("RGBA")
+    boxes = {logo_box(t) for t in targets if not t.ico_sizes}
+    boxes |= {round(s * t.logo) for t in targets for s in t.ico_sizes}
+    levels = pyramid(master, min(boxes))
+    logos = {box: scaled(levels, box) for box in boxes}
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def render(icon):
+        data = encode(icon, logos)
+        return icon, data, _write_if_changed(output_dir / icon.name, data)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render, targets))
+
+
+def manifest_icons(targets, prefix=f"/{PWA_DIR}/"):
+    """Web app manifest ``icons`` entries for the icon-NNN / icon-NNN-maskable targets."""
+    entries = []
+    for icon in targets:
+        match = _MANIFEST_ICON_RE.fullmatch(icon.name)
+        if match:
+            entry = {"src": prefix + icon.name, "sizes": f"{icon.width}x{icon.height}", "type": "image/png"}
+            if match.group(2):
+                entry["purpose"] = "maskable"
+            entries.append(entry)
+    return entries
+
+
+def update_manifest(targets, manifest_path=MANIFEST_PATH):
+    """Point public/manifest.json's ``icons`` at the rendered files; True when it changed."""
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    icons = manifest_icons(targets)
+    if manifest.get("icons") == icons:
+        return False
+    manifest["icons"] = icons
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    return True
@@ -0,0 +1,90 @@
+"""Pick the encoder quality that fits a byte budget without visible loss.
+
+AVIF and WebP files grow with the encoder's quality setting, so the highest
+quality under a Max File Size budget is found by bisecting QUALITY_RANGE:
+six or seven trial encodes in memory instead of one fixed guess. The pick
+must also hold a perceptual floor. The decoded trial is compared with the
+image it was encoded from, and their SSIM (luma, 8x8 blocks) must be at
+least MIN_SSIM. When the budget can only be met below the floor, the search
+returns the lowest quality that holds the floor instead, marked as not
+fitting. A budget that is too tight then shows up as an overage rather than
+as a blotchy image.
+
+Pillow (with AVIF support for AVIF targets) and NumPy are required.
+"""
+
+import io
+from collections import namedtuple
+
+# Searched formats and the quality interval bisected for each
+QUALITY_RANGE = {"avif": (20, 90), "webp": (30, 95)}
+MIN_SSIM = 0.92
+SSIM_BLOCK = 8
+
+# data: encoded bytes; fits: within the budget at or above the SSIM floor
+Choice = namedtuple("Choice", "quality data ssim fits")
+
+
+def encode(img, fmt, quality, options=None):
+    """``img`` encoded as ``fmt`` at ``quality``, in memory."""
+    buf = io.BytesIO()
+    img.save(buf, format=fmt.upper(), **{**(options or {}), "quality": quality})
+    return buf.getvalue()
+
+
+def ssim(reference, data, block=SSIM_BLOCK):
+    """Mean SSIM between ``reference`` and the decoded ``data``, over ``block``-pixel luma windows."""
+    import numpy as np
+    from PIL import Image
+
+    def blocks(img):
+        luma = np.asarray(img.convert("L"), np.float64)
+        height, width = luma.shape[0] // block * block, luma.shape[1] // block * block
+        return luma[:height, :width].reshape(height // block, block, width // block, block)
+
+    with Image.open(io.BytesIO(data)) as decoded:
+        x, y = blocks(reference), blocks(decoded)
+    mean_x, mean_y = x.mean(axis=(1, 3)), y.mean(axis=(1, 3))
+    var_x, var_y = x.var(axis=(1, 3)), y.var(axis=(1, 3))
+    cov = (x * y).mean(axis=(1, 3)) - mean_x * mean_y
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    score = (2 * mean_x * mean_y + c1) * (2 * cov + c2) / ((mean_x ** 2 + mean_y ** 2 + c1) * (var_x + var_y + c2))
+    return float(score.mean())
+
+
+def search(img, fmt, budget, options=None, min_ssim=MIN_SSIM):
+    """Choice with the highest quality whose encoding fits ``budget`` bytes and holds ``min_ssim``."""
+    low, high = QUALITY_RANGE[fmt]
+    trials = {}
+
+    def trial(quality):
+        if quality not in trials:
+            trials[quality] = encode(img, fmt, quality, options)
+        return trials[quality]
+
+    best, lo, hi = None, low, high
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if len(trial(mid)) <= budget:
+            best, lo = mid, mid + 1
+        else:
+            hi = mid - 1
+    if best is not None:
+        score = ssim(img, trials[best])
+        if score >= min_ssim:
+            return Choice(best, trials[best], score, True)
+        low = best + 1
+
+    # Over budget either way: the lowest quality that still holds the floor
+    pick, lo, hi = (high, None), low, high
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        score = ssim(img, trial(mid))
+        if score >= min_ssim:
+            pick, hi = (mid, score), mid - 1
+        else:
+            lo = mid + 1
+    quality, score = pick
+    if score is None:
+        score = ssim(img, trial(quality))
+    return Choice(quality, trials[quality], score, False)
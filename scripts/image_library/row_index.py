@@ -0,0 +1,73 @@
+"""Read-only index of the image-number rows in a workbook sheet.
+
+Opening the workbook in read-only mode streams rows straight from the sheet
+XML, so finding which rows hold an image number (column A) costs a fraction
+of a full editable load. The index is persisted as a sidecar next to the
+workbook and reused until the file changes.
+"""
+
+import hashlib
+from collections import namedtuple
+
+from image_library.sidecar import read_sidecar, write_sidecar
+
+# header: row 1 values; rows: image_num -> (row, hash of the tracked columns);
+# category_rows: rows without an image number
+RowIndex = namedtuple("RowIndex", "header rows category_rows")
+
+
+def values_hash(values):
+    joined = "\x1f".join("" if v is None else str(v) for v in values)
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()
+
+
+def scan_rows(wb_path, sheet, tracked_cols):
+    """Build a RowIndex with one streaming pass over ``sheet``.
+
+    ``tracked_cols`` is a (first, last) 1-based column range whose values are
+    hashed per image row so callers can tell which rows need rewriting.
+    """
+    import openpyxl
+
+    first, last = tracked_cols
+    wb = openpyxl.load_workbook(wb_path, read_only=True)
+    try:
+        rows = wb[sheet].iter_rows(max_col=last, values_only=True)
+        header = list(next(rows, ()))
+        index, category_rows = {}, []
+        for row, values in enumerate(rows, 2):
+            values = tuple(values) + (None,) * (last - len(values))
+            num = values[0]
+            if num and isinstance(num, int):
+                index[num] = (row, values_hash(values[first - 1:last]))
+            else:
+                category_rows.append(row)
+    finally:
+        wb.close()
+    return RowIndex(header, index, category_rows)
+
+
+def load_row_index(wb_path, sheet, tracked_cols):
+    """Reuse the sidecar index while the workbook is unchanged, else rescan."""
+    name = _sidecar_name(sheet)
+    cached = read_sidecar(wb_path, name)
+    if cached and cached.get("tracked") == list(tracked_cols):
+        rows = {int(num): tuple(entry) for num, entry in cached["rows"].items()}
+        return RowIndex(cached["header"], rows, cached["category_rows"])
+    index = scan_rows(wb_path, sheet, tracked_cols)
+    save_row_index(wb_path, sheet, tracked_cols, index)
+    return index
+
+
+def save_row_index(wb_path, sheet, tracked_cols, index):
+    """Persist ``index``; call again after saving the workbook."""
+    write_sidecar(wb_path, _sidecar_name(sheet), {
+        "tracked": list(tracked_cols),
+        "header": index.header,
+        "rows": {str(num): list(entry) for num, entry in index.rows.items()},
+        "category_rows": index.category_rows,
+    })
+
+
+def _sidecar_name(sheet):
+    return "index-" + sheet.lower().replace(" ", "-")
@@ -0,0 +1,239 @@
+"""Parse scripture references into verse intervals and match them in one sweep.
+
+``parse_refs("Genesis 2:18, 21-22; 3:1")`` understands full names and
+common abbreviations ("Rev", "2 Cor", "Ps", "Jn", "Song of Songs"), single
+verses, verse ranges, cross-chapter ranges ("John 1:1-2:11"), comma/semicolon
+continuations, and chapter-only references ("Acts 2", "Genesis 1-2").
+
+Each reference becomes a closed integer interval over a single verse
+numbering, ``book * 10^6 + chapter * 10^3 + verse``. A chapter without
+verses spans verses 1-999 of that chapter. Overlap between two references is
+then plain interval overlap.
+
+``match`` pairs two sets of intervals (e.g. every illustration tag against
+every devotional reference) with a sweep line. Both sides are sorted once
+and walked together, and each side keeps a heap of open intervals keyed by
+end. The cost is O((n + m) log(n + m) + matches), so a ten-times larger
+library and catalogue cost roughly ten times as much, not a hundred.
+``overlapping`` answers a single query against a sorted index with two
+bisects.
+"""
+
+import heapq
+import json
+import re
+from bisect import bisect_right
+from collections import namedtuple
+
+from image_library import REPO_ROOT
+
+SERIES_DIR = REPO_ROOT / "content" / "series-json"
+# Fields of the series JSON that hold a citation rather than prose
+REFERENCE_KEYS = {"reference", "anchorVerse", "passage", "scripture", "verse"}
+
+CHAPTER, BOOK = 10 ** 3, 10 ** 6
+WHOLE_CHAPTER = (1, CHAPTER - 1)
+# Obadiah, Philemon, 2 John, 3 John, Jude: "Jude 3" is a verse, not a chapter
+SINGLE_CHAPTER = {31, 57, 63, 64, 65}
+
+# (canonical name, extra abbreviations); unique prefixes of 3+ letters also resolve.
+# Two-letter forms that are English words ("is", "am", "ex") are left out.
+BOOKS = (
+    ("Genesis", "gn gen"), ("Exodus", "exo"), ("Leviticus", "lv lev"), ("Numbers", "nm num"),
+    ("Deuteronomy", "dt deut"), ("Joshua", "josh"), ("Judges", "jdg judg"), ("Ruth", "rth"),
+    ("1 Samuel", "1sa 1sam"), ("2 Samuel", "2sa 2sam"), ("1 Kings", "1ki 1kgs"), ("2 Kings", "2ki 2kgs"),
+    ("1 Chronicles", "1ch 1chr"), ("2 Chronicles", "2ch 2chr"), ("Ezra", "ezr"), ("Nehemiah", "neh"),
+    ("Esther", "est"), ("Job", "jb"), ("Psalms", "ps psa psalm pss"), ("Proverbs", "prov prv"),
+    ("Ecclesiastes", "eccl qoh"), ("Song of Songs", "song sos songofsolomon canticles"),
+    ("Isaiah", "isa"), ("Jeremiah", "jer"), ("Lamentations", "lam"), ("Ezekiel", "ezk ezek"),
+    ("Daniel", "dan"), ("Hosea", "hos"), ("Joel", "jl"), ("Amos", ""), ("Obadiah", "obad"),
+    ("Jonah", "jon"), ("Micah", "mic"), ("Nahum", "nah"), ("Habakkuk", "hab"), ("Zephaniah", "zep zeph"),
+    ("Haggai", "hag"), ("Zechariah", "zec zech"), ("Malachi", "mal"),
+    ("Matthew", "mt matt"), ("Mark", "mk mrk"), ("Luke", "lk luk"), ("John", "jn jhn"), ("Acts", ""),
+    ("Romans", "rom rm"), ("1 Corinthians", "1co 1cor"), ("2 Corinthians", "2co 2cor"),
+    ("Galatians", "gal"), ("Ephesians", "eph"), ("Philippians", "php phil"), ("Colossians", "col"),
+    ("1 Thessalonians", "1th 1thess"), ("2 Thessalonians", "2th 2thess"), ("1 Timothy", "1ti 1tim"),
+    ("2 Timothy", "2ti 2tim"), ("Titus", "tit"), ("Philemon", "phm phlm philem"), ("Hebrews", "heb"),
+    ("James", "jas jm"), ("1 Peter", "1pe 1pet"), ("2 Peter", "2pe 2pet"), ("1 John", "1jn 1jhn"),
+    ("2 John", "2jn 2jhn"), ("3 John", "3jn 3jhn"), ("Jude", "jud"), ("Revelation", "rev rv revelations"),
+)
+
+_VERSE = r"\d+(?::\d+)?[ab]?"
+_SPAN = rf"{_VERSE}(?:\s*[-–—]\s*{_VERSE})?"
+REF_RE = re.compile(
+    # A Roman ordinal needs a space after it, or it would eat the "I" of "Isaiah"
+    r"\b([1-3]\s*|I{1,3}\s+)?(Song\s+of\s+(?:Songs|Solomon)|[A-Za-z]+)\.?\s*"
+    rf"(\d+(?::\d+[ab]?)?(?:\s*[-–—]\s*{_VERSE})?(?:\s*[,;]\s*{_SPAN}(?![\d:]))*)"
+)
+
+# ``start``/``end`` are inclusive verse keys; ``text`` is the citation as written
+Ref = namedtuple("Ref", "start end text")
+
+
+def _key(name):
+    return re.sub(r"[\s.]", "", name.lower())
+
+
+def _book_table():
+    table, names = {}, []
+    for number, (name, abbreviations) in enumerate(BOOKS, 1):
+        table[_key(name)] = number
+        names.append((_key(name), number))
+        for abbreviation in abbreviations.split():
+            table[abbreviation] = number
+    return table, names
+
+
+_BOOK_KEYS, _BOOK_NAMES = _book_table()
+_ROMAN = {"i": "1", "ii": "2", "iii": "3"}
+
+
+def book_number(prefix, name):
+    """1-66 for a book name or abbreviation with its optional ordinal, else None."""
+    ordinal = _ROMAN.get(prefix.strip().lower(), prefix.strip()) if prefix else ""
+    key = ordinal + _key(name)
+    if key in _BOOK_KEYS:
+        return _BOOK_KEYS[key]
+    if len(key) - len(ordinal) >= 3:
+        matches = {number for full, number in _BOOK_NAMES if full.startswith(key)}
+        if len(matches) == 1:
+            return matches.pop()
+    return None
+
+
+def verse_key(book, chapter, verse):
+    return book * BOOK + chapter * CHAPTER + verse
+
+
+_PART_RE = re.compile(rf"({_VERSE})(?:\s*[-–—]\s*({_VERSE}))?")
+
+
+def _point(text):
+    """"3:16a" -> (3, 16); "3" -> (3, None)."""
+    chapter, _, verse = text.rstrip("ab").partition(":")
+    return int(chapter), int(verse) if verse else None
+
+
+def _spans(book, tail):
+    """Verse intervals for the numeric part of a reference ("2:18, 21-22; 3:1")."""
+    spans = []
+    for group in re.split(r"\s*;\s*", tail.strip()):
+        # Set once the group has named a chapter:verse
+        chapter = 1 if book in SINGLE_CHAPTER and ":" not in group else None
+        for part in re.split(r"\s*,\s*", group):
+            first, last = _PART_RE.fullmatch(part).groups()
+            c1, v1 = _point(first)
+            c2, v2 = _point(last) if last else (None, None)
+            if v1 is not None:  # "c:v", "c:v-v", "c:v-c:v"
+                chapter = c1
+                end = (c2, v2) if v2 is not None else (c1, c2 if c2 is not None else v1)
+                spans.append((verse_key(book, c1, v1), verse_key(book, *end)))
+            elif chapter is not None:  # bare numbers after a verse are more verses of that chapter
+                spans.append((verse_key(book, chapter, c1), verse_key(book, chapter, c2 or c1)))
+            else:  # "c", "c-c", "c-c:v"
+                end = (c2, v2) if v2 is not None else (c2 or c1, WHOLE_CHAPTER[1])
+                spans.append((verse_key(book, c1, WHOLE_CHAPTER[0]), verse_key(book, *end)))
+    return [(start, end) for start, end in spans if start <= end]
+
+
+def parse_refs(text):
+    """Every Ref found in ``text``; words that are not book names are ignored."""
+    refs = []
+    for match in REF_RE.finditer(text or ""):
+        book = book_number(match.group(1), match.group(2))
+        if book is None:
+            continue
+        try:
+            spans = _spans(book, match.group(3))
+        except (AttributeError, ValueError):
+            continue
+        refs.extend(Ref(start, end, match.group(0).strip()) for start, end in spans)
+    return refs
+
+
+def format_key(key):
+    book, rest = divmod(key, BOOK)
+    chapter, verse = divmod(rest, CHAPTER)
+    return f"{BOOKS[book - 1][0]} {chapter}:{verse}"
+
+
+def match(left, right):
+    """(left item, right item, overlap in verse keys) for every overlapping pair.
+
+    ``left`` and ``right`` are iterables of (start, end, item). Intervals are
+    swept in start order; each keeps a heap of still-open intervals from its
+    side, so a newly opened interval overlaps exactly the other side's heap
+    once expired entries are popped.
+    """
+    events = sorted([(s, 0, e, item) for s, e, item in left] + [(s, 1, e, item) for s, e, item in right],
+                    key=lambda event: (event[0], event[1]))
+    open_ = ([], [])
+    pairs = []
+    for seq, (start, side, end, item) in enumerate(events):
+        other = open_[1 - side]
+        while other and other[0][0] < start:
+            heapq.heappop(other)
+        for other_end, _, other_item in other:
+            overlap = min(end, other_end) - start + 1
+            pairs.append((item, other_item, overlap) if side == 0 else (other_item, item, overlap))
+        heapq.heappush(open_[side], (end, seq, item))
+    return pairs
+
+
+def sorted_index(intervals):
+    """(starts, intervals, widest span) for ``overlapping``; ``intervals`` are (start, end, item)."""
+    intervals = sorted(intervals, key=lambda interval: interval[0])
+    widest = max((e - s for s, e, _ in intervals), default=0)
+    return [s for s, _, _ in intervals], intervals, widest
+
+
+def overlapping(index, start, end):
+    """Items whose interval overlaps [start, end], via two bisects on the sorted starts."""
+    starts, intervals, widest = index
+    lo = bisect_right(starts, start - widest - 1)
+    hi = bisect_right(starts, end)
+    return [item for s, e, item in intervals[lo:hi] if e >= start]
+
+
+def illustration_refs(records):
+    """(start, end, (image number, citation)) for every reference in the Use Cases / Tags column."""
+    return [(ref.start, ref.end, (r.num, ref.text)) for r in records for ref in parse_refs(r.use_cases)]
+
+
+def _walk(node, found):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key in REFERENCE_KEYS and isinstance(value, str):
+                found.append(value)
+            else:
+                _walk(value, found)
+    elif isinstance(node, list):
+        for value in node:
+            _walk(value, found)
+
+
+def _day_number(day):
+    number = day.get("day", day.get("number", day.get("day_number")))
+    return number.get("number") if isinstance(number, dict) else number
+
+
+def devotional_refs(series_dir=SERIES_DIR):
+    """(start, end, (series id, day number, citation)) for each citation in the series JSON.
+
+    Series files come in a few shapes: a ``days`` list, or a single day at the
+    top level (``day`` + ``modules``). Days whose number is unknown get None.
+    """
+    out = []
+    for path in sorted(series_dir.glob("*.json")):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        series = data.get("series") if isinstance(data.get("series"), dict) else {}
+        series_id = series.get("id") or data.get("slug") or path.stem
+        days = data.get("days") or [{key: value for key, value in data.items() if key != "series"}]
+        for day in days:
+            number = _day_number(day)
+            citations = []
+            _walk(day, citations)
+            for citation in dict.fromkeys(citations):
+                out.extend((ref.start, ref.end, (series_id, number, ref.text)) for ref in parse_refs(citation))
+    return out
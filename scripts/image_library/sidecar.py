@@ -0,0 +1,31 @@
+"""Small JSON state files kept next to the workbook.
+
+A sidecar records the workbook's size and mtime when it was written, so a
+later run can tell whether its contents still describe the file on disk
+without opening the workbook.
+"""
+
+from image_library.cache import load_json, save_json
+
+
+def sidecar_path(wb_path, name):
+    """``content/X.xlsx`` -> ``content/.X.xlsx.<name>.json``."""
+    return wb_path.parent / f".{wb_path.name}.{name}.json"
+
+
+def file_signature(path):
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def read_sidecar(wb_path, name):
+    """Return the sidecar payload if it still matches ``wb_path``, else None."""
+    state = load_json(sidecar_path(wb_path, name), {})
+    if not wb_path.exists() or state.get("workbook") != file_signature(wb_path):
+        return None
+    return state.get("data")
+
+
+def write_sidecar(wb_path, name, data):
+    """Store ``data`` stamped with the workbook's current signature."""
+    save_json(sidecar_path(wb_path, name), {"workbook": file_signature(wb_path), "data": data})
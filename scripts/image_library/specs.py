@@ -0,0 +1,68 @@
+"""Parse the Image Size Specs rows into concrete render targets.
+
+The catalog keeps spec cells as the human-readable strings shown in the
+workbook ("1920 x 1080", "WebP + JPEG", "3840 x 2160" / "N/A"); this module
+turns them into numbers once so build tools do not each re-parse them.
+"""
+
+import re
+from collections import namedtuple
+
+from image_library import catalog
+
+# Sections whose rows describe responsive derivatives of a source image
+DERIVATIVE_SECTIONS = ("HERO IMAGES", "CARD THUMBNAILS", "INLINE CONTENT", "SOCIAL / SEO / SHARE")
+
+# Raster encoders we can produce, keyed by the word used in the Format column
+RASTER_FORMATS = {"webp": "webp", "jpeg": "jpeg", "jpg": "jpeg", "png": "png"}
+
+# spec: the SizeSpec row; name: slug like "hero-desktop"; scale: 1 or 2
+RenderTarget = namedtuple("RenderTarget", "spec name scale width height format")
+
+_SIZE_RE = re.compile(r"(\d+)\s*[x×]\s*(\d+)")
+_RATIO_RE = re.compile(r"(\d+(?:\.\d+)?)\s*:\s*(\d+(?:\.\d+)?)")
+
+
+def parse_size(text):
+    """"1920 x 1080" -> (1920, 1080); anything else (N/A, Scalable) -> None."""
+    match = _SIZE_RE.search(text or "")
+    return (int(match.group(1)), int(match.group(2))) if match else None
+
+
+def parse_ratio(text):
+    """"16:9" -> 1.777…, "~1.91:1" -> 1.91; "Varies" -> None."""
+    match = _RATIO_RE.search(text or "")
+    return float(match.group(1)) / float(match.group(2)) if match else None
+
+
+def parse_formats(text):
+    """"WebP + JPEG" -> ("webp", "jpeg"); vector-only formats are dropped."""
+    words = re.findall(r"[A-Za-z]+", text or "")
+    formats = []
+    for word in words:
+        fmt = RASTER_FORMATS.get(word.lower())
+        if fmt and fmt not in formats:
+            formats.append(fmt)
+    return tuple(formats)
+
+
+def spec_slug(spec):
+    """"Card" + "Medium (Square)" -> "card-medium-square"."""
+    text = f"{spec.image_type} {spec.variant}".lower()
+    return re.sub(r"[^a-z0-9]+", "-", text).strip("-")
+
+
+def render_targets(sections=DERIVATIVE_SECTIONS, specs=None):
+    """Every (variant, scale, format) to render for the given spec sections."""
+    specs = catalog.load("size_specs") if specs is None else specs
+    targets = []
+    for spec in specs:
+        if spec.section not in sections:
+            continue
+        sizes = [(1, parse_size(spec.dimensions)), (2, parse_size(spec.retina))]
+        for scale, size in sizes:
+            if size is None:
+                continue
+            for fmt in parse_formats(spec.format):
+                targets.append(RenderTarget(spec, spec_slug(spec), scale, size[0], size[1], fmt))
+    return targets
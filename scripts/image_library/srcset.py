@@ -0,0 +1,163 @@
+"""Map every source image to its pre-rendered responsive variants.
+
+generate-image-derivatives.py renders each Image Size Specs target into
+public/images/derived/; this module turns its cache into the manifest the
+site reads (``src/data/image-srcset.json``), so pages can serve those static
+files with a correct ``srcset`` / ``sizes`` instead of resizing on demand::
+
+    {"deviceSizes": [750, 1024, …], "imageSizes": [400, 600],
+     "images": {"/images/devotional-prints/<slug>/raw.webp": {
+         "sha256": "…",
+         "variants": {"card-large": {
+             "width": 800, "height": 600, "sizes": "(max-width: 800px) 100vw, 800px",
+             "src": "/images/derived/…/card-large@1x.webp",
+             "srcset": {"image/webp": "/images/derived/…/card-large@1x.webp 800w, …@2x.webp 1600w"},
+             "files": [{"path": "…", "width": 800, "height": 600, "scale": 1, "format": "webp",
+                        "bytes": 48211, "hash": "3f9a…"}, …]}}}}}
+
+``width`` / ``height`` are the @1x (CSS pixel) size, ``src`` the @1x
+fallback in the last listed format (JPEG where the spec has one), and
+``srcset`` one candidate list per MIME type in the spec's format order, ready
+for ``<picture><source type=…>``. Hero rows are full-bleed (``sizes`` 100vw);
+everything else is capped at its @1x width. ``deviceSizes`` / ``imageSizes``
+are the hero and non-hero widths; next.config.ts reads them into ``images``
+when the manifest exists, so the widths next/image asks its loader for are
+exactly the rendered ones.
+
+Only outputs whose spec hash matches the current spec table are listed; a
+variant rendered before its row changed is counted as stale until the
+derivatives are re-run. Every listed file carries a content hash (for cache
+busting). Hashes are cached by size/mtime in ``.cache/image-library/
+srcset.json``, so a rebuild only reads files that were re-rendered.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from image_library import REPO_ROOT, derivatives
+from image_library.cache import cache_path, file_sha256, load_json, save_json
+
+MANIFEST_FILE = REPO_ROOT / "src" / "data" / "image-srcset.json"
+CACHE_FILE = cache_path("srcset.json")
+PUBLIC_DIR = REPO_ROOT / "public"
+
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp", "jpeg": "image/jpeg", "png": "image/png"}
+FULL_WIDTH_SECTIONS = {"HERO IMAGES"}
+HASH_CHARS = 12
+
+
+def url_for(path, public=PUBLIC_DIR):
+    """Public URL of a file under public/ ("/images/…"); other paths stay as given."""
+    path = path.resolve()
+    return "/" + path.relative_to(public.resolve()).as_posix() if path.is_relative_to(public.resolve()) \
+        else path.as_posix()
+
+
+def sizes_for(target):
+    """The ``sizes`` attribute for a variant, from its @1x width."""
+    if target.spec.section in FULL_WIDTH_SECTIONS:
+        return "100vw"
+    return f"(max-width: {target.width}px) 100vw, {target.width}px"
+
+
+def next_sizes(targets):
+    """(deviceSizes, imageSizes) for next.config.ts: full-bleed widths, then the rest."""
+    device = {t.width for t in targets if t.spec.section in FULL_WIDTH_SECTIONS}
+    image = {t.width for t in targets if t.spec.section not in FULL_WIDTH_SECTIONS} - device
+    return sorted(device), sorted(image)
+
+
+def hash_files(paths, cache, workers=16):
+    """{path: (bytes, sha256)}; files whose (size, mtime) match ``cache`` are not re-read.
+
+    Returns the hashes and how many files were read.
+    """
+    stats = {path: path.stat() for path in paths}
+    stale = [path for path, st in stats.items()
+             if tuple(cache.get(str(path), ())[:2]) != (st.st_size, st.st_mtime_ns)]
+    if stale:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for path, digest in zip(stale, pool.map(file_sha256, stale)):
+                cache[str(path)] = [stats[path].st_size, stats[path].st_mtime_ns, digest]
+    return {path: (cache[str(path)][0], cache[str(path)][2]) for path in paths}, len(stale)
+
+
+def _rendered(entry, targets, out_dir):
+    """[(target, path)] for the outputs of one source that match the current specs."""
+    outputs = entry.get("outputs", {})
+    current, stale = [], 0
+    for target in targets:
+        key = derivatives.target_key(target)
+        output = outputs.get(key)
+        if not output or "skipped" in output:
+            continue
+        # Renders with or without --allow-upscale / --fixed-quality are all valid for the target
+        hashes = {derivatives.target_hash(target, upscale, search) for upscale in (False, True)
+                  for search in (False, True)}
+        path = out_dir / output["file"]
+        if output.get("spec") in hashes and path.exists():
+            current.append((target, path))
+        else:
+            stale += 1
+    return current, stale
+
+
+def _variant(files, hashes):
+    """Manifest entry for one spec variant; ``files`` are its [(target, path)], lowest scale first."""
+    first = files[0][0]
+    entries, srcset = [], {}
+    for target, path in files:
+        url = url_for(path)
+        size, digest = hashes[path]
+        entries.append({"path": url, "width": target.width, "height": target.height, "scale": target.scale,
+                        "format": target.format, "bytes": size, "hash": digest[:HASH_CHARS]})
+        srcset.setdefault(MIME_TYPES[target.format], []).append(f"{url} {target.width}w")
+    fallback = [e for e in entries if e["scale"] == first.scale][-1]
+    return {
+        "width": round(first.width / first.scale),
+        "height": round(first.height / first.scale),
+        "sizes": sizes_for(first),
+        "src": fallback["path"],
+        "srcset": {mime: ", ".join(candidates) for mime, candidates in srcset.items()},
+        "files": entries,
+    }
+
+
+def build(targets, sources, root=derivatives.SOURCE_DIR, output_dir=derivatives.OUTPUT_DIR, workers=16,
+          derivatives_cache=derivatives.CACHE_FILE, cache_file=CACHE_FILE):
+    """(manifest, summary) for ``sources`` from the derivatives cache; see the module docstring."""
+    rendered = load_json(derivatives_cache, {})
+    cache = load_json(cache_file, {})
+    # Scale then format order, so each srcset lists 1x before 2x in the spec's format order
+    order = sorted(targets, key=lambda t: (t.name, t.scale))
+    per_source, stale, missing = {}, 0, 0
+    for src in sources:
+        rel = src.relative_to(root).as_posix()
+        entry = rendered.get(rel)
+        st = src.stat()
+        # Never rendered, or edited since: its outputs are not this file's
+        if entry is None or (entry.get("size"), entry.get("mtime_ns")) != (st.st_size, st.st_mtime_ns):
+            missing += 1
+            continue
+        files, count = _rendered(entry, order, derivatives.output_dir_for(rel, output_dir))
+        stale += count
+        if files:
+            per_source[src] = (entry["sha256"], files)
+
+    paths = [path for _, files in per_source.values() for _, path in files]
+    hashes, hashed = hash_files(paths, cache, workers)
+    live = {str(path) for path in paths}
+    save_json(cache_file, {key: value for key, value in cache.items() if key in live})
+
+    images = {}
+    for src, (digest, files) in per_source.items():
+        by_name = {}
+        for target, path in files:
+            by_name.setdefault(target.name, []).append((target, path))
+        images[url_for(src)] = {"sha256": digest,
+                                "variants": {name: _variant(group, hashes) for name, group in by_name.items()}}
+    device_sizes, image_sizes = next_sizes(targets)
+    manifest = {"deviceSizes": device_sizes, "imageSizes": image_sizes,
+                "images": dict(sorted(images.items()))}
+    summary = {"sources": len(sources), "images": len(images), "files": len(paths), "hashed": hashed,
+               "stale": stale, "not_rendered": missing}
+    return manifest, summary
@@ -0,0 +1,103 @@
+"""Named cell styles shared by the image library workbook scripts.
+
+Every styled cell references one of these ``NamedStyle`` entries by name
+instead of carrying its own Font / Fill / Alignment / Border objects, so a
+cell costs one style assignment and styles.xml holds each look once.
+"""
+
+# ── Theme colors ──
+TEHOM_BLACK = "1A1612"
+GOD_IS_GOLD = "C19A6B"
+SCROLL_WHITE = "F7F3ED"
+# Rare accents (Summary notes); values match src/app/globals.css
+COVENANT_BURGUNDY = "8E3F3F"
+GETHSEMANE_OLIVE = "6F8F4F"
+SHALOM_BLUE = "4D9FB0"
+DARK_BG = "2A2520"
+HEADER_FONT_COLOR = "FFFFFF"
+LINK_COLOR = "2E86AB"
+
+# ── Style names ──
+HEADER = "Library Header"
+CATEGORY = "Library Category"
+BODY = "Library Body"
+BODY_CENTER = "Library Body Centered"
+BODY_CENTER_WRAP = "Library Body Centered Wrap"
+LINK = "Library Link"
+TITLE = "Library Title"
+SUBTITLE = "Library Subtitle"
+NOTE = "Library Note"
+STATUS_OK = "Library Status OK"
+STATUS_WARN = "Library Status Warning"
+STATUS_BAD = "Library Status Problem"
+
+
+# Every look is Inter with a thin light-grey border unless it says otherwise
+FONT_NAME = "Inter"
+BORDER_COLOR = "DDDDDD"
+_BODY_FONT = dict(size=10, color="333333")
+_WRAP = dict(wrap_text=True, vertical="top")
+_STATUS_ALIGN = dict(horizontal="center", vertical="top", wrap_text=True)
+
+
+def _status(font_color, fill_color):
+    return dict(font=dict(size=10, bold=True, color=font_color), fill=fill_color, alignment=_STATUS_ALIGN)
+
+
+# name -> look as plain data, shared by register_styles (openpyxl) and
+# image_library.xlsx. font: Font keywords; fill: solid colour; alignment:
+# Alignment keywords; thin_border=False keeps the workbook's default (empty)
+# border entry, as the font-only styles do.
+STYLE_SPECS = {
+    HEADER: dict(font=dict(size=11, bold=True, color=HEADER_FONT_COLOR), fill=TEHOM_BLACK,
+                 alignment=dict(horizontal="center", vertical="center", wrap_text=True)),
+    CATEGORY: dict(font=dict(size=11, bold=True, color=TEHOM_BLACK), fill=GOD_IS_GOLD),
+    BODY: dict(font=_BODY_FONT, alignment=_WRAP),
+    BODY_CENTER: dict(font=_BODY_FONT, alignment=dict(horizontal="center", vertical="center")),
+    BODY_CENTER_WRAP: dict(font=_BODY_FONT, alignment=dict(horizontal="center", vertical="top", wrap_text=True)),
+    LINK: dict(font=dict(size=10, color=LINK_COLOR, underline="single"), alignment=_WRAP),
+    TITLE: dict(font=dict(size=14, bold=True, color=TEHOM_BLACK), thin_border=False),
+    SUBTITLE: dict(font=dict(size=12, bold=True, color=GOD_IS_GOLD), thin_border=False),
+    NOTE: dict(font=_BODY_FONT, thin_border=False),
+    # Traffic-light fills for computed status cells
+    STATUS_OK: _status("375623", "E2EFDA"),
+    STATUS_WARN: _status("7F6000", "FFF2CC"),
+    STATUS_BAD: _status("9C0006", "F8CBAD"),
+}
+
+
+def _style_specs():
+    """name -> NamedStyle keyword arguments.
+
+    Built on demand so that importing the style names stays free of openpyxl.
+    """
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    from openpyxl.styles.borders import DEFAULT_BORDER
+
+    thin_side = Side(style="thin", color=BORDER_COLOR)
+    thin_border = Border(left=thin_side, right=thin_side, top=thin_side, bottom=thin_side)
+    specs = {}
+    for name, spec in STYLE_SPECS.items():
+        kwargs = dict(font=Font(name=FONT_NAME, **spec["font"]),
+                      border=thin_border if spec.get("thin_border", True) else DEFAULT_BORDER)
+        if "fill" in spec:
+            kwargs["fill"] = PatternFill(start_color=spec["fill"], end_color=spec["fill"], fill_type="solid")
+        if "alignment" in spec:
+            kwargs["alignment"] = Alignment(**spec["alignment"])
+        specs[name] = kwargs
+    return specs
+
+
+def register_styles(wb):
+    """Add any missing library styles to ``wb``.
+
+    NamedStyle objects bind to a single workbook, so fresh ones are built per
+    workbook; styles already present (e.g. in a loaded file) are left alone.
+    Call this before assigning ``cell.style`` on write-only cells.
+    """
+    from openpyxl.styles import NamedStyle
+
+    existing = set(wb.named_styles)
+    for name, spec in _style_specs().items():
+        if name not in existing:
+            wb.add_named_style(NamedStyle(name=name, **spec))
@@ -0,0 +1,203 @@
+"""Print treatments (ordered dither, halftone, error diffusion) as NumPy array ops.
+
+Every mode maps a float32 luminance array in [0, 1] to a boolean "ink" mask,
+which ``render`` turns into a two-tone image (Tehom Black ink on Scroll
+White paper by default):
+
+* ``threshold``  a single cut-off
+* ``bayer``      ordered dither against a tiled 2^n x 2^n Bayer matrix
+* ``halftone``   clustered-dot screen at a given cell size and angle
+* ``floyd-steinberg`` / ``atkinson``  error diffusion, run over tiles
+
+Error diffusion is inherently sequential within a region, so the image is
+cut into square tiles and all tiles are diffused together: the Python loop
+walks the pixel positions of one tile and each step updates that position
+in every tile at once. A 1280 x 860 print takes one 64 x 64 walk over ~280
+tiles instead of a million-pixel loop. Tiles start with zero error; a small
+seeded threshold jitter stops their identical start-up patterns lining up
+into visible seams.
+
+Presets are keyed by the ``printStyle`` field of each artwork.json.
+``treat_file`` is the process-pool worker used by ``build``, which caches
+outputs by source hash plus treatment parameters.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from image_library.cache import cache_path, file_sha256, load_json, save_json
+from image_library.styles import SCROLL_WHITE, TEHOM_BLACK
+
+CACHE_FILE = cache_path("treatments.json")
+
+# (dy, dx, weight) taps; weights are fractions of the quantisation error
+KERNELS = {
+    "floyd-steinberg": ((0, 1, 7 / 16), (1, -1, 3 / 16), (1, 0, 5 / 16), (1, 1, 1 / 16)),
+    # Atkinson diffuses 6/8 of the error, which keeps highlights and shadows open
+    "atkinson": ((0, 1, 1 / 8), (0, 2, 1 / 8), (1, -1, 1 / 8), (1, 0, 1 / 8), (1, 1, 1 / 8), (2, 0, 1 / 8)),
+}
+
+PRESETS = {
+    "etching": {"mode": "floyd-steinberg", "contrast": 1.2},
+    "mezzotint": {"mode": "bayer", "order": 3, "contrast": 1.1, "gamma": 1.1},
+    "woodcut": {"mode": "atkinson", "contrast": 1.5},
+    "linocut": {"mode": "threshold", "level": 0.5, "contrast": 1.6},
+    "halftone": {"mode": "halftone", "cell": 6, "angle": 45},
+    "risograph": {"mode": "bayer", "order": 2, "contrast": 1.3},
+}
+DEFAULTS = {"contrast": 1.0, "gamma": 1.0, "ink": TEHOM_BLACK, "paper": SCROLL_WHITE, "tile": 64, "jitter": 0.15}
+
+
+def preset(style, **overrides):
+    """Full parameter dict for a print style (unknown styles fall back to etching)."""
+    return {**DEFAULTS, **PRESETS.get(style, PRESETS["etching"]), **overrides}
+
+
+def params_hash(params):
+    """Changes whenever a treatment's output would."""
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def luminance(rgb):
+    """Rec. 709 luma of an (h, w, 3) uint8 array as float32 in [0, 1]."""
+    return (rgb[..., :3].astype(np.float32) @ np.array([0.2126, 0.7152, 0.0722], np.float32)) / 255
+
+
+def tone(gray, contrast=1.0, gamma=1.0):
+    """Contrast around mid-grey, then gamma; both vectorised over the array."""
+    out = np.clip((gray - 0.5) * contrast + 0.5, 0, 1)
+    return out ** gamma if gamma != 1.0 else out
+
+
+def bayer_matrix(order):
+    """2^order x 2^order Bayer thresholds in (0, 1), built by recursive tiling."""
+    m = np.zeros((1, 1), np.float32)
+    for _ in range(order):
+        m = np.block([[4 * m, 4 * m + 2], [4 * m + 3, 4 * m + 1]])
+    return (m + 0.5) / m.size
+
+
+def ordered(gray, order=3):
+    m = bayer_matrix(order)
+    h, w = gray.shape
+    reps = (-(-h // m.shape[0]), -(-w // m.shape[1]))
+    return gray < np.tile(m, reps)[:h, :w]
+
+
+def halftone(gray, cell=6, angle=45):
+    """Clustered-dot screen: ink where the tone is darker than a rotated dot field."""
+    h, w = gray.shape
+    theta = np.deg2rad(angle)
+    y, x = np.mgrid[0:h, 0:w].astype(np.float32)
+    u = (x * np.cos(theta) + y * np.sin(theta)) / cell
+    v = (-x * np.sin(theta) + y * np.cos(theta)) / cell
+    spot = (np.cos(2 * np.pi * u) + np.cos(2 * np.pi * v)) / 4 + 0.5
+    return gray < spot
+
+
+def diffuse(gray, kernel="floyd-steinberg", tile=64, jitter=0.15):
+    """Error diffusion over ``tile`` x ``tile`` blocks, all blocks advanced together."""
+    taps = KERNELS[kernel]
+    h, w = gray.shape
+    ty, tx = -(-h // tile), -(-w // tile)
+    padded = np.ones((ty * tile, tx * tile), np.float32)
+    padded[:h, :w] = gray
+    # (tile, tile, n_tiles) so buf[y, x] is that pixel position in every tile
+    tiles = padded.reshape(ty, tile, tx, tile).transpose(1, 3, 0, 2).reshape(tile, tile, ty * tx)
+    reach_y = max(dy for dy, _, _ in taps)
+    reach_x = max(abs(dx) for _, dx, _ in taps)
+    buf = np.zeros((tile + reach_y, tile + 2 * reach_x, ty * tx), np.float32)
+    buf[:tile, reach_x:reach_x + tile] = tiles
+    # Seeded so the same input always gives the same print
+    noise = np.random.default_rng(0).uniform(-jitter, jitter, (tile, tile, ty * tx))
+    thresholds = (0.5 + noise).astype(np.float32)
+    ink = np.empty((tile, tile, ty * tx), bool)
+    for y in range(tile):
+        row = buf[y]
+        for x in range(reach_x, reach_x + tile):
+            old = row[x]
+            dark = old < thresholds[y, x - reach_x]
+            ink[y, x - reach_x] = dark
+            err = old - (~dark)  # quantised value is 0 (ink) or 1 (paper)
+            for dy, dx, weight in taps:
+                buf[y + dy, x + dx] += err * weight
+    out = ink.reshape(tile, tile, ty, tx).transpose(2, 0, 3, 1).reshape(ty * tile, tx * tile)
+    return out[:h, :w]
+
+
+def ink_mask(gray, params):
+    mode = params["mode"]
+    if mode == "threshold":
+        return gray < params.get("level", 0.5)
+    if mode == "bayer":
+        return ordered(gray, params.get("order", 3))
+    if mode == "halftone":
+        return halftone(gray, params.get("cell", 6), params.get("angle", 45))
+    if mode in KERNELS:
+        return diffuse(gray, mode, params.get("tile", DEFAULTS["tile"]), params.get("jitter", DEFAULTS["jitter"]))
+    raise ValueError(f"unknown treatment mode: {mode}")
+
+
+def _rgb(hex_color):
+    return np.array([int(hex_color[i:i + 2], 16) for i in (0, 2, 4)], np.uint8)
+
+
+def render(rgb, params):
+    """Treat an (h, w, 3) uint8 array; returns the two-tone uint8 RGB array."""
+    gray = tone(luminance(rgb), params.get("contrast", 1.0), params.get("gamma", 1.0))
+    ink = ink_mask(gray, params)
+    return np.where(ink[..., None], _rgb(params["ink"]), _rgb(params["paper"]))
+
+
+def treat_file(job):
+    """Worker: treat one source into ``output``; returns (output, cache entry)."""
+    from PIL import Image, ImageOps
+
+    src, output, params = job
+    digest = file_sha256(src)
+    with Image.open(src) as im:
+        rgb = np.asarray(ImageOps.exif_transpose(im).convert("RGB"))
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(output.name + ".tmp")
+    # Two-tone output compresses far better losslessly than as lossy WebP
+    Image.fromarray(render(rgb, params)).save(tmp, format="WEBP", lossless=True, method=4)
+    os.replace(tmp, output)
+    return str(output), {"source": str(src), "sha256": digest, "params": params_hash(params)}
+
+
+def build(jobs, workers=None, force=False, cache_file=CACHE_FILE, progress=print):
+    """Treat every (source, output, params) job whose source or parameters changed.
+
+    Returns (treated, skipped). A job is skipped when its output exists and the
+    cache holds the same source size/mtime (or hash) and parameter hash.
+    """
+    cache = {} if force else load_json(cache_file, {})
+    pending = []
+    for src, output, params in jobs:
+        entry = cache.get(str(output))
+        st = src.stat()
+        stat = [st.st_size, st.st_mtime_ns]
+        current = entry and output.exists() and entry["params"] == params_hash(params) and entry["source"] == str(src)
+        if current and entry.get("stat") != stat:
+            # Touched: only content changes count
+            current = entry["sha256"] == file_sha256(src)
+            entry["stat"] = stat
+        if not current:
+            pending.append((src, output, params))
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(treat_file, job) for job in pending]
+            for done, future in enumerate(as_completed(futures), 1):
+                output, entry = future.result()
+                st = os.stat(entry["source"])
+                cache[output] = {**entry, "stat": [st.st_size, st.st_mtime_ns]}
+                if done % 50 == 0:
+                    progress(f"  {done}/{len(pending)}")
+                    save_json(cache_file, cache)
+    save_json(cache_file, cache)
+    return len(pending), len(jobs) - len(pending)
@@ -0,0 +1,59 @@
+"""Poll the catalog, series JSON and public/ asset trees, debouncing edits.
+
+``snapshot`` stats every catalog file and content/series-json/*.json and
+lists public/images and public/icons with image_library.assets.scan_tree (a
+few tens of milliseconds for today's tree), so polling needs no platform
+file-watch API. ``poll``
+compares successive snapshots and yields the changed keys once the tree has
+been quiet for ``debounce`` seconds. An editor saving several files, or one
+file in several writes, therefore triggers a single rebuild.
+"""
+
+import time
+
+from image_library import assets, catalog
+from image_library.scripture import SERIES_DIR
+
+
+def snapshot(catalog_dir=catalog.CATALOG_DIR, public=assets.PUBLIC_DIR, roots=assets.ASSET_ROOTS,
+             series_dir=SERIES_DIR):
+    """{key: (size, mtime_ns)}.
+
+    Keys are ("catalog", section), ("series", file name) or ("asset", path under public/).
+    """
+    state = {}
+    for section in catalog.SECTIONS:
+        try:
+            stat = catalog.section_path(section, catalog_dir).stat()
+        except FileNotFoundError:
+            continue
+        state[("catalog", section)] = (stat.st_size, stat.st_mtime_ns)
+    for path in series_dir.glob("*.json"):
+        stat = path.stat()
+        state[("series", path.name)] = (stat.st_size, stat.st_mtime_ns)
+    for root in roots:
+        for rel, stat in assets.scan_tree(public / root).items():
+            state[("asset", f"{root}/{rel}")] = stat
+    return state
+
+
+def changed_keys(before, after):
+    """Keys added, removed or modified between two snapshots."""
+    return {key for key in before.keys() | after.keys() if before.get(key) != after.get(key)}
+
+
+def poll(interval=0.2, debounce=0.2, take=snapshot):
+    """Yield the set of changed keys after each burst of changes; runs until interrupted."""
+    last = take()
+    pending, changed_at = set(), None
+    while True:
+        time.sleep(interval)
+        current = take()
+        changes = changed_keys(last, current)
+        last = current
+        if changes:
+            pending |= changes
+            changed_at = time.monotonic()
+        elif pending and time.monotonic() - changed_at >= debounce:
+            yield pending
+            pending = set()
@@ -0,0 +1,307 @@
+"""Write .xlsx workbooks directly, without openpyxl.
+
+The library workbook uses only a small part of SpreadsheetML: text and number
+cells, one named style per cell (image_library.styles), column widths, tab
+colours, a frozen header row, single-row merges and external hyperlinks.
+That much is plain string formatting, so this module writes the package
+parts itself: [Content_Types].xml, the relationships, workbook.xml,
+styles.xml, one worksheet per sheet and a shared-strings table.
+
+``SheetWriter`` renders one worksheet without needing any other sheet, so
+sheets can be rendered in separate processes. Shared-string indices are only
+known once every sheet is done, so a rendered ``Part`` leaves a ``\\x00``
+(which can never appear in XML text) wherever a string index goes and lists
+its sheet-local indices in ``slots``. ``save`` fills in the offsets, then
+zips the parts. A sheet's strings are deduplicated within that sheet;
+strings shared between sheets are stored once per sheet, which
+SpreadsheetML allows.
+
+Zip entries carry a fixed timestamp and there are no docProps, so an
+unchanged catalog produces a byte-identical file. openpyxl reads the result
+back with the same values and named styles as its own output, so
+add-paintings-to-excel.py and row_index.py work on it unchanged.
+"""
+
+import math
+import os
+import re
+import zipfile
+from array import array
+from collections import namedtuple
+from itertools import chain, repeat
+
+from image_library.styles import BORDER_COLOR, FONT_NAME, STYLE_SPECS
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.{}+xml"
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+# Zip timestamps are fixed so identical input gives an identical file
+ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+SLOT = "\x00"
+_ILLEGAL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# cellXfs index per named style; 0 is the workbook default
+STYLE_IDS = {name: i for i, name in enumerate(STYLE_SPECS, 1)}
+
+# A rendered worksheet: ``xml`` with SLOT where each shared-string index goes,
+# ``slots`` the sheet-local index for each SLOT in order, ``shared`` the
+# sheet's <si> entries, ``unique`` how many there are, ``cells`` cells written,
+# ``links`` the hyperlink targets (relationship rId1, rId2, … of the sheet).
+Part = namedtuple("Part", "xml slots shared unique cells links")
+
+
+def column_letter(col):
+    """1 -> A, 27 -> AA."""
+    letters = ""
+    while col:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def split_cell(ref):
+    """"B3" -> (2, 3)."""
+    letters, row = re.fullmatch(r"([A-Z]+)(\d+)", ref).groups()
+    col = 0
+    for ch in letters:
+        col = col * 26 + ord(ch) - 64
+    return col, int(row)
+
+
+def escape(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _attr(text):
+    return escape(text).replace('"', "&quot;")
+
+
+def _text(text):
+    if _ILLEGAL.search(text):
+        raise ValueError(f"Control character in cell text: {text!r}")
+    preserve = ' xml:space="preserve"' if text != text.strip() else ""
+    return f"<t{preserve}>{escape(text)}</t>"
+
+
+# ── styles.xml ──
+def _font_xml(bold=False, size=11, color=None, underline=None, name=FONT_NAME):
+    parts = ["<b/>"] * bold + ([f'<u val="{underline}"/>'] if underline else []) + [f'<sz val="{size}"/>']
+    if color:
+        parts.append(f'<color rgb="00{color}"/>')
+    parts.append(f'<name val="{name}"/>')
+    return "<font>" + "".join(parts) + "</font>"
+
+
+def _fill_xml(color):
+    return (f'<fill><patternFill patternType="solid"><fgColor rgb="00{color}"/><bgColor rgb="00{color}"/>'
+            "</patternFill></fill>")
+
+
+def _alignment_xml(horizontal=None, vertical=None, wrap_text=False):
+    attrs = [f'horizontal="{horizontal}"'] * bool(horizontal) + [f'vertical="{vertical}"'] * bool(vertical)
+    attrs += ['wrapText="1"'] * wrap_text
+    return f"<alignment {' '.join(attrs)}/>"
+
+
+def styles_xml():
+    """styles.xml holding the library's named styles, one cellXfs entry each (see STYLE_IDS)."""
+    fonts = [_font_xml(size=11, name="Calibri")]
+    fills = ['<fill><patternFill patternType="none"/></fill>', '<fill><patternFill patternType="gray125"/></fill>']
+    side = f'style="thin"><color rgb="00{BORDER_COLOR}"/>'
+    borders = ["<border><left/><right/><top/><bottom/><diagonal/></border>",
+               f"<border><left {side}</left><right {side}</right><top {side}</top><bottom {side}</bottom>"
+               "<diagonal/></border>"]
+    style_xfs = ['<xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>']
+    cell_xfs = ['<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>']
+    cell_styles = ['<cellStyle name="Normal" xfId="0" builtinId="0"/>']
+    for name, xf_id in STYLE_IDS.items():
+        spec = STYLE_SPECS[name]
+        font = _font_xml(**{"size": 10, **spec["font"]})
+        if font not in fonts:
+            fonts.append(font)
+        fill_id = 0
+        if "fill" in spec:
+            fill = _fill_xml(spec["fill"])
+            if fill not in fills:
+                fills.append(fill)
+            fill_id = fills.index(fill)
+        attrs = (f'numFmtId="0" fontId="{fonts.index(font)}" fillId="{fill_id}" '
+                 f'borderId="{int(spec.get("thin_border", True))}"')
+        if "alignment" in spec:
+            alignment = _alignment_xml(**spec["alignment"])
+            style_xfs.append(f'<xf {attrs} applyAlignment="1">{alignment}</xf>')
+            cell_xfs.append(f'<xf {attrs} xfId="{xf_id}" applyAlignment="1">{alignment}</xf>')
+        else:
+            style_xfs.append(f"<xf {attrs}/>")
+            cell_xfs.append(f'<xf {attrs} xfId="{xf_id}"/>')
+        cell_styles.append(f'<cellStyle name="{_attr(name)}" xfId="{xf_id}"/>')
+
+    def block(tag, items):
+        return f'<{tag} count="{len(items)}">{"".join(items)}</{tag}>'
+
+    return (f'{XML_HEADER}<styleSheet xmlns="{MAIN_NS}">' + block("fonts", fonts) + block("fills", fills)
+            + block("borders", borders) + block("cellStyleXfs", style_xfs) + block("cellXfs", cell_xfs)
+            + block("cellStyles", cell_styles) + '<dxfs count="0"/><tableStyles count="0"/></styleSheet>')
+
+
+# ── Worksheets ──
+def _pane_xml(freeze_panes):
+    col, row = split_cell(freeze_panes)
+    if (col, row) == (1, 1):
+        return ""
+    splits = f'xSplit="{col - 1}" ' * (col > 1) + f'ySplit="{row - 1}" ' * (row > 1)
+    pane = {(True, True): "bottomRight", (True, False): "topRight"}.get((col > 1, row > 1), "bottomLeft")
+    return (f'<pane {splits}topLeftCell="{freeze_panes}" activePane="{pane}" state="frozen"/>'
+            f'<selection pane="{pane}" activeCell="{freeze_panes}" sqref="{freeze_panes}"/>')
+
+
+class SheetWriter:
+    """Renders one worksheet part row by row; ``finish`` returns its Part."""
+
+    def __init__(self, col_widths, tab_color=None, freeze_panes=None):
+        self.col_widths = col_widths
+        self.tab_color = tab_color
+        self.freeze_panes = freeze_panes
+        self.letters = [column_letter(col) for col in range(1, len(col_widths) + 1)]
+        self.rows = []
+        self.row = 0
+        self.strings = {}
+        self.slots = array("l")
+        self.merges = []
+        self.links = []
+        self.cells = 0
+
+    def skip(self):
+        """Leave the next row empty."""
+        self.row += 1
+
+    def append(self, values, styles):
+        """Write the next row: one named style per column, values past the end are empty cells."""
+        self.row += 1
+        row, strings, slots = self.row, self.strings, self.slots
+        out = [f'<row r="{row}">']
+        for letter, style, value in zip(self.letters, styles, chain(values, repeat(None))):
+            ref = f'r="{letter}{row}" s="{STYLE_IDS[style]}"'
+            if value is None or value == "":
+                out.append(f"<c {ref}/>")
+            elif isinstance(value, str):
+                slots.append(strings.setdefault(value, len(strings)))
+                out.append(f'<c {ref} t="s"><v>{SLOT}</v></c>')
+            elif isinstance(value, bool):
+                out.append(f'<c {ref} t="b"><v>{int(value)}</v></c>')
+            elif isinstance(value, (int, float)):
+                if not math.isfinite(value):
+                    # SpreadsheetML has no NaN or infinity; <v>nan</v> makes the file unreadable
+                    raise ValueError(f"{letter}{row}: {value!r} is not a finite number")
+                # Integral floats are written as openpyxl does: 1912.0 -> 1912
+                number = int(value) if isinstance(value, float) and value.is_integer() else value
+                out.append(f'<c {ref} t="n"><v>{number!r}</v></c>')
+            else:
+                slots.append(strings.setdefault(str(value), len(strings)))
+                out.append(f'<c {ref} t="s"><v>{SLOT}</v></c>')
+        out.append("</row>")
+        self.rows.append("".join(out))
+        self.cells += min(len(styles), len(self.letters))
+
+    def merged(self, value, style, width):
+        """Write the next row as one cell spanning ``width`` columns."""
+        self.append([value], [style])
+        self.merges.append(f'<mergeCell ref="A{self.row}:{column_letter(width)}{self.row}"/>')
+
+    def hyperlink(self, col, target):
+        """Link the cell in column ``col`` of the row just written to the URL ``target``."""
+        self.links.append((f"{self.letters[col - 1]}{self.row}", target))
+
+    def finish(self):
+        head = [f'{XML_HEADER}<worksheet xmlns="{MAIN_NS}" xmlns:r="{REL_NS}">']
+        if self.tab_color:
+            head.append(f'<sheetPr><tabColor rgb="00{self.tab_color}"/></sheetPr>')
+        head.append(f'<dimension ref="A1:{self.letters[-1]}{max(self.row, 1)}"/>')
+        pane = _pane_xml(self.freeze_panes) if self.freeze_panes else ""
+        head.append(f'<sheetViews><sheetView workbookViewId="0">{pane}</sheetView></sheetViews>')
+        head.append('<sheetFormatPr defaultRowHeight="15"/><cols>')
+        head.extend(f'<col min="{col}" max="{col}" width="{width}" customWidth="1"/>'
+                    for col, width in enumerate(self.col_widths, 1))
+        head.append("</cols><sheetData>")
+        tail = ["</sheetData>"]
+        if self.merges:
+            tail.append(f'<mergeCells count="{len(self.merges)}">{"".join(self.merges)}</mergeCells>')
+        if self.links:
+            tail.append("<hyperlinks>" + "".join(f'<hyperlink ref="{ref}" r:id="rId{i}"/>'
+                                                 for i, (ref, _) in enumerate(self.links, 1)) + "</hyperlinks>")
+        tail.append('<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/>'
+                    "</worksheet>")
+        shared = "".join(f"<si>{_text(text)}</si>" for text in self.strings)
+        return Part("".join(head + self.rows + tail), self.slots, shared, len(self.strings), self.cells,
+                    [target for _, target in self.links])
+
+
+# ── Package ──
+def _resolve(part, offset):
+    """Worksheet XML with the part's string slots pointing at ``offset`` + local index."""
+    pieces = part.xml.split(SLOT)
+    if len(pieces) == 1:
+        return part.xml
+    out = [None] * (2 * len(pieces) - 1)
+    out[0::2] = pieces
+    out[1::2] = list(map(str, map(offset.__add__, part.slots)))
+    return "".join(out)
+
+
+def _package_files(titles, parts):
+    count = len(titles)
+    sheets = "".join(f'<sheet name="{_attr(title)}" sheetId="{i}" r:id="rId{i}"/>'
+                     for i, title in enumerate(titles, 1))
+    rels = "".join(f'<Relationship Id="rId{i}" Type="{REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+                   for i in range(1, count + 1))
+    rels += (f'<Relationship Id="rId{count + 1}" Type="{REL_NS}/styles" Target="styles.xml"/>'
+             f'<Relationship Id="rId{count + 2}" Type="{REL_NS}/sharedStrings" Target="sharedStrings.xml"/>')
+    overrides = "".join(f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="{CONTENT_TYPE.format("worksheet")}"/>'
+                        for i in range(1, count + 1))
+    yield "[Content_Types].xml", (
+        f'{XML_HEADER}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        f'<Override PartName="/xl/workbook.xml" ContentType="{CONTENT_TYPE.format("sheet.main")}"/>'
+        f'<Override PartName="/xl/styles.xml" ContentType="{CONTENT_TYPE.format("styles")}"/>'
+        f'<Override PartName="/xl/sharedStrings.xml" ContentType="{CONTENT_TYPE.format("sharedStrings")}"/>'
+        f"{overrides}</Types>")
+    yield "_rels/.rels", (
+        f'{XML_HEADER}<Relationships xmlns="{PKG_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="xl/workbook.xml"/></Relationships>')
+    yield "xl/workbook.xml", (
+        f'{XML_HEADER}<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}"><workbookPr/>'
+        f'<bookViews><workbookView activeTab="0"/></bookViews><sheets>{sheets}</sheets></workbook>')
+    yield "xl/_rels/workbook.xml.rels", f'{XML_HEADER}<Relationships xmlns="{PKG_REL_NS}">{rels}</Relationships>'
+    yield "xl/styles.xml", styles_xml()
+    offset = 0
+    for i, part in enumerate(parts, 1):
+        yield f"xl/worksheets/sheet{i}.xml", _resolve(part, offset)
+        if part.links:
+            yield f"xl/worksheets/_rels/sheet{i}.xml.rels", (
+                f'{XML_HEADER}<Relationships xmlns="{PKG_REL_NS}">'
+                + "".join(f'<Relationship Id="rId{n}" Type="{REL_NS}/hyperlink" Target="{_attr(target)}" '
+                          'TargetMode="External"/>' for n, target in enumerate(part.links, 1))
+                + "</Relationships>")
+        offset += part.unique
+    yield "xl/sharedStrings.xml", (
+        f'{XML_HEADER}<sst xmlns="{MAIN_NS}" count="{sum(len(p.slots) for p in parts)}" uniqueCount="{offset}">'
+        + "".join(p.shared for p in parts) + "</sst>")
+
+
+def save(path, titles, parts, compresslevel=6):
+    """Zip the sheets (``titles`` and their rendered ``parts``, in tab order) into ``path``.
+
+    The file is written next to ``path`` and renamed over it, so readers never
+    see a half-written workbook.
+    """
+    tmp = path.with_name(f".{path.name}.tmp")
+    with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zf:
+        for name, text in _package_files(titles, parts):
+            info = zipfile.ZipInfo(name, ZIP_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            zf.writestr(info, text.encode("utf-8"), compresslevel=compresslevel)
+    os.replace(tmp, path)
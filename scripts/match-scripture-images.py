@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Suggest library images for each devotional by shared scripture references.
+
+References in the illustrations' Use Cases / Tags column and the citations
+in content/series-json/*.json (scripture modules, anchor verses, …) are
+parsed into verse intervals (see image_library.scripture) and matched in one
+sweep. Candidates for each series day are ranked by how many of its
+references they share, verse-level matches first, and written to
+.cache/image-library/scripture-matches.json.
+
+--ref looks up the images for a single citation instead.
+"""
+
+import argparse
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from image_library import catalog, scripture
+from image_library.cache import cache_path, save_json
+
+REPORT_FILE = cache_path("scripture-matches.json")
+
+
+def rank(pairs):
+    """{(series, day): [candidate dict, best first]} from scripture.match pairs."""
+    found = defaultdict(lambda: defaultdict(lambda: {"refs": set(), "verse_level": 0}))
+    for (num, tag), (series, day, citation), _ in pairs:
+        entry = found[(series, day)][num]
+        if (tag, citation) not in entry["refs"]:
+            entry["refs"].add((tag, citation))
+            # A tag naming verses is a closer fit than a whole-chapter tag
+            entry["verse_level"] += ":" in tag
+    ranked = {}
+    for key, images in found.items():
+        candidates = [{"image": num, "refs": sorted(e["refs"]), "verse_level": e["verse_level"]}
+                      for num, e in images.items()]
+        candidates.sort(key=lambda c: (-c["verse_level"], -len(c["refs"]), c["image"]))
+        ranked[key] = candidates
+    return ranked
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Match devotionals to library images by scripture reference.")
+    parser.add_argument("--series-dir", type=Path, default=scripture.SERIES_DIR, help="Series JSON folder")
+    parser.add_argument("--ref", help="Look up one citation, e.g. \"John 4:7-15\"")
+    parser.add_argument("--top", type=int, default=3, help="Candidates to print per day")
+    parser.add_argument("--output", type=Path, default=REPORT_FILE, help="Where the JSON report is written")
+    args = parser.parse_args()
+
+    illustrations = catalog.load("illustrations")
+    names = {r.num: r.name for r in illustrations}
+    image_refs = scripture.illustration_refs(illustrations)
+
+    if args.ref:
+        index = scripture.sorted_index(image_refs)
+        refs = scripture.parse_refs(args.ref)
+        if not refs:
+            parser.error(f"no scripture reference found in {args.ref!r}")
+        hits = sorted({item for ref in refs for item in scripture.overlapping(index, ref.start, ref.end)})
+        for num, tag in hits:
+            print(f"  #{num:<4} {names[num]}  ({tag})")
+        print(f"{len(hits)} match(es)")
+        return
+
+    started = time.perf_counter()
+    devotional_refs = scripture.devotional_refs(args.series_dir)
+    ranked = rank(scripture.match(image_refs, devotional_refs))
+    elapsed = time.perf_counter() - started
+
+    days = {(series, day) for _, _, (series, day, _) in devotional_refs}
+    print(f"{len(image_refs)} image reference(s) on {len({n for _, _, (n, _) in image_refs})} images; "
+          f"{len(devotional_refs)} devotional reference(s) on {len(days)} days; "
+          f"{len(ranked)} day(s) with candidates ({elapsed * 1000:.0f} ms)")
+    for (series, day), candidates in sorted(ranked.items(), key=lambda item: (item[0][0], item[0][1] or 0)):
+        best = ", ".join(f"#{c['image']} {names[c['image']]}" for c in candidates[:args.top])
+        print(f"  {series} day {day}: {best}")
+
+    save_json(args.output, [{"series": series, "day": day, "candidates": candidates}
+                            for (series, day), candidates in sorted(ranked.items(),
+                                                                    key=lambda item: (item[0][0], item[0][1] or 0))],
+              indent=2)
+    print(f"Report: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Mirror the reference paintings into a local content-addressed cache.
+
+Resolves each painting in content/image-library/paintings.json to its source
+file, downloads it with a bounded worker pool (resuming partial transfers),
+and records bytes, dimensions and license per image number in
+.cache/image-library/mirror/index.json. See image_library.mirror.
+"""
+
+import argparse
+
+from image_library import catalog
+from image_library.linkcheck import HostLimiter
+from image_library.mirror import HttpBackend, Mirror, WikimediaBackend
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mirror reference paintings for offline use.")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent downloads")
+    parser.add_argument("--per-host", type=int, default=4, help="Concurrent requests per host")
+    parser.add_argument("--interval", type=float, default=0.1, help="Seconds between request starts per host")
+    parser.add_argument("--backend", choices=["wikimedia", "http"], default="wikimedia",
+                        help="wikimedia resolves page URLs via the MediaWiki API; "
+                             "http fetches <base-url>/<image_num> (fixture servers)")
+    parser.add_argument("--base-url", help="Base URL for the http backend")
+    parser.add_argument("--only", type=int, nargs="*", help="Limit to these image numbers")
+    args = parser.parse_args()
+
+    if args.backend == "http" and not args.base_url:
+        parser.error("--backend http needs --base-url")
+    backend = HttpBackend(args.base_url) if args.backend == "http" else WikimediaBackend()
+
+    paintings = catalog.load("paintings")
+    if args.only:
+        paintings = [p for p in paintings if p.num in set(args.only)]
+
+    mirror = Mirror(backend, workers=args.workers, limiter=HostLimiter(args.per_host, args.interval))
+    fetched, failures = mirror.sync(paintings)
+    print(f"Mirror: {mirror.root}")
+    print(f"{len(paintings) - len(fetched) - len(failures)} already current, {len(fetched)} fetched, "
+          f"{len(failures)} failed")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Map images onto a brand palette (Tehom Black, God is Gold, Scroll White…).
+
+Every pixel is snapped to its nearest palette colour through a cached 3D
+lookup table (see image_library.palette); files are processed in a process
+pool. The raster images in the given files or folders are written as
+palette PNGs to .cache/image-library/quantized/, mirroring their folder
+layout::
+
+    python quantize-to-palette.py ../public/images/devotional-prints
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from image_library import palette
+from image_library.cache import cache_path
+from image_library.derivatives import SOURCE_SUFFIXES
+
+OUTPUT_DIR = cache_path("quantized")
+
+
+def collect(paths):
+    """(file, base folder) for every image named directly or found under a folder."""
+    found = []
+    for path in paths:
+        if path.is_dir():
+            found += [(p, path) for p in sorted(path.rglob("*")) if p.suffix.lower() in SOURCE_SUFFIXES]
+        elif path.suffix.lower() in SOURCE_SUFFIXES:
+            found.append((path, path.parent))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantize images onto a brand palette.")
+    parser.add_argument("paths", type=Path, nargs="+", help="Image files or folders to quantize")
+    parser.add_argument("--palette", default="core", choices=sorted(palette.PALETTES), help="Palette to map onto")
+    parser.add_argument("--bits", type=int, default=6, choices=range(4, 9), help="LUT precision per channel")
+    parser.add_argument("--format", default="png", choices=("png", "webp"), help="Output format (lossless)")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR, help="Where quantized files are written")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    colours = palette.PALETTES[args.palette]
+    # Build (or load) the table once up front so workers only ever read it
+    palette.load_lut(colours, args.bits)
+    jobs = [(src, args.output_dir / src.relative_to(base).with_suffix("." + args.format), colours, args.bits)
+            for src, base in collect(args.paths)]
+    if not jobs:
+        print("No images found")
+        return
+
+    totals = [0] * len(colours)
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for _, counts in pool.map(palette.quantize_file, jobs, chunksize=8):
+            totals = [a + b for a, b in zip(totals, counts)]
+    pixels = sum(totals) or 1
+    print(f"Quantized {len(jobs)} image(s) onto '{args.palette}' -> {args.output_dir}")
+    for (name, hex_color), count in zip(colours, totals):
+        print(f"  {name:<18} #{hex_color}  {count / pixels:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Shared fixtures for the image library script tests."""
+
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+# The scripts are run from scripts/, which is what makes image_library importable
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from image_library.catalog import CATALOG_DIR  # noqa: E402
+
+
+@pytest.fixture
+def serve():
+    """Start a local HTTP server for a handler class; returns its base URL."""
+    servers = []
+
+    def start(handler):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def closed_port():
+    """A localhost port with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def catalog_dir(tmp_path):
+    """A scratch copy of content/image-library that a test may edit."""
+    return Path(shutil.copytree(CATALOG_DIR, tmp_path / "catalog"))
+
+
+@pytest.fixture
+def run_script(catalog_dir):
+    """Run a script in scripts/ against ``catalog_dir``; returns its stdout."""
+
+    def run(name, *args):
+        env = dict(os.environ, IMAGE_LIBRARY_CATALOG=str(catalog_dir))
+        command = [sys.executable, str(SCRIPTS_DIR / name), *map(str, args)]
+        return subprocess.run(command, env=env, cwd=SCRIPTS_DIR, check=True, capture_output=True, text=True).stdout
+
+    return run
@@ -0,0 +1,45 @@
+import json
+
+import openpyxl
+
+from image_library.row_index import scan_rows
+
+SHEET = "Evergreen Illustrations"
+
+
+def painting_cells(wb_path, num):
+    """(K-N values, N hyperlink) of image ``num``'s row."""
+    row, _ = scan_rows(wb_path, SHEET, (1, 1)).rows[num]
+    ws = openpyxl.load_workbook(wb_path)[SHEET]
+    link = ws.cell(row=row, column=14).hyperlink
+    return [ws.cell(row=row, column=col).value for col in range(11, 15)], link and link.target
+
+
+def remove_painting(catalog_dir, num):
+    path = catalog_dir / "paintings.json"
+    paintings = [p for p in json.loads(path.read_text(encoding="utf-8")) if p["num"] != num]
+    path.write_text(json.dumps(paintings, ensure_ascii=False), encoding="utf-8")
+
+
+def test_full_pass_clears_removed_painting(run_script, catalog_dir, tmp_path):
+    wb_path = tmp_path / "library.xlsx"
+    run_script("generate-image-library-excel.py", "--output", wb_path, "--workers", 1)
+    run_script("add-paintings-to-excel.py", "--workbook", wb_path)
+    values, link = painting_cells(wb_path, 2)
+    assert values[0] == "The Flight into Egypt" and link == values[3]
+
+    remove_painting(catalog_dir, 2)
+    run_script("add-paintings-to-excel.py", "--workbook", wb_path)
+    assert painting_cells(wb_path, 2) == ([None] * 4, None)
+    assert painting_cells(wb_path, 3)[0][0] == "Sunrise with Sea Monsters"
+    assert "Up to date" in run_script("add-paintings-to-excel.py", "--workbook", wb_path, "--incremental")
+
+
+def test_incremental_pass_clears_removed_painting(run_script, catalog_dir, tmp_path):
+    wb_path = tmp_path / "library.xlsx"
+    run_script("generate-image-library-excel.py", "--output", wb_path, "--workers", 1)
+    run_script("add-paintings-to-excel.py", "--workbook", wb_path)
+
+    remove_painting(catalog_dir, 2)
+    assert "Rewrote 1 of" in run_script("add-paintings-to-excel.py", "--workbook", wb_path, "--incremental")
+    assert painting_cells(wb_path, 2) == ([None] * 4, None)
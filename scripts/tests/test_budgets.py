@@ -0,0 +1,24 @@
+import openpyxl
+
+from image_library import budgets
+from image_library.styles import BODY, CATEGORY, STATUS_BAD, STATUS_OK
+
+
+def test_status_style():
+    assert budgets.status_style("OK (3)") == STATUS_OK
+    assert budgets.status_style("2 of 5 over") == STATUS_BAD
+    assert budgets.status_style(None) is None
+
+
+def test_generated_workbook_keeps_budget_status(run_script, tmp_path):
+    wb_path = tmp_path / "library.xlsx"
+    run_script("generate-image-library-excel.py", "--output", wb_path, "--workers", 1)
+    ws = openpyxl.load_workbook(wb_path)["Image Size Specs"]
+    assert ws.cell(row=1, column=9).value == "Budget Status"
+    assert {ws.cell(row=row, column=9).style for row in range(2, ws.max_row + 1)} <= {
+        BODY, CATEGORY, STATUS_OK, STATUS_BAD}
+
+    # check-image-budgets measures public/images itself and finds nothing to change
+    before = wb_path.stat().st_mtime_ns
+    assert "Up to date" in run_script("check-image-budgets.py", "--workbook", wb_path, "--report", tmp_path / "r.json")
+    assert wb_path.stat().st_mtime_ns == before
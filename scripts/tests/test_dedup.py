@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from image_library import dedup
+from image_library.assets import Asset
+from image_library.cache import file_sha256
+
+
+def blob(seed, size=64):
+    """A smooth random image: 4 x 4 noise scaled up, so its low DCT terms carry the shape."""
+    noise = np.random.default_rng(seed).integers(0, 256, (4, 4, 3), np.uint8)
+    return Image.fromarray(noise).resize((size, size), Image.BICUBIC)
+
+
+@pytest.fixture
+def public(tmp_path):
+    root = tmp_path / "public"
+    (root / "images").mkdir(parents=True)
+    for seed in range(6):
+        blob(seed).save(root / "images" / f"blob-{seed}.png")
+    blob(0, 48).save(root / "images" / "blob-0-small.png")
+    return root
+
+
+def manifest(public):
+    return {
+        path.relative_to(public).as_posix(): Asset(None, 0, 0, file_sha256(path), 0, 0, "png", False)
+        for path in sorted((public / "images").glob("*.png"))
+    }
+
+
+def pair_paths(index, public):
+    return {frozenset((p.a, p.b)) for p in dedup.path_pairs(index, dedup.candidates(manifest(public)))}
+
+
+@pytest.fixture
+def adds(monkeypatch):
+    """Keys inserted into any BKTree."""
+    added, add = [], dedup.BKTree.add
+    monkeypatch.setattr(dedup.BKTree, "add", lambda self, key, value: (added.append(value), add(self, key, value)))
+    return added
+
+
+def test_rerun_only_inserts_new_content(public, tmp_path, adds):
+    index_file = tmp_path / "hashes.json"
+    index, hashed = dedup.update(manifest(public), public, index_file=index_file, workers=1)
+    assert hashed == 7 and len(adds) == 7
+    assert {"images/blob-0-small.png", "images/blob-0.png"} in pair_paths(index, public)
+
+    blob(0, 40).save(public / "images" / "blob-0-smaller.png")
+    adds.clear()
+    index, hashed = dedup.update(manifest(public), public, index_file=index_file, workers=1)
+    assert hashed == 1 and adds == [file_sha256(public / "images" / "blob-0-smaller.png")]
+
+    fresh, _ = dedup.update(manifest(public), public, index_file=tmp_path / "fresh.json", workers=1)
+    assert index["pairs"] == fresh["pairs"]
+    assert {"images/blob-0-small.png", "images/blob-0-smaller.png"} in pair_paths(index, public)
+
+
+def test_removed_files_leave_the_tree(public, tmp_path, adds):
+    index_file = tmp_path / "hashes.json"
+    dedup.update(manifest(public), public, index_file=index_file, workers=1)
+    (public / "images" / "blob-0-small.png").unlink()
+    adds.clear()
+    index, hashed = dedup.update(manifest(public), public, index_file=index_file, workers=1)
+    assert hashed == 0 and adds == []
+    assert index["pairs"] == []
+    tree = dedup.BKTree.load(index["tree"])
+    assert {value for _, value in tree.search(0, 64)} == set(index["hashes"])
@@ -0,0 +1,72 @@
+from functools import partial
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from image_library import linkcheck
+
+
+class Handler(BaseHTTPRequestHandler):
+    def _reply(self, status, headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self):
+        if self.path == "/no-head":
+            self._reply(405)
+        else:
+            self.do_GET()
+
+    def do_GET(self):
+        if self.path in ("/ok", "/no-head", "/Cr%C3%A9ation"):
+            self._reply(200)
+        elif self.path == "/moved":
+            self._reply(301, [("Location", "/ok")])
+        else:
+            self._reply(404)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base(serve):
+    return serve(Handler)
+
+
+def check(urls, cache=None, probe=None):
+    return linkcheck.check_urls(urls, cache, workers=4, limiter=linkcheck.HostLimiter(per_host=2, interval=0),
+                                probe=probe or partial(linkcheck.probe_url, timeout=5))
+
+
+def test_statuses_against_local_server(base, closed_port):
+    refused = f"http://127.0.0.1:{closed_port}/ok"
+    results = check([f"{base}/ok", f"{base}/moved", f"{base}/no-head", f"{base}/missing", f"{base}/Création",
+                     refused])
+
+    assert linkcheck.status_label(results[f"{base}/ok"]) == "OK"
+    assert results[f"{base}/moved"]["final_url"] == f"{base}/ok"
+    assert linkcheck.status_label(results[f"{base}/moved"]) == "Redirected"
+    assert linkcheck.status_label(results[f"{base}/no-head"]) == "OK"  # 405 on HEAD, then GET
+    assert linkcheck.status_label(results[f"{base}/missing"]) == "Broken (404)"
+    assert linkcheck.status_label(results[f"{base}/Création"]) == "OK"
+    assert results[refused]["status"] is None
+    assert linkcheck.status_label(results[refused]).startswith("Error")
+
+
+def test_errors_are_reprobed_but_results_are_cached(base, closed_port):
+    urls = [f"{base}/ok", f"{base}/missing", f"http://127.0.0.1:{closed_port}/ok"]
+    cache = {}
+    check(urls, cache)
+
+    probed = []
+
+    def probe(url):
+        probed.append(url)
+        return linkcheck.probe_url(url, timeout=5)
+
+    check(urls, cache, probe)
+    assert probed == [urls[2]]
@@ -0,0 +1,98 @@
+import hashlib
+from collections import namedtuple
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from image_library.linkcheck import HostLimiter
+from image_library.mirror import HttpBackend, Mirror
+
+Painting = namedtuple("Painting", "num url")
+
+DATA = bytes(range(256)) * 40  # 10,240 bytes
+CUT_AT = 1000
+
+
+def make_handler(log, cut_first=False):
+    state = {"cut": cut_first}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            log.append((self.path, self.headers.get("Range")))
+            start = int(self.headers["Range"][len("bytes="):].rstrip("-")) if self.headers.get("Range") else 0
+            if start:
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{len(DATA) - 1}/{len(DATA)}")
+            else:
+                self.send_response(200)
+            self.send_header("Content-Length", str(len(DATA) - start))
+            self.end_headers()
+            if state["cut"]:
+                # Promise the whole body, send the first CUT_AT bytes and hang up
+                state["cut"] = False
+                self.wfile.write(DATA[:CUT_AT])
+                self.close_connection = True
+                return
+            self.wfile.write(DATA[start:])
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def mirror(root, base):
+    return Mirror(HttpBackend(base, timeout=5), root=root, workers=2, limiter=HostLimiter(per_host=2, interval=0))
+
+
+def sync(mirror_, paintings):
+    return mirror_.sync(paintings, progress=lambda message: None)
+
+
+@pytest.fixture
+def paintings():
+    return [Painting(1, "https://commons.example/wiki/File:One.jpg")]
+
+
+def test_fresh_download_then_noop(serve, tmp_path, paintings):
+    log = []
+    base = serve(make_handler(log))
+    fetched, failures = sync(mirror(tmp_path, base), paintings)
+    assert (fetched, failures) == ([1], {})
+
+    entry = mirror(tmp_path, base).index["1"]
+    assert entry["bytes"] == len(DATA)
+    assert entry["sha256"] == hashlib.sha256(DATA).hexdigest()
+    assert (tmp_path / entry["path"]).read_bytes() == DATA
+
+    # Re-run: current entries never touch the network
+    log.clear()
+    assert sync(mirror(tmp_path, base), paintings) == ([], {})
+    assert log == []
+
+
+def test_cut_off_transfer_resumes_with_range(serve, tmp_path, paintings):
+    log = []
+    base = serve(make_handler(log, cut_first=True))
+    fetched, failures = sync(mirror(tmp_path, base), paintings)
+    assert fetched == [] and 1 in failures
+    parts = list((tmp_path / "partial").glob("*.part"))
+    assert [p.stat().st_size for p in parts] == [CUT_AT]
+    assert not (tmp_path / "objects").exists()
+
+    fetched, failures = sync(mirror(tmp_path, base), paintings)
+    assert (fetched, failures) == ([1], {})
+    assert log[-1] == ("/1", f"bytes={CUT_AT}-")
+    entry = mirror(tmp_path, base).index["1"]
+    assert (tmp_path / entry["path"]).read_bytes() == DATA
+    assert not list((tmp_path / "partial").glob("*.part"))
+
+
+def test_metadata_sidecar(serve, tmp_path, paintings):
+    base = serve(make_handler([]))
+    sync(mirror(tmp_path, base), paintings)
+    entry = mirror(tmp_path, base).index["1"]
+    assert entry["source_url"] == paintings[0].url
+    assert entry["resolved_url"] == f"{base}/1"
+    assert entry["path"] == f"objects/{entry['sha256'][:2]}/{entry['sha256']}.bin"
+    assert {"license", "width", "height", "format", "fetched_at"} <= entry.keys()
@@ -0,0 +1,33 @@
+import base64
+import io
+
+import numpy as np
+from PIL import Image
+
+from image_library import placeholders
+
+
+def noise(size=32):
+    return Image.fromarray(np.random.default_rng(0).integers(0, 256, (size, size, 3), np.uint8))
+
+
+def decoded_size(uri):
+    with Image.open(io.BytesIO(base64.b64decode(uri.split(",", 1)[1]))) as im:
+        return im.size
+
+
+def test_lqip_fits_the_data_uri_budget():
+    uri = placeholders._lqip(noise(), 1024)
+    assert len(uri) <= 1024 and decoded_size(uri) == (32, 32)
+
+
+def test_lqip_halves_the_thumbnail_when_no_quality_fits():
+    uri = placeholders._lqip(noise(), 400)
+    assert len(uri) <= 400 and decoded_size(uri)[0] < 32
+
+
+def test_lqip_over_budget_is_reported():
+    uri = placeholders._lqip(noise(), 40)
+    assert len(uri) > 40 and decoded_size(uri)[0] >= placeholders.LQIP_MIN_SIDE
+    index = {"/images/a.png": {"lqip": uri}, "/images/b.png": {"lqip": "data:,"}}
+    assert placeholders.over_budget(index, 40) == {"/images/a.png": len(uri)}
@@ -0,0 +1,19 @@
+import pytest
+
+from image_library.scripture import format_key, parse_refs
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Isaiah 53", [("Isaiah 53:1", "Isaiah 53:999")]),
+    ("Isa 53:5", [("Isaiah 53:5", "Isaiah 53:5")]),
+    ("II Kings 2:11", [("2 Kings 2:11", "2 Kings 2:11")]),
+    ("2 Kings 2:11", [("2 Kings 2:11", "2 Kings 2:11")]),
+    ("I Cor 13:4-7", [("1 Corinthians 13:4", "1 Corinthians 13:7")]),
+    ("III John 4", [("3 John 1:4", "3 John 1:4")]),
+    ("Jude 3", [("Jude 1:3", "Jude 1:3")]),
+    ("Psalm 23; Isaiah 40:31", [("Psalms 23:1", "Psalms 23:999"), ("Isaiah 40:31", "Isaiah 40:31")]),
+    ("John 3:16, 18", [("John 3:16", "John 3:16"), ("John 3:18", "John 3:18")]),
+    ("I think it was in chapter 3", []),
+])
+def test_parse_refs(text, expected):
+    assert [(format_key(r.start), format_key(r.end)) for r in parse_refs(text)] == expected
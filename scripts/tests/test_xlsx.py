@@ -0,0 +1,50 @@
+import math
+
+import openpyxl
+import pytest
+
+from image_library import benchmark, xlsx
+from image_library.styles import BODY
+
+WRITERS = {"direct": (), "openpyxl": ("--openpyxl",), "streaming": ("--streaming",)}
+
+
+@pytest.fixture
+def catalog_dir(tmp_path):
+    """A 40-illustration synthetic catalog (every image has a painting)."""
+    benchmark.synthetic_catalog(40, tmp_path / "catalog")
+    return tmp_path / "catalog"
+
+
+def contents(wb_path):
+    """Per sheet: every non-blank cell's (value, named style), plus merges, links, widths and panes."""
+    out = {}
+    for ws in openpyxl.load_workbook(wb_path).worksheets:
+        cells = [cell for row in ws.iter_rows() for cell in row]
+        out[ws.title] = {
+            "cells": {c.coordinate: (c.value, c.style) for c in cells if c.value is not None or c.style != "Normal"},
+            "links": {c.coordinate: c.hyperlink.target for c in cells if c.hyperlink},
+            "merged": sorted(str(r) for r in ws.merged_cells.ranges),
+            "widths": {letter: dim.width for letter, dim in ws.column_dimensions.items()},
+            "freeze_panes": ws.freeze_panes,
+            "tab_color": ws.sheet_properties.tabColor and ws.sheet_properties.tabColor.rgb,
+        }
+    return out
+
+
+def test_writers_agree(run_script, tmp_path):
+    loaded = {}
+    for name, flags in WRITERS.items():
+        wb_path = tmp_path / f"{name}.xlsx"
+        run_script("generate-image-library-excel.py", "--output", wb_path, "--workers", 1, *flags)
+        loaded[name] = contents(wb_path)
+    assert loaded["direct"]["Evergreen Illustrations"]["cells"]["C3"][0]
+    assert loaded["direct"] == loaded["openpyxl"]
+    assert loaded["direct"] == loaded["streaming"]
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_numbers_are_rejected(value):
+    writer = xlsx.SheetWriter([10, 10])
+    with pytest.raises(ValueError, match="B1"):
+        writer.append([1, value], [BODY, BODY])
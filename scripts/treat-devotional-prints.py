@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Apply the dithered / halftone print treatment to the devotional artworks.
+
+Each public/images/devotional-prints/<slug>/raw.webp is treated with the
+preset for its artwork.json ``printStyle`` (see image_library.treatments)
+across a process pool. Outputs go to .cache/image-library/treatments/
+<slug>.webp for review, or replace print.webp with --replace-prints.
+
+Results are cached by source hash plus treatment parameters, so a style
+tweak (--set, or an edit to PRESETS) re-treats only the affected artworks.
+
+Ad-hoc files (e.g. the content/image-tests/ experiments) can be treated
+with --source and --style.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from image_library import REPO_ROOT, treatments
+from image_library.cache import cache_path
+
+PRINTS_DIR = REPO_ROOT / "public" / "images" / "devotional-prints"
+REVIEW_DIR = cache_path("treatments")
+
+
+def artwork_jobs(prints_dir, output_dir, replace, overrides, only=None):
+    jobs = []
+    for folder in sorted(p for p in prints_dir.iterdir() if (p / "raw.webp").exists()):
+        if only and only not in folder.name:
+            continue
+        try:
+            with open(folder / "artwork.json", encoding="utf-8") as f:
+                style = json.load(f).get("printStyle", "etching")
+        except (OSError, ValueError):
+            style = "etching"
+        output = folder / "print.webp" if replace else output_dir / f"{folder.name}.webp"
+        jobs.append((folder / "raw.webp", output, treatments.preset(style, **overrides)))
+    return jobs
+
+
+def parse_override(text):
+    """"contrast=1.3" -> ("contrast", 1.3); non-JSON values stay strings."""
+    key, _, value = text.partition("=")
+    try:
+        return key, json.loads(value)
+    except ValueError:
+        return key, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply the print treatment to devotional artworks.")
+    parser.add_argument("--prints-dir", type=Path, default=PRINTS_DIR, help="Folder of artwork folders")
+    parser.add_argument("--output-dir", type=Path, default=REVIEW_DIR, help="Where treated prints are written")
+    parser.add_argument("--replace-prints", action="store_true", help="Overwrite each artwork's print.webp")
+    parser.add_argument("--only", help="Only artworks whose slug contains this text")
+    parser.add_argument("--source", type=Path, action="append", help="Treat this file instead (repeatable)")
+    parser.add_argument("--style", default="etching", choices=sorted(treatments.PRESETS),
+                        help="Preset for --source files")
+    parser.add_argument("--set", dest="overrides", action="append", default=[], metavar="KEY=VALUE",
+                        help="Override a treatment parameter for every preset, e.g. contrast=1.3")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Ignore the cache and re-treat everything")
+    args = parser.parse_args()
+
+    overrides = dict(parse_override(o) for o in args.overrides)
+    if args.source:
+        jobs = [(src, args.output_dir / f"{src.stem}-{args.style}.webp", treatments.preset(args.style, **overrides))
+                for src in args.source]
+    else:
+        jobs = artwork_jobs(args.prints_dir, args.output_dir, args.replace_prints, overrides, args.only)
+
+    treated, skipped = treatments.build(jobs, workers=args.workers, force=args.force)
+    print(f"Treated {treated} image(s); {skipped} unchanged")
+    if treated and not args.replace_prints:
+        print(f"Output: {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Keep the image library workbook current while the catalog and assets are edited.
+
+A resident stand-in for running generate-image-library-excel.py and then
+add-paintings-to-excel.py after every edit. It stays running, so the parsed
+catalog (image_library.catalog re-reads only files whose mtime changed), the
+asset manifest and every rendered sheet stay in memory between rebuilds.
+
+The catalog files, content/series-json and public/images + public/icons are
+polled (see image_library.watch). When a burst of edits settles, only the
+affected sheets are re-rendered:
+- a sheet whose catalog sections changed (a series file counts as the
+  "series" section, read by Page Payload);
+- a sheet whose Status column came out different against the refreshed
+  asset manifest.
+The workbook is then re-zipped with image_library.xlsx. The painting
+columns (K-N) are rendered into the Evergreen Illustrations sheet directly,
+so no openpyxl load or save is involved. add-paintings-to-excel.py's
+sidecars are rewritten after each save, so ``add-paintings-to-excel.py
+--incremental`` sees the workbook as up to date. The one difference from
+the two-step build is that a row without a painting gets empty bordered
+K-N cells instead of none.
+
+A rebuild at today's size takes well under 100 ms, so with the default
+0.2 s poll interval and 0.2 s debounce the workbook is updated within about
+half a second of saving. A catalog file caught mid-write (invalid JSON) is
+reported and retried with the next change.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from image_library import LIBRARY_PATH, catalog, load_script, watch, xlsx
+from image_library.row_index import RowIndex, save_row_index
+from image_library.scripture import SERIES_DIR
+from image_library.sidecar import write_sidecar
+from image_library.styles import LINK
+
+generator = load_script("generate-image-library-excel.py")
+merger = load_script("add-paintings-to-excel.py")
+
+# Catalog sections each sheet's rows read; a sheet's Status column (if any)
+# comes from its first section
+SHEET_SOURCES = {
+    "Evergreen Illustrations": {"illustrations", "paintings"},
+    # Budget Status (I) measures the files against each spec's Max File Size
+    "Image Size Specs": {"size_specs", "assets"},
+    "Empty States & System": {"empty_states"},
+    "UI Icons": {"icons"},
+    "App Icons & PWA": {"pwa_assets"},
+    "Summary": {"summary", "notes"},
+    # Measured file sizes and the series' day modules feed the payload model,
+    # so any asset or series change re-renders it
+    "Page Payload": {"size_specs", "assets", "series"},
+}
+STATUS_SECTIONS = ("illustrations", "empty_states", "icons", "pwa_assets")
+
+
+class Library:
+    """The workbook's rendered sheets and the inputs they were rendered from."""
+
+    def __init__(self, wb_path):
+        self.wb_path = wb_path
+        self.parts = {}
+        self.statuses = {}
+        self.index = None
+        # Sections from a failed rebuild, retried with the next one
+        self.stale = set()
+
+    def illustration_sheet(self, sheet, rendered_index):
+        """``sheet`` with add-paintings' K-N columns, filling ``rendered_index`` as rows are rendered."""
+        paintings = catalog.painting_map()
+        rows, category_rows = {}, []
+
+        def painted_rows():
+            for row, (kind, values) in enumerate(sheet.rows(), 1):
+                if kind == "header":
+                    values = values + merger.new_headers
+                    rendered_index.append(RowIndex(values, rows, category_rows))
+                elif kind == "body":
+                    painting = paintings.get(values[0])
+                    rows[values[0]] = (row, merger.row_hash(painting, values[merger.STATUS_COL - 1]))
+                    values = values + list(merger.painting_values(painting))
+                else:
+                    category_rows.append(row)
+                yield kind, values
+
+        return sheet._replace(col_widths=sheet.col_widths + merger.new_col_widths,
+                              alignments={**sheet.alignments, merger.URL_COL: LINK},
+                              link_col=merger.URL_COL, rows=painted_rows)
+
+    def rebuild(self, sections, assets_changed):
+        """Re-render the sheets affected by changed catalog ``sections`` / assets and save.
+
+        Returns the re-rendered sheet titles (empty when nothing visible changed).
+        """
+        sections = set(sections) | self.stale | ({"assets"} if assets_changed else set())
+        self.stale = sections
+        if assets_changed:
+            generator.asset_manifest.cache_clear()
+            generator.budget_report.cache_clear()
+        generator.asset_statuses.cache_clear()
+        statuses = {section: generator.asset_statuses(section) for section in STATUS_SECTIONS}
+        sections |= {section for section in STATUS_SECTIONS if statuses[section] != self.statuses.get(section)}
+
+        parts, index = {}, []
+        for sheet in generator.SHEETS:
+            if sections & SHEET_SOURCES[sheet.title]:
+                if sheet.title == merger.SHEET:
+                    sheet = self.illustration_sheet(sheet, index)
+                parts[sheet.title] = generator.render(sheet)
+        if not parts:
+            self.stale = set()
+            return []
+        self.parts.update(parts)
+        titles = [sheet.title for sheet in generator.SHEETS]
+        xlsx.save(self.wb_path, titles, [self.parts[title] for title in titles])
+        self.statuses, self.stale = statuses, set()
+        if index:
+            self.index = index[0]
+        save_row_index(self.wb_path, merger.SHEET, merger.TRACKED_COLS, self.index)
+        write_sidecar(self.wb_path, merger.SIDECAR,
+                      merger.desired_hashes(catalog.painting_map(), statuses["illustrations"]))
+        return list(parts)
+
+
+def _stamp():
+    return time.strftime("%H:%M:%S")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate the image library workbook whenever its sources change.")
+    parser.add_argument("--workbook", type=Path, default=LIBRARY_PATH, help="Workbook to keep up to date")
+    parser.add_argument("--interval", type=float, default=0.2, help="Seconds between polls")
+    parser.add_argument("--debounce", type=float, default=0.2, help="Quiet seconds before rebuilding")
+    parser.add_argument("--once", action="store_true", help="Build once and exit")
+    args = parser.parse_args()
+
+    library = Library(args.workbook)
+    started = time.perf_counter()
+    library.rebuild(catalog.SECTIONS, assets_changed=True)
+    print(f"[{_stamp()}] Built {args.workbook} in {time.perf_counter() - started:.2f}s")
+    if args.once:
+        return
+
+    print(f"Watching {catalog.CATALOG_DIR}, {SERIES_DIR} and public/images, public/icons (Ctrl-C to stop)")
+    try:
+        for changes in watch.poll(args.interval, args.debounce):
+            sections = {key for kind, key in changes if kind == "catalog"}
+            if any(kind == "series" for kind, _ in changes):
+                sections.add("series")
+            assets_changed = any(kind == "asset" for kind, _ in changes)
+            started = time.perf_counter()
+            try:
+                titles = library.rebuild(sections, assets_changed)
+            except (ValueError, OSError) as exc:
+                print(f"[{_stamp()}] Not rebuilt, will retry on the next change: {exc}")
+                continue
+            elapsed = time.perf_counter() - started
+            print(f"[{_stamp()}] {'Rebuilt ' + ', '.join(titles) if titles else 'No sheet changed'} "
+                  f"({len(changes)} change(s), {elapsed:.2f}s)")
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()